@@ -10,14 +10,20 @@ bl_info = {
     "category": "Object",
 }
 
+import time
+
+_IMPORT_START = time.perf_counter()
+
 import bpy
 
 from . import prefs
 from . import state
-from . import operators, properties, ui
-from .utils import icons
+from . import operators, properties, ui, utils
+from .utils import icons, startup
 from .utils import license_manager as _license_manager
 
+_IMPORT_MS = (time.perf_counter() - _IMPORT_START) * 1000.0
+
 # -------------------------------------------------------------------------
 # BUILD VARIANT: dev / release / market
 # -------------------------------------------------------------------------
@@ -27,62 +33,75 @@ BUILD = "release"
 classes = []
 
 
+def _enforce_license():
+    """Check the license/trial and enable the UI; runs deferred after startup."""
+    license_ok = _license_manager.enforce_license()
+
+    if license_ok:
+        ui.register()
+        print("✅ Sneaker Panel Pro: License/Trial active – Full UI enabled")
+        return
+
+    print(
+        "⚠ Sneaker Panel Pro: License not verified and trial expired – UI panels disabled"
+    )
+
+    # Show warning popup for unlicensed users
+    def warn_popup(self, context):
+        self.layout.label(
+            text="Sneaker Panel Pro license not verified or trial expired."
+        )
+        self.layout.label(
+            text="Please enter your license key in Preferences → Add-ons → Sneaker Panel Pro."
+        )
+
+    try:
+        bpy.context.window_manager.popup_menu(
+            warn_popup, title="License Required", icon="ERROR"
+        )
+    except Exception as e:
+        print(f"⚠ Could not show license popup: {e}")
+
+
 def register():
     """Register all addon components."""
     try:
+        startup.reset()
+        startup.timings.append(("imports", _IMPORT_MS, False))
+
         # ---------------------------------------------------------------
         # 🧩 Core Registration
         # ---------------------------------------------------------------
-        prefs.register()
-        state.register()
-        properties.register()
-        operators.register()
+        with startup.phase("prefs"):
+            prefs.register()
+        with startup.phase("state"):
+            state.register()
+        with startup.phase("utils"):
+            utils.register()
+        with startup.phase("properties"):
+            properties.register()
+        with startup.phase("operators"):
+            operators.register()
 
         # ---------------------------------------------------------------
         # 🧠 License Enforcement & Trial Handling
         # ---------------------------------------------------------------
         if BUILD == "dev":
             print("🧪 Sneaker Panel Pro: Developer mode – license enforcement skipped.")
-            ui.register()
-        else:
-            license_ok = _license_manager.enforce_license()
-
-            if license_ok:
+            with startup.phase("ui"):
                 ui.register()
-                print("✅ Sneaker Panel Pro: License/Trial active – Full UI enabled")
-            else:
-                print(
-                    "⚠ Sneaker Panel Pro: License not verified and trial expired – UI panels disabled"
-                )
-
-                # Show warning popup for unlicensed users
-                def warn_popup(self, context):
-                    self.layout.label(
-                        text="Sneaker Panel Pro license not verified or trial expired."
-                    )
-                    self.layout.label(
-                        text="Please enter your license key in Preferences → Add-ons → Sneaker Panel Pro."
-                    )
-
-                try:
-                    bpy.context.window_manager.popup_menu(
-                        warn_popup, title="License Required", icon="ERROR"
-                    )
-                except Exception as e:
-                    print(f"⚠ Could not show license popup: {e}")
+        else:
+            # License/trial files are read (and the trial file written) after
+            # startup; the UI registers once the check passes
+            startup.defer("license+ui", _enforce_license)
 
         # ---------------------------------------------------------------
         # 🧩 Custom assets and utilities
         # ---------------------------------------------------------------
-        icons.load_icons()
+        # Icons load after startup, or on the first get_icon() call
+        startup.defer("icons", icons.load_icons)
 
-        # Pre-load lace assets (optional)
-        try:
-            from .operators.spp_lace_loader import load_lace_assets
-
-            load_lace_assets()
-        except Exception as e:
-            print(f"Note: Lace assets will be loaded on first use: {e}")
+        # Lace assets are loaded lazily by ensure_lace_assets() on first use
 
         # ---------------------------------------------------------------
         # 🧩 Register any local classes
@@ -90,7 +109,7 @@ def register():
         for cls in classes:
             bpy.utils.register_class(cls)
 
-        print("✅ Sneaker Panel Pro: Successfully registered addon")
+        startup.report()
 
     except Exception as e:
         print(f"❌ Sneaker Panel Pro: Error during registration: {e}")
@@ -100,6 +119,8 @@ def register():
 def unregister():
     """Unregister all addon components."""
     try:
+        startup.cancel_deferred()
+
         for cls in reversed(classes):
             bpy.utils.unregister_class(cls)
 
@@ -107,6 +128,7 @@ def unregister():
         ui.unregister()
         operators.unregister()
         properties.unregister()
+        utils.unregister()
         state.unregister()
         prefs.unregister()
 
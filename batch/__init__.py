@@ -0,0 +1 @@
+"""Headless batch panel builds; see ``batch/build.py`` and ``batch/driver.py``."""
@@ -0,0 +1,289 @@
+"""
+Rebuild the panel set of one .blend file from a job spec, headless.
+
+Runs inside Blender on the file it opened::
+
+    blender -b style.blend --python-expr "import sys; sys.path.insert(0, '/path/to/addons'); from SneakerPanel_Pro.batch import build; build.main()" -- job.json --report style.json
+
+or as a script, also with the ``bpy`` module::
+
+    blender -b style.blend --python batch/build.py -- job.json
+    python batch/build.py job.json --file style.blend
+
+Every panel in the job is rebuilt from its design curve with Shell UV to
+Panel and the per-panel timings, with the operator's phase breakdown, are
+printed and optionally written as JSON. The file is saved only when every
+panel built; the exit status is 1 otherwise. ``batch/driver.py`` runs many files in parallel.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+
+import bpy
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.dirname(HERE)
+ADDON_NAME = os.path.basename(ADDON_DIR)
+
+try:
+    from . import job as job_spec
+except ImportError:
+    # Run as a script rather than imported from the add-on package
+    sys.path.insert(0, HERE)
+    import job as job_spec
+
+OPERATOR = "object.shell_uv_to_panel"
+
+# Imported from the registered add-on by load_addon()
+profiling = None
+uv_reference = None
+
+# Scene properties the build changes and puts back afterwards
+_RESTORED = ("spp_panel_name",) + tuple(
+    sorted(
+        set(job_spec.FILL_SETTINGS.values()) | set(job_spec.CONFORM_SETTINGS.values())
+    )
+)
+
+
+# -------------------------------------------------------------------------
+# Add-on
+# -------------------------------------------------------------------------
+def load_addon():
+    """Register the add-on from this checkout unless it is already enabled."""
+    global profiling, uv_reference
+
+    cls = bpy.types.Operator.bl_rna_get_subclass_py("OBJECT_OT_shell_uv_to_panel")
+    if cls is None:
+        parent = os.path.dirname(ADDON_DIR)
+        if parent not in sys.path:
+            sys.path.insert(0, parent)
+        importlib.import_module(ADDON_NAME).register()
+        package = ADDON_NAME
+    else:
+        # Enabled from elsewhere (e.g. as an installed extension): use that copy
+        package = cls.__module__.rsplit(".operators.", 1)[0]
+    profiling = importlib.import_module(f"{package}.utils.profiling")
+    uv_reference = importlib.import_module(f"{package}.utils.uv_reference")
+
+
+# -------------------------------------------------------------------------
+# Scene helpers
+# -------------------------------------------------------------------------
+def _activate(obj):
+    view_layer = bpy.context.view_layer
+    if bpy.context.mode != "OBJECT" and view_layer.objects.active is not None:
+        bpy.ops.object.mode_set(mode="OBJECT")
+    for other in view_layer.objects:
+        other.select_set(False)
+    view_layer.objects.active = obj
+    obj.select_set(True)
+
+
+def _remove_panel(name):
+    """Remove the panel object ``name`` left by an earlier build."""
+    obj = bpy.data.objects.get(name)
+    if obj is None or obj.type != "MESH":
+        return False
+    mesh = obj.data
+    bpy.data.objects.remove(obj, do_unlink=True)
+    if mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
+    return True
+
+
+def ensure_uv_mesh(shell, create):
+    """Return the shell's UV reference mesh, running UV to Mesh if allowed."""
+    scene = bpy.context.scene
+    uv_mesh = uv_reference.find_uv_reference_mesh(shell, scene)
+    if uv_mesh is None and create:
+        _activate(shell)
+        bpy.ops.object.uv_to_mesh()
+        uv_mesh = uv_reference.find_uv_reference_mesh(shell, scene)
+    return uv_mesh
+
+
+# -------------------------------------------------------------------------
+# Build
+# -------------------------------------------------------------------------
+def build_panel(panel, replace):
+    """Build one panel; return its report entry."""
+    scene = bpy.context.scene
+    entry = {
+        "panel": panel["name"],
+        "curve": panel["curve"],
+        "number": panel["number"],
+        "object": job_spec.panel_object_name(panel),
+        "status": "ERROR",
+    }
+    curve = bpy.data.objects.get(panel["curve"])
+    if curve is None or curve.type != "CURVE":
+        entry["error"] = f"No curve object '{panel['curve']}'"
+        return entry
+    if curve.name not in bpy.context.view_layer.objects:
+        entry["error"] = f"'{curve.name}' is not in the active view layer"
+        return entry
+
+    if replace:
+        entry["replaced"] = _remove_panel(entry["object"])
+    scene.spp_panel_name = panel["name"]
+    scene.spp_panel_count = panel["number"]
+    for name, value in panel["settings"].items():
+        setattr(scene, name, value)
+
+    runs = profiling.history.get(OPERATOR)
+    previous = runs[-1] if runs else None
+    start = time.perf_counter()
+    try:
+        _activate(curve)
+        result = bpy.ops.object.shell_uv_to_panel()
+        entry["status"] = "/".join(sorted(result))
+    except Exception as e:
+        entry["error"] = f"{type(e).__name__}: {e}".strip()
+    entry["ms"] = round((time.perf_counter() - start) * 1000.0, 3)
+
+    runs = profiling.history.get(OPERATOR)
+    if runs and runs[-1] is not previous:
+        entry["phases_ms"] = {
+            name: round(phase["ms"], 3) for name, phase in runs[-1]["phases"].items()
+        }
+    obj = bpy.data.objects.get(entry["object"])
+    if entry["status"] == "FINISHED" and obj is not None:
+        entry["vertices"] = len(obj.data.vertices)
+        entry["faces"] = len(obj.data.polygons)
+    return entry
+
+
+def run_job(job):
+    """Build every panel of ``job`` in the open file.
+
+    Returns:
+        (panels, timings): per-panel report entries and the stage times in ms
+    """
+    scene = bpy.context.scene
+    timings = {}
+    shell = bpy.data.objects.get(job["shell"])
+    if shell is None or shell.type != "MESH":
+        raise ValueError(f"No mesh object '{job['shell']}'")
+    scene.spp_shell_object = shell
+
+    start = time.perf_counter()
+    uv_mesh = ensure_uv_mesh(shell, job["create_uv_mesh"])
+    timings["uv_mesh"] = round((time.perf_counter() - start) * 1000.0, 3)
+    if uv_mesh is None:
+        raise ValueError(f"'{shell.name}' has no UV reference mesh")
+
+    saved = {name: getattr(scene, name) for name in _RESTORED if hasattr(scene, name)}
+    was_enabled = profiling.is_enabled()
+    profiling.set_enabled(True)
+    start = time.perf_counter()
+    try:
+        panels = [build_panel(panel, job["replace"]) for panel in job["panels"]]
+    finally:
+        profiling.set_enabled(was_enabled)
+        for name, value in saved.items():
+            setattr(scene, name, value)
+    timings["panels"] = round((time.perf_counter() - start) * 1000.0, 3)
+    # Leave the counter past the rebuilt panels for the next one drawn by hand
+    scene.spp_panel_count = max(
+        scene.spp_panel_count, max(p["number"] for p in job["panels"]) + 1
+    )
+    return panels, timings
+
+
+def print_report(report):
+    print(f"{report['file'] or '<unsaved>'}: {report['status']}")
+    for entry in report.get("panels", []):
+        timing = f"{entry['ms']:10.1f} ms" if "ms" in entry else ""
+        print(f"  {entry['object']:<28} {entry['status']:<10} {timing}")
+        phases = entry.get("phases_ms", {})
+        if phases:
+            print("    " + ", ".join(f"{k} {v:.0f}" for k, v in phases.items()))
+        if "error" in entry:
+            print(f"    {entry['error']}")
+    if "error" in report:
+        print(f"  {report['error']}")
+    stages = ", ".join(f"{k} {v:.0f} ms" for k, v in report["timings_ms"].items())
+    print(f"  ({stages})")
+
+
+# -------------------------------------------------------------------------
+# Entry point
+# -------------------------------------------------------------------------
+def _script_args():
+    # Blender passes its own options; ours come after "--"
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1 :]
+    return sys.argv[1:]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("job", help="JSON job spec")
+    parser.add_argument(
+        "--file", default="", help="Open this .blend first (default: the open file)"
+    )
+    parser.add_argument("--save-as", default="", help="Save to this path instead")
+    parser.add_argument("--no-save", action="store_true", help="Do not save the file")
+    parser.add_argument("--report", default="", help="Write the JSON report here")
+    args = parser.parse_args(_script_args() if argv is None else argv)
+
+    total_start = time.perf_counter()
+    report = {
+        "file": "",
+        "job": os.path.abspath(args.job),
+        "blender": bpy.app.version_string,
+        "status": "ERROR",
+        "panels": [],
+        "timings_ms": {},
+    }
+    try:
+        job = job_spec.load(args.job)
+        if args.file:
+            start = time.perf_counter()
+            bpy.ops.wm.open_mainfile(filepath=os.path.abspath(args.file))
+            report["timings_ms"]["open"] = round(
+                (time.perf_counter() - start) * 1000.0, 3
+            )
+        report["file"] = bpy.data.filepath
+        load_addon()
+
+        panels, timings = run_job(job)
+        report["panels"] = panels
+        report["timings_ms"].update(timings)
+        failed = [p for p in panels if p["status"] != "FINISHED"]
+        report["status"] = "FAILED" if failed else "OK"
+
+        # A failed panel may already have lost its previous build: keep the file
+        if not args.no_save and not failed:
+            start = time.perf_counter()
+            if args.save_as:
+                bpy.ops.wm.save_as_mainfile(filepath=os.path.abspath(args.save_as))
+            else:
+                bpy.ops.wm.save_mainfile()
+            report["saved"] = bpy.data.filepath
+            report["timings_ms"]["save"] = round(
+                (time.perf_counter() - start) * 1000.0, 3
+            )
+    except Exception as e:
+        report["status"] = "ERROR"
+        report["error"] = f"{type(e).__name__}: {e}".strip()
+    report["timings_ms"]["total"] = round(
+        (time.perf_counter() - total_start) * 1000.0, 3
+    )
+
+    print_report(report)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if report["status"] != "OK":
+        sys.exit(1)
+    return report
+
+
+if __name__ == "__main__":
+    main()
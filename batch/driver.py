@@ -0,0 +1,224 @@
+"""
+Rebuild panel sets across many .blend files in parallel.
+
+Every file is built by its own background Blender running ``build.py``; up
+to ``--jobs`` of them run at once. Needs only plain ``python``::
+
+    python batch/driver.py job.json styles/*.blend --jobs 4 --out summary.json
+    python batch/driver.py job.json styles/*.blend --output-dir rebuilt/
+
+Files are saved in place unless ``--output-dir`` or ``--no-save`` is given.
+With ``--bpy-module`` the workers use this Python and the ``bpy`` module
+instead of a Blender executable. The exit status is 1 when any file failed.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.dirname(HERE)
+ADDON_NAME = os.path.basename(ADDON_DIR)
+sys.path.insert(0, HERE)
+
+import job as job_spec  # noqa: E402
+
+# Lines of worker output shown when a file fails
+LOG_TAIL = 20
+
+
+def _python_expr():
+    parent = os.path.dirname(ADDON_DIR)
+    return (
+        f"import sys; sys.path.insert(0, {parent!r}); "
+        f"from {ADDON_NAME}.batch import build; build.main()"
+    )
+
+
+def worker_command(args, blend, report_path):
+    """Return the command line building ``blend`` in a fresh process."""
+    build_args = [os.path.abspath(args.job), "--report", report_path]
+    if args.no_save:
+        build_args.append("--no-save")
+    elif args.output_dir:
+        target = os.path.join(args.output_dir, os.path.basename(blend))
+        build_args += ["--save-as", os.path.abspath(target)]
+
+    if args.bpy_module:
+        build_args += ["--file", os.path.abspath(blend)]
+        return [sys.executable, "-c", _python_expr()] + build_args
+    # Factory settings keep an installed copy of the add-on out of the way
+    return [
+        args.blender,
+        "-b",
+        "--factory-startup",
+        os.path.abspath(blend),
+        "--python-exit-code",
+        "1",
+        "--python-expr",
+        _python_expr(),
+        "--",
+    ] + build_args
+
+
+def build_file(args, blend, report_dir, index):
+    """Build one file; return its report (with the worker's exit status)."""
+    report_path = os.path.join(report_dir, f"{index:04d}.json")
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(
+            worker_command(args, blend, report_path),
+            capture_output=True,
+            text=True,
+            timeout=args.timeout or None,
+        )
+        returncode, output = proc.returncode, proc.stdout + proc.stderr
+    except subprocess.TimeoutExpired as e:
+        # The partial output is bytes even in text mode
+        partial = e.stdout or b""
+        if isinstance(partial, bytes):
+            partial = partial.decode(errors="replace")
+        returncode, output = None, f"{partial}\nTimed out after {args.timeout} s"
+    except OSError as e:
+        returncode, output = None, f"Could not start worker: {e}"
+    wall_ms = (time.perf_counter() - start) * 1000.0
+
+    report = {"status": "ERROR", "panels": [], "timings_ms": {}}
+    if os.path.exists(report_path):
+        with open(report_path, encoding="utf-8") as f:
+            report = json.load(f)
+    report["source"] = os.path.abspath(blend)
+    report["returncode"] = returncode
+    report["wall_ms"] = round(wall_ms, 3)
+    if returncode != 0 and report["status"] != "FAILED":
+        # No report, or the worker died after writing it
+        report["status"] = "ERROR"
+        report["log_tail"] = output.strip().splitlines()[-LOG_TAIL:]
+    return report
+
+
+def run(args, files):
+    reports = []
+    with tempfile.TemporaryDirectory(prefix="spp_batch_") as report_dir:
+        with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+            futures = {
+                pool.submit(build_file, args, blend, report_dir, index): blend
+                for index, blend in enumerate(files)
+            }
+            for future in as_completed(futures):
+                report = future.result()
+                built = sum(p["status"] == "FINISHED" for p in report["panels"])
+                print(
+                    f"{report['status']:<7} {os.path.basename(report['source']):<32}"
+                    f" {built}/{len(report['panels'])} panels"
+                    f" {report['wall_ms'] / 1000.0:8.1f} s"
+                )
+                for entry in report["panels"]:
+                    if entry["status"] != "FINISHED":
+                        print(
+                            f"        {entry['object']}: {entry.get('error', entry['status'])}"
+                        )
+                if "error" in report:
+                    print(f"        {report['error']}")
+                for line in report.get("log_tail", []):
+                    print(f"        | {line}")
+                reports.append(report)
+    order = {os.path.abspath(blend): i for i, blend in enumerate(files)}
+    reports.sort(key=lambda r: order[r["source"]])
+    return reports
+
+
+def print_panel_timings(reports):
+    """Print the median time of every panel across the built files."""
+    times = {}
+    for report in reports:
+        for entry in report["panels"]:
+            if entry["status"] == "FINISHED":
+                times.setdefault(entry["object"], []).append(entry["ms"])
+    if not times:
+        return
+    print(f"\n{'panel':<28} {'files':>5} {'median ms':>10} {'max ms':>10}")
+    for name, values in sorted(times.items()):
+        median = statistics.median(values)
+        print(f"{name:<28} {len(values):>5} {median:>10.1f} {max(values):>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("job", help="JSON job spec (see batch/job.py)")
+    parser.add_argument("files", nargs="+", help=".blend files to rebuild")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Files built at once (default: CPU count)",
+    )
+    parser.add_argument(
+        "--blender",
+        default=os.environ.get("BLENDER", "blender"),
+        help="Blender executable (default: $BLENDER or 'blender')",
+    )
+    parser.add_argument(
+        "--bpy-module",
+        action="store_true",
+        help="Run workers with this Python and the bpy module",
+    )
+    parser.add_argument(
+        "--output-dir", default="", help="Save rebuilt files here instead"
+    )
+    parser.add_argument("--no-save", action="store_true", help="Do not save files")
+    parser.add_argument(
+        "--timeout", type=float, default=0, help="Seconds allowed per file (0: none)"
+    )
+    parser.add_argument("--out", default="", help="Write all reports to this JSON file")
+    args = parser.parse_args()
+
+    try:
+        job_spec.load(args.job)
+    except (OSError, ValueError) as e:
+        parser.error(f"{args.job}: {e}")
+    missing = [f for f in args.files if not os.path.isfile(f)]
+    if missing:
+        parser.error(f"Not found: {', '.join(missing)}")
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    args.jobs = max(1, min(args.jobs, len(args.files)))
+
+    start = time.perf_counter()
+    reports = run(args, args.files)
+    wall_s = time.perf_counter() - start
+    print_panel_timings(reports)
+    failed = sum(r["status"] != "OK" for r in reports)
+    print(
+        f"\n{len(reports) - failed}/{len(reports)} files OK in {wall_s:.1f} s"
+        f" ({args.jobs} workers)"
+    )
+
+    if args.out:
+        summary = {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "job": os.path.abspath(args.job),
+                "workers": args.jobs,
+                "wall_s": round(wall_s, 3),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "files": reports,
+        }
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        print(f"Reports written to {args.out}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
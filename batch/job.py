@@ -0,0 +1,128 @@
+"""
+Batch job specs.
+
+A job spec is a JSON file naming the shell, the design curves to rebuild as
+panels and the fill and conform settings to build them with. It is read by
+both the Blender worker (``build.py``) and the driver, so it needs no bpy::
+
+    {
+        "shell": "Last_Shell",
+        "fill": {"add_subdivision": true, "subdivision_levels": 1},
+        "conform": {"after_subdivision": true},
+        "panels": [
+            {"name": "Toecap", "curve": "Toecap_Design"},
+            {"name": "Quarter", "curve": "Quarter_Design", "number": 3,
+             "fill": {"subdivision_levels": 2}}
+        ]
+    }
+
+Panels are numbered in list order unless they set ``number``. A panel's own
+``fill`` / ``conform`` entries override the job-wide ones. With ``replace``
+(the default) a panel left by an earlier build under the same name is
+removed first, so re-running a job rebuilds the set instead of adding to it.
+"""
+
+import json
+
+# Job setting -> Scene property read by Shell UV to Panel
+FILL_SETTINGS = {
+    "add_subdivision": "spp_panel_add_subdivision",
+    "subdivision_levels": "spp_panel_subdivision_levels",
+    "apply_modifiers": "spp_panel_apply_added_modifiers",
+    "shade_smooth": "spp_panel_shade_smooth",
+}
+CONFORM_SETTINGS = {
+    "after_subdivision": "spp_panel_conform_after_subdivision",
+}
+
+_SECTIONS = {"fill": FILL_SETTINGS, "conform": CONFORM_SETTINGS}
+_JOB_KEYS = {"shell", "panels", "replace", "create_uv_mesh"} | set(_SECTIONS)
+_PANEL_KEYS = {"name", "curve", "number"} | set(_SECTIONS)
+
+
+def _settings(section, values, where):
+    if not isinstance(values, dict):
+        raise ValueError(f"{where}: '{section}' must be an object")
+    unknown = set(values) - set(_SECTIONS[section])
+    if unknown:
+        raise ValueError(
+            f"{where}: unknown {section} setting(s) {', '.join(sorted(unknown))}"
+        )
+    return dict(values)
+
+
+def parse(data):
+    """Validate a job spec dict and return it normalized.
+
+    Returns:
+        dict: ``shell``, ``replace``, ``create_uv_mesh`` and ``panels``; every
+        panel has ``name``, ``curve``, ``number`` and its merged ``settings``
+        as {scene property: value}
+
+    Raises:
+        ValueError: The spec is malformed
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Job spec must be a JSON object")
+    unknown = set(data) - _JOB_KEYS
+    if unknown:
+        raise ValueError(f"Unknown job key(s) {', '.join(sorted(unknown))}")
+    shell = data.get("shell")
+    if not isinstance(shell, str) or not shell:
+        raise ValueError("Job spec needs a 'shell' object name")
+    panels = data.get("panels")
+    if not isinstance(panels, list) or not panels:
+        raise ValueError("Job spec needs a non-empty 'panels' list")
+
+    defaults = {s: _settings(s, data.get(s, {}), "job") for s in _SECTIONS}
+    job = {
+        "shell": shell,
+        "replace": bool(data.get("replace", True)),
+        "create_uv_mesh": bool(data.get("create_uv_mesh", True)),
+        "panels": [],
+    }
+    numbers = set()
+    for index, panel in enumerate(panels):
+        where = f"panel {index}"
+        if not isinstance(panel, dict):
+            raise ValueError(f"{where}: must be an object")
+        unknown = set(panel) - _PANEL_KEYS
+        if unknown:
+            raise ValueError(f"{where}: unknown key(s) {', '.join(sorted(unknown))}")
+        curve = panel.get("curve")
+        if not isinstance(curve, str) or not curve:
+            raise ValueError(f"{where}: needs a 'curve' object name")
+        number = panel.get("number", index + 1)
+        if not isinstance(number, int) or number < 1:
+            raise ValueError(f"{where}: 'number' must be a positive integer")
+        if number in numbers:
+            raise ValueError(f"{where}: panel number {number} is used twice")
+        numbers.add(number)
+
+        settings = {}
+        for section, names in _SECTIONS.items():
+            values = {**defaults[section]}
+            values.update(_settings(section, panel.get(section, {}), where))
+            settings.update({names[key]: value for key, value in values.items()})
+        job["panels"].append(
+            {
+                "name": str(panel.get("name", "")).strip(),
+                "curve": curve,
+                "number": number,
+                "settings": settings,
+            }
+        )
+    return job
+
+
+def load(path):
+    """Read and validate the job spec at ``path``."""
+    with open(path, encoding="utf-8") as f:
+        return parse(json.load(f))
+
+
+def panel_object_name(panel):
+    """Name Shell UV to Panel gives the panel built for ``panel``."""
+    if panel["name"]:
+        return f"{panel['name']}_Panel_{panel['number']}"
+    return f"Panel_{panel['number']}"
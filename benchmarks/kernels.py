@@ -0,0 +1,113 @@
+"""
+Benchmarks for the ``core`` geometry kernels, without Blender.
+
+Runs with plain ``python``; only NumPy is needed::
+
+    python benchmarks/kernels.py --sizes 50k,500k --repeat 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from core import boundary, collapse, relax, resample, uv_map  # noqa: E402
+
+
+def grid(faces):
+    """Return a wavy quad grid over the unit UV square with ~``faces`` quads.
+
+    Returns:
+        dict: co (V, 3), uv (V, 2), loops (loop_verts, loop_start, loop_total),
+        edges (E, 2) and the triangles (tri_uv, tri_co)
+    """
+    n = max(2, int(round(np.sqrt(faces))))
+    u = np.linspace(0.0, 1.0, n + 1)
+    uu, vv = np.meshgrid(u, u)
+    uv = np.stack((uu, vv), axis=-1).reshape(-1, 2)
+    co = np.stack((uv[:, 0], uv[:, 1], 0.05 * np.sin(6.0 * uv[:, 0])), axis=-1)
+
+    j, i = np.meshgrid(np.arange(n), np.arange(n), indexing="ij")
+    r = n + 1
+    quads = np.stack(
+        (j * r + i, j * r + i + 1, (j + 1) * r + i + 1, (j + 1) * r + i), axis=-1
+    ).reshape(-1, 4)
+    loop_verts = quads.ravel()
+    loop_total = np.full(len(quads), 4)
+    loop_start = np.arange(0, len(loop_verts), 4)
+    edges = np.unique(
+        np.sort(
+            np.stack((quads, np.roll(quads, -1, axis=1)), axis=-1), axis=-1
+        ).reshape(-1, 2),
+        axis=0,
+    )
+    tris = np.concatenate((quads[:, [0, 1, 2]], quads[:, [0, 2, 3]]))
+    return {
+        "co": co,
+        "uv": uv,
+        "loops": (loop_verts, loop_start, loop_total),
+        "edges": edges,
+        "tri_uv": uv[tris],
+        "tri_co": co[tris],
+    }
+
+
+def _timed(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(times)
+
+
+def run(faces, repeat, points):
+    mesh = grid(faces)
+    rng = np.random.default_rng(0)
+    queries = rng.uniform(-0.05, 1.05, (points, 2))
+    loop_uv = mesh["uv"][mesh["loops"][0]]
+    segments = boundary.uv_segments(*mesh["loops"], loop_uv)
+    noisy = mesh["co"] + rng.normal(scale=1e-3, size=mesh["co"].shape)
+    outline = np.stack(
+        (np.cos(np.linspace(0, 6.283, points)), np.sin(np.linspace(0, 6.283, points)))
+        + (np.zeros(points),),
+        axis=-1,
+    )
+
+    cases = {
+        "uv grid build": lambda: uv_map.TriangleGrid(mesh["tri_uv"]),
+        "uv to surface": lambda: uv_map.uv_to_surface(
+            queries, mesh["tri_co"], uv_map.TriangleGrid(mesh["tri_uv"])
+        ),
+        "boundary outside": lambda: boundary.outside(queries, segments),
+        "laplacian x10": lambda: relax.laplacian(noisy, mesh["edges"], 0.5, 10),
+        "resample": lambda: resample.resample_polyline(outline, points // 2),
+        "vertex quadrics": lambda: collapse.vertex_quadrics(
+            mesh["co"], *mesh["loops"], mesh["edges"]
+        ),
+    }
+    print(f"Grid {len(mesh['loops'][1])} faces, {points} query points")
+    for name, func in cases.items():
+        print(f"  {name:<20} {_timed(func, repeat):10.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="50k,500k", help="Grid face counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per kernel")
+    parser.add_argument("--points", type=int, default=10000, help="Query points")
+    args = parser.parse_args()
+    for size in args.sizes.split(","):
+        size = size.strip().lower()
+        faces = int(float(size[:-1]) * 1000) if size.endswith("k") else int(size)
+        run(faces, max(1, args.repeat), args.points)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""
+Headless operator benchmarks for Sneaker Panel Pro.
+
+Builds synthetic last shells at several resolutions, times the key
+operators on them and writes the results as JSON. Runs without a UI, either
+inside Blender or with the ``bpy`` module::
+
+    blender -b --factory-startup --python benchmarks/run.py -- --out bench.json
+    python benchmarks/run.py --sizes 5k,50k --repeat 5 --out bench.json
+
+Compare two result files with::
+
+    python benchmarks/run.py --compare before.json after.json
+
+Operators that need a 3D View or otherwise fail headless are recorded with
+their error instead of stopping the run.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.dirname(HERE)
+ADDON_NAME = os.path.basename(ADDON_DIR)
+
+DEFAULT_SIZES = "5k,50k,200k,500k"
+
+# Imported by load_addon(), so --compare works without bpy
+bpy = None
+synthetic = None
+uv_reference = None
+
+
+# -------------------------------------------------------------------------
+# Cases
+# -------------------------------------------------------------------------
+class Case:
+    """One timed operator call.
+
+    ``setup(env)`` prepares the scene and returns the object to make active
+    (it is also the only selected object); ``kwargs`` go to the operator.
+    """
+
+    def __init__(self, name, operator, setup, needs_uv_mesh=True, **kwargs):
+        self.name = name
+        self.operator = operator
+        self.setup = setup
+        self.needs_uv_mesh = needs_uv_mesh
+        self.kwargs = kwargs
+
+
+def _setup_uv_to_mesh(env):
+    return env["shell"]
+
+
+def _setup_outline(env):
+    return synthetic.make_panel_outline(env["uv_mesh"], points=env["outline_points"])
+
+
+def _setup_flat_panel(env):
+    return synthetic.make_flat_panel(env["uv_mesh"], env["panel_resolution"])
+
+
+def _setup_shell_patch(env):
+    return synthetic.make_shell_patch(env["panel_resolution"])
+
+
+CASES = [
+    Case("uv_to_mesh", "object.uv_to_mesh", _setup_uv_to_mesh, needs_uv_mesh=False),
+    Case("shell_uv_to_panel", "object.shell_uv_to_panel", _setup_outline),
+    Case("overlay_panel", "mesh.overlay_panel_onto_shell", _setup_flat_panel),
+    Case("check_uv_boundary", "mesh.check_uv_boundary", _setup_flat_panel),
+    Case("auto_pave_align", "spp.auto_pave_grid_align", _setup_shell_patch),
+    Case("sample_to_polyline", "curve.sample_to_polyline", _setup_outline),
+    Case("reduce_verts", "object.reduce_verts", _setup_shell_patch),
+]
+
+
+# -------------------------------------------------------------------------
+# Scene helpers
+# -------------------------------------------------------------------------
+def _remove_objects(keep):
+    doomed = [obj for obj in bpy.data.objects if obj.name not in keep]
+    for obj in doomed:
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for collection in (bpy.data.meshes, bpy.data.curves, bpy.data.grease_pencils):
+        orphans = [block for block in collection if block.users == 0]
+        if orphans:
+            bpy.data.batch_remove(orphans)
+    for collection in list(bpy.data.collections):
+        if not collection.all_objects and collection.users <= 1:
+            bpy.data.collections.remove(collection)
+
+
+def _activate(obj):
+    view_layer = bpy.context.view_layer
+    if bpy.context.mode != "OBJECT" and view_layer.objects.active is not None:
+        bpy.ops.object.mode_set(mode="OBJECT")
+    for other in view_layer.objects:
+        other.select_set(False)
+    view_layer.objects.active = obj
+    obj.select_set(True)
+
+
+def _call(operator, kwargs):
+    category, name = operator.split(".")
+    return getattr(getattr(bpy.ops, category), name)(**kwargs)
+
+
+def _mesh_stats(obj):
+    mesh = obj.data
+    return {"vertices": len(mesh.vertices), "faces": len(mesh.polygons)}
+
+
+# -------------------------------------------------------------------------
+# Runner
+# -------------------------------------------------------------------------
+def run_case(case, env, repeat):
+    """Time ``case`` ``repeat`` times, each on freshly set up input."""
+    times = []
+    status = None
+    error = None
+    keep = set(env["keep"])
+    for _ in range(repeat):
+        _remove_objects(keep)
+        bpy.context.scene.spp_panel_count = 1
+        try:
+            target = case.setup(env)
+            _activate(target)
+            start = time.perf_counter()
+            result = _call(case.operator, case.kwargs)
+            elapsed = (time.perf_counter() - start) * 1000.0
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}".strip()
+            status = "ERROR"
+            break
+        status = "/".join(sorted(result))
+        times.append(elapsed)
+        if "FINISHED" not in result:
+            break
+    _remove_objects(keep)
+
+    entry = {
+        "case": case.name,
+        "operator": case.operator,
+        "shell_faces": env["shell_faces"],
+        "status": status,
+        "times_ms": [round(t, 3) for t in times],
+    }
+    if times:
+        entry["median_ms"] = round(statistics.median(times), 3)
+        entry["min_ms"] = round(min(times), 3)
+    if error:
+        entry["error"] = error
+    return entry
+
+
+def prepare_shell(faces, panel_resolution, outline_points):
+    """Build a shell (and its UV reference mesh) and return the case environment."""
+    _remove_objects(set())
+    shell = synthetic.make_last_shell(faces)
+    scene = bpy.context.scene
+    scene.spp_shell_object = shell
+    env = {
+        "shell": shell,
+        "shell_faces": len(shell.data.polygons),
+        "panel_resolution": panel_resolution,
+        "outline_points": outline_points,
+        "keep": {shell.name},
+        "uv_mesh": None,
+    }
+
+    _activate(shell)
+    try:
+        result = bpy.ops.object.uv_to_mesh()
+    except Exception as e:
+        print(f"  UV reference mesh failed: {e}")
+        return env
+    if "FINISHED" in result:
+        uv_mesh = uv_reference.find_uv_reference_mesh(shell, scene)
+        if uv_mesh is not None:
+            env["uv_mesh"] = uv_mesh
+            env["keep"] = {shell.name, uv_mesh.name}
+    return env
+
+
+def run(sizes, repeat, case_names, panel_resolution, outline_points):
+    results = []
+    for faces in sizes:
+        build_start = time.perf_counter()
+        env = prepare_shell(faces, panel_resolution, outline_points)
+        build_ms = (time.perf_counter() - build_start) * 1000.0
+        print(f"Shell {env['shell_faces']} faces (setup {build_ms:.0f} ms)")
+        for case in CASES:
+            if case_names and case.name not in case_names:
+                continue
+            if case.needs_uv_mesh and env["uv_mesh"] is None:
+                entry = {
+                    "case": case.name,
+                    "operator": case.operator,
+                    "shell_faces": env["shell_faces"],
+                    "status": "SKIPPED",
+                    "times_ms": [],
+                    "error": "No UV reference mesh",
+                }
+            else:
+                entry = run_case(case, env, repeat)
+            entry["shell"] = _mesh_stats(env["shell"])
+            results.append(entry)
+            timing = f"{entry['median_ms']:10.1f} ms" if "median_ms" in entry else ""
+            print(f"  {case.name:<20} {entry['status']:<10} {timing}")
+    return results
+
+
+def metadata(args):
+    commit = None
+    try:
+        commit = (
+            subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=ADDON_DIR,
+                capture_output=True,
+                text=True,
+                timeout=5,
+            ).stdout.strip()
+            or None
+        )
+    except Exception:
+        pass
+    addon = sys.modules.get(ADDON_NAME)
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "blender": bpy.app.version_string,
+        "addon_version": (
+            ".".join(map(str, addon.bl_info["version"])) if addon else None
+        ),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "background": bpy.app.background,
+        "repeat": args.repeat,
+        "panel_resolution": args.panel_resolution,
+        "outline_points": args.outline_points,
+    }
+
+
+# -------------------------------------------------------------------------
+# Compare
+# -------------------------------------------------------------------------
+def compare(before_path, after_path):
+    """Print the median time ratio of every case present in both files."""
+    with open(before_path, encoding="utf-8") as f:
+        before = json.load(f)
+    with open(after_path, encoding="utf-8") as f:
+        after = json.load(f)
+
+    def index(data):
+        return {
+            (r["case"], r["shell_faces"]): r
+            for r in data["results"]
+            if "median_ms" in r
+        }
+
+    for key in ("panel_resolution", "outline_points"):
+        if before["meta"].get(key) != after["meta"].get(key):
+            print(f"Warning: runs differ in {key}; panel cases are not comparable")
+    old, new = index(before), index(after)
+    print(f"{'case':<20} {'faces':>8} {'before ms':>11} {'after ms':>11} {'ratio':>7}")
+    for key in sorted(old.keys() & new.keys(), key=lambda k: (k[1], k[0])):
+        a, b = old[key]["median_ms"], new[key]["median_ms"]
+        ratio = b / a if a else float("inf")
+        print(f"{key[0]:<20} {key[1]:>8} {a:>11.1f} {b:>11.1f} {ratio:>6.2f}x")
+    for key in sorted(old.keys() ^ new.keys()):
+        print(f"{key[0]:<20} {key[1]:>8} only in {'before' if key in old else 'after'}")
+
+
+# -------------------------------------------------------------------------
+# Entry point
+# -------------------------------------------------------------------------
+def _parse_size(text):
+    text = text.strip().lower()
+    if text.endswith("k"):
+        return int(float(text[:-1]) * 1000)
+    if text.endswith("m"):
+        return int(float(text[:-1]) * 1000000)
+    return int(text)
+
+
+def _script_args():
+    # Blender passes its own options; ours come after "--"
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1 :]
+    return sys.argv[1:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"Comma-separated shell face counts (default: {DEFAULT_SIZES})",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case")
+    parser.add_argument(
+        "--cases",
+        default="",
+        help="Comma-separated case names (default: all): "
+        + ", ".join(c.name for c in CASES),
+    )
+    parser.add_argument(
+        "--panel-resolution",
+        type=int,
+        default=60,
+        help="Grid resolution of the dense test panels",
+    )
+    parser.add_argument(
+        "--outline-points", type=int, default=64, help="Points on the panel outline"
+    )
+    parser.add_argument("--out", default="", help="Write JSON results to this file")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BEFORE", "AFTER"),
+        help="Compare two result files instead of running",
+    )
+    args = parser.parse_args(_script_args())
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    load_addon()
+    sizes = [_parse_size(s) for s in args.sizes.split(",") if s.strip()]
+    case_names = {c.strip() for c in args.cases.split(",") if c.strip()}
+    unknown = case_names - {c.name for c in CASES}
+    if unknown:
+        parser.error(f"Unknown case(s): {', '.join(sorted(unknown))}")
+
+    results = run(
+        sizes,
+        max(1, args.repeat),
+        case_names,
+        args.panel_resolution,
+        args.outline_points,
+    )
+    report = {"meta": metadata(args), "results": results}
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.out}")
+
+
+def load_addon():
+    """Import and register the add-on from this checkout, without its UI."""
+    global bpy, synthetic, uv_reference
+
+    import bpy as _bpy
+
+    bpy = _bpy
+    sys.path.insert(0, os.path.dirname(ADDON_DIR))
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    synthetic = importlib.import_module("synthetic")
+
+    addon = importlib.import_module(ADDON_NAME)
+    if not hasattr(bpy.types.Scene, "spp_shell_object"):
+        addon.register()
+    # Skip the deferred license check and icons. The UI modules also register
+    # scene properties some operators read, so register them directly.
+    importlib.import_module(f"{ADDON_NAME}.utils.startup").cancel_deferred()
+    if not hasattr(bpy.types.Scene, "spp_uv_boundary_action"):
+        importlib.import_module(f"{ADDON_NAME}.ui").register()
+    uv_reference = importlib.import_module(f"{ADDON_NAME}.utils.uv_reference")
+    return addon
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Synthetic shoe-last geometry for the benchmarks.
+
+The shell is a parametric last: a tube running heel to toe with a flat
+bottom, a tapering toe and a wider lateral side, so it is not mirror
+symmetric. It has one UV island (``u`` around, ``v`` heel to toe) with the
+seam along the bottom centre line. Everything is built with ``foreach_set``
+so a 500k-face shell is created in seconds.
+"""
+
+import math
+
+import bpy
+import numpy as np
+
+LAST_LENGTH = 0.28
+
+
+def last_surface(theta, t):
+    """Return world positions on the last for angles ``theta`` and lengths ``t``.
+
+    Args:
+        theta: Angle around the last, 0 at the bottom centre line
+        t: 0 at the heel, 1 at the toe
+
+    Both arguments broadcast against each other.
+    """
+    theta, t = np.broadcast_arrays(np.asarray(theta, float), np.asarray(t, float))
+    width = 0.03 + 0.025 * np.sin(math.pi * (0.1 + 0.85 * t))
+    height = 0.085 - 0.05 * t
+    # Lateral side (x > 0) bulges more than the medial side
+    side = -np.sin(theta)
+    width = width * (1.0 + 0.08 * np.sign(side) * np.sin(math.pi * t))
+
+    x = width * side
+    z = height * (1.0 - np.cos(theta)) * 0.5
+    # Flatten the bottom
+    z = np.where(np.cos(theta) > 0.6, z * 0.3, z)
+    y = LAST_LENGTH * t
+    return np.stack((x, y, z), axis=-1)
+
+
+def _grid_size(faces):
+    rings = max(4, int(round(math.sqrt(faces / 2.0)))) + 1
+    around = max(8, int(round(faces / (rings - 1))))
+    return around, rings
+
+
+def make_last_shell(faces, name="BenchShell"):
+    """Create a last-like shell with roughly ``faces`` quads, seams and UVs."""
+    around, rings = _grid_size(faces)
+    theta = np.linspace(0.0, 2.0 * math.pi, around, endpoint=False)
+    t = np.linspace(0.02, 0.98, rings)
+    co = last_surface(theta[None, :], t[:, None]).reshape(-1, 3)
+
+    # Quads (ring j, column i) -> (j, i+1) -> (j+1, i+1) -> (j+1, i), wrapping
+    j, i = np.meshgrid(np.arange(rings - 1), np.arange(around), indexing="ij")
+    i_next = (i + 1) % around
+    quads = np.stack(
+        (
+            j * around + i,
+            j * around + i_next,
+            (j + 1) * around + i_next,
+            (j + 1) * around + i,
+        ),
+        axis=-1,
+    ).reshape(-1, 4)
+    face_count = len(quads)
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.astype(np.float32).ravel())
+    mesh.loops.add(face_count * 4)
+    mesh.loops.foreach_set("vertex_index", quads.astype(np.int32).ravel())
+    mesh.polygons.add(face_count)
+    mesh.polygons.foreach_set(
+        "loop_start", np.arange(0, face_count * 4, 4, dtype=np.int32)
+    )
+
+    # Per-loop UVs; the wrapping column gets u = 1 instead of 0
+    u = np.stack((i, i + 1, i + 1, i), axis=-1).reshape(-1) / around
+    v = np.stack((j, j, j + 1, j + 1), axis=-1).reshape(-1) / (rings - 1)
+    uv_layer = mesh.uv_layers.new(name="UVMap")
+    uv_layer.data.foreach_set(
+        "uv", np.stack((u, v), axis=-1).astype(np.float32).ravel()
+    )
+    mesh.update(calc_edges=True)
+    mesh.validate()
+
+    # Seam along the bottom centre line (column 0)
+    edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
+    column = edge_verts.reshape(-1, 2) % around
+    mesh.edges.foreach_set("use_seam", np.all(column == 0, axis=1))
+
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def make_shell_patch(resolution, name="BenchPatch", jitter=0.0015, seed=0):
+    """Create a dense quad patch lying on the last's lateral side.
+
+    The vertices get a small random offset so relax and snap have work to do.
+    """
+    theta = np.linspace(0.9 * math.pi, 1.6 * math.pi, resolution)
+    t = np.linspace(0.35, 0.75, resolution)
+    co = last_surface(theta[None, :], t[:, None]).reshape(-1, 3)
+    rng = np.random.default_rng(seed)
+    co += rng.normal(scale=jitter, size=co.shape)
+
+    r = resolution
+    j, i = np.meshgrid(np.arange(r - 1), np.arange(r - 1), indexing="ij")
+    quads = np.stack(
+        (j * r + i, j * r + i + 1, (j + 1) * r + i + 1, (j + 1) * r + i), axis=-1
+    ).reshape(-1, 4)
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(co.tolist(), [], quads.tolist())
+    mesh.update()
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def _uv_to_world(uv_mesh, uv):
+    scale = float(uv_mesh.get("spp_applied_scale_factor", 1.0))
+    local = np.zeros((len(uv), 3))
+    local[:, :2] = np.asarray(uv) * scale
+    mw = np.array(uv_mesh.matrix_world)
+    return local @ mw[:3, :3].T + mw[:3, 3]
+
+
+def make_panel_outline(uv_mesh, points=64, name="BenchOutline"):
+    """Create a closed Bezier outline drawn over the UV reference mesh."""
+    angle = np.linspace(0.0, 2.0 * math.pi, points, endpoint=False)
+    uv = np.stack((0.5 + 0.18 * np.cos(angle), 0.55 + 0.12 * np.sin(angle)), axis=-1)
+    co = _uv_to_world(uv_mesh, uv)
+
+    curve = bpy.data.curves.new(name, type="CURVE")
+    curve.dimensions = "3D"
+    spline = curve.splines.new("BEZIER")
+    spline.bezier_points.add(points - 1)
+    spline.bezier_points.foreach_set("co", co.astype(np.float32).ravel())
+    for bp in spline.bezier_points:
+        bp.handle_left_type = bp.handle_right_type = "AUTO"
+    spline.use_cyclic_u = True
+    obj = bpy.data.objects.new(name, curve)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def make_flat_panel(uv_mesh, resolution, name="BenchFlatPanel"):
+    """Create a dense 2D panel grid over the UV reference mesh.
+
+    A few columns stick out past ``u = 1`` so boundary checks find work.
+    """
+    u = np.linspace(0.55, 1.02, resolution)
+    v = np.linspace(0.3, 0.8, resolution)
+    uv = np.stack(np.meshgrid(u, v), axis=-1).reshape(-1, 2)
+    co = _uv_to_world(uv_mesh, uv)
+
+    r = resolution
+    j, i = np.meshgrid(np.arange(r - 1), np.arange(r - 1), indexing="ij")
+    quads = np.stack(
+        (j * r + i, j * r + i + 1, (j + 1) * r + i + 1, (j + 1) * r + i), axis=-1
+    ).reshape(-1, 4)
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(co.tolist(), [], quads.tolist())
+    mesh.update()
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def make_outline_loop(points=48, name="BenchLoop"):
+    """Create a closed edge loop (no faces) on the last's lateral side."""
+    angle = np.linspace(0.0, 2.0 * math.pi, points, endpoint=False)
+    theta = 1.25 * math.pi + 0.25 * math.pi * np.cos(angle)
+    t = 0.55 + 0.15 * np.sin(angle)
+    co = last_surface(theta, t)
+    edges = np.stack((np.arange(points), (np.arange(points) + 1) % points), axis=-1)
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(co.tolist(), edges.tolist(), [])
+    mesh.update()
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
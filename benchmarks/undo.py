@@ -0,0 +1,310 @@
+"""
+Undo cost of the add-on's operators.
+
+Runs each operator the way a button click does (with an undo push) in a
+file padded with a large ballast mesh, and records how many undo steps the
+click left, the undo memory they hold and the wall time including Blender's
+own undo push::
+
+    blender -b --factory-startup --python benchmarks/undo.py -- --out undo.json
+    python benchmarks/undo.py --ballast 2m --out undo.json
+
+Compare two result files with::
+
+    python benchmarks/undo.py --compare before.json after.json
+"""
+
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+import run  # noqa: E402
+
+# Imported by load_addon(), so --compare works without bpy
+bpy = None
+synthetic = None
+
+
+# -------------------------------------------------------------------------
+# Cases
+# -------------------------------------------------------------------------
+class Case(run.Case):
+    """One timed operator click; ``mode`` is the mode the target is put in."""
+
+    def __init__(self, name, operator, setup, mode="OBJECT", **kwargs):
+        super().__init__(name, operator, setup, **kwargs)
+        self.mode = mode
+
+
+def _setup_loop(env):
+    return synthetic.make_outline_loop(env["outline_points"])
+
+
+def _setup_markers(env):
+    # On the top centre line, at the toe and behind it
+    toe, up = synthetic.last_surface(math.pi, (0.95, 0.6))
+    for name, location in (("Toe_Marker", toe), ("Toe_Direction_Marker", up)):
+        marker = bpy.data.objects.new(name, None)
+        bpy.context.scene.collection.objects.link(marker)
+        marker.location = location
+    bpy.context.scene.cursor.location = toe
+    return env["shell"]
+
+
+CASES = [
+    Case("shell_uv_to_panel", "object.shell_uv_to_panel", run._setup_outline),
+    Case("check_uv_boundary", "mesh.check_uv_boundary", run._setup_flat_panel),
+    Case("solidify_panel", "object.solidify_panel", run._setup_flat_panel),
+    Case("smooth_vertices", "object.smooth_vertices", run._setup_flat_panel),
+    Case(
+        "unwrap_shell",
+        "object.unwrap_shell",
+        run._setup_shell_patch,
+        needs_uv_mesh=False,
+    ),
+    Case(
+        "orient_uv_island",
+        "object.orient_uv_island",
+        _setup_markers,
+        needs_uv_mesh=False,
+    ),
+    Case("define_toe", "object.define_toe", _setup_markers, needs_uv_mesh=False),
+    Case(
+        "fill_quad_border",
+        "mesh.fill_quad_border",
+        _setup_loop,
+        mode="EDIT",
+        needs_uv_mesh=False,
+    ),
+    Case(
+        "fill_border_grid",
+        "mesh.fill_border_grid",
+        _setup_loop,
+        mode="EDIT",
+        needs_uv_mesh=False,
+    ),
+    Case(
+        "quad_panel_from_outline",
+        "mesh.create_quad_panel_from_outline",
+        _setup_loop,
+        needs_uv_mesh=False,
+    ),
+]
+
+
+# -------------------------------------------------------------------------
+# Runner
+# -------------------------------------------------------------------------
+def _undo_to_start():
+    """Undo back to the first step of the stack; return the steps undone."""
+    steps = 0
+    while bpy.ops.ed.undo.poll():
+        bpy.ops.ed.undo()
+        steps += 1
+    return steps
+
+
+def _refresh(env):
+    # Undo reloads the file data, so look the kept objects up again
+    env["shell"] = bpy.data.objects[env["shell_name"]]
+    if env["uv_mesh_name"]:
+        env["uv_mesh"] = bpy.data.objects[env["uv_mesh_name"]]
+
+
+def click(case, env):
+    """Set ``case`` up, click it once and undo back to the start.
+
+    Returns:
+        (status, ms, steps, undo_kb)
+    """
+    scene = bpy.context.scene
+    scene.spp_panel_count = 1
+    run._activate(case.setup(env))
+    if case.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode=case.mode)
+        if case.mode == "EDIT":
+            bpy.ops.mesh.select_all(action="SELECT")
+    bpy.ops.ed.undo_push(message="Benchmark setup")
+    undo_before = bpy.app.memory_usage_undo()
+
+    category, name = case.operator.split(".")
+    operator = getattr(getattr(bpy.ops, category), name)
+    start = time.perf_counter()
+    # undo=True: push the operator's undo step like the UI does
+    result = operator("EXEC_DEFAULT", True, **case.kwargs)
+    elapsed = (time.perf_counter() - start) * 1000.0
+    undo_kb = (bpy.app.memory_usage_undo() - undo_before) / 1024.0
+
+    # One step is the setup push
+    steps = _undo_to_start() - 1
+    _refresh(env)
+    return "/".join(sorted(result)), elapsed, steps, undo_kb
+
+
+def run_case(case, env, repeat):
+    entry = {"case": case.name, "operator": case.operator, "times_ms": []}
+    for _ in range(repeat):
+        try:
+            status, elapsed, steps, undo_kb = click(case, env)
+        except Exception as e:
+            entry["status"] = "ERROR"
+            entry["error"] = f"{type(e).__name__}: {e}".strip()
+            if bpy.ops.ed.undo.poll():
+                _undo_to_start()
+                _refresh(env)
+            break
+        entry["status"] = status
+        entry["times_ms"].append(round(elapsed, 3))
+        entry["undo_steps"] = steps
+        entry["undo_kb"] = round(undo_kb, 1)
+    if entry["times_ms"]:
+        entry["median_ms"] = round(statistics.median(entry["times_ms"]), 3)
+    return entry
+
+
+def prepare(faces, ballast, panel_resolution, outline_points):
+    """Build the shell, its UV mesh and the ballast, then start the undo stack."""
+    run._remove_objects(set())
+    env = run.prepare_shell(faces, panel_resolution, outline_points)
+    if ballast:
+        synthetic.make_last_shell(ballast, name="BenchBallast")
+    env["shell_name"] = env["shell"].name
+    env["uv_mesh_name"] = env["uv_mesh"].name if env["uv_mesh"] else ""
+    # Enough steps that a click never pushes the start off the stack
+    bpy.context.preferences.edit.undo_steps = 256
+    run._activate(env["shell"])
+    bpy.ops.ed.undo_push(message="Benchmark start")
+    _undo_to_start()
+    _refresh(env)
+    return env
+
+
+def benchmark(args, case_names):
+    env = prepare(
+        run._parse_size(args.faces),
+        run._parse_size(args.ballast) if args.ballast else 0,
+        args.panel_resolution,
+        args.outline_points,
+    )
+    print(
+        f"Shell {env['shell_faces']} faces, ballast {args.ballast or 0} faces,"
+        f" undo memory at start {bpy.app.memory_usage_undo() / 2**20:.1f} MB"
+    )
+    results = []
+    for case in CASES:
+        if case_names and case.name not in case_names:
+            continue
+        if case.needs_uv_mesh and env["uv_mesh"] is None:
+            entry = {"case": case.name, "status": "SKIPPED", "times_ms": []}
+        else:
+            entry = run_case(case, env, args.repeat)
+        results.append(entry)
+        if "median_ms" in entry:
+            print(
+                f"  {case.name:<24} {entry['status']:<10}"
+                f" {entry['median_ms']:9.1f} ms {entry['undo_steps']:3d} steps"
+                f" {entry['undo_kb'] / 1024.0:9.2f} MB"
+            )
+        else:
+            print(f"  {case.name:<24} {entry['status']:<10} {entry.get('error', '')}")
+    return results
+
+
+# -------------------------------------------------------------------------
+# Compare
+# -------------------------------------------------------------------------
+def compare(before_path, after_path):
+    """Print the time, undo steps and undo memory of every case in both files."""
+    with open(before_path, encoding="utf-8") as f:
+        before = {r["case"]: r for r in json.load(f)["results"] if "median_ms" in r}
+    with open(after_path, encoding="utf-8") as f:
+        after = {r["case"]: r for r in json.load(f)["results"] if "median_ms" in r}
+
+    print(
+        f"{'case':<24} {'ms before':>10} {'after':>10}"
+        f" {'steps':>6} {'after':>6} {'undo MB':>9} {'after':>9}"
+    )
+    for name in [n for n in before if n in after]:
+        a, b = before[name], after[name]
+        print(
+            f"{name:<24} {a['median_ms']:>10.1f} {b['median_ms']:>10.1f}"
+            f" {a['undo_steps']:>6} {b['undo_steps']:>6}"
+            f" {a['undo_kb'] / 1024.0:>9.2f} {b['undo_kb'] / 1024.0:>9.2f}"
+        )
+
+
+# -------------------------------------------------------------------------
+# Entry point
+# -------------------------------------------------------------------------
+def load_addon():
+    global bpy, synthetic
+
+    addon = run.load_addon()
+    bpy = run.bpy
+    synthetic = run.synthetic
+    return addon
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--faces", default="50k", help="Shell face count")
+    parser.add_argument(
+        "--ballast",
+        default="1m",
+        help="Face count of the extra mesh padding the file (0: none)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Clicks per case")
+    parser.add_argument(
+        "--cases",
+        default="",
+        help="Comma-separated case names (default: all): "
+        + ", ".join(c.name for c in CASES),
+    )
+    parser.add_argument(
+        "--panel-resolution",
+        type=int,
+        default=60,
+        help="Grid resolution of the dense test panels",
+    )
+    parser.add_argument(
+        "--outline-points", type=int, default=48, help="Points on the panel outlines"
+    )
+    parser.add_argument("--out", default="", help="Write JSON results to this file")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BEFORE", "AFTER"),
+        help="Compare two result files instead of running",
+    )
+    args = parser.parse_args(run._script_args())
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    load_addon()
+    case_names = {c.strip() for c in args.cases.split(",") if c.strip()}
+    unknown = case_names - {c.name for c in CASES}
+    if unknown:
+        parser.error(f"Unknown case(s): {', '.join(sorted(unknown))}")
+    args.repeat = max(1, args.repeat)
+    args.ballast = "" if args.ballast.strip() in {"", "0"} else args.ballast
+
+    results = benchmark(args, case_names)
+    report = {"meta": run.metadata(args), "results": results}
+    report["meta"].update({"faces": args.faces, "ballast": args.ballast or 0})
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""
+Blender-independent geometry kernels for Sneaker Panel Pro.
+
+Every function here takes and returns plain NumPy arrays (vertex positions,
+edge pairs, face loops, UVs) and never imports ``bpy``, ``bmesh`` or
+``mathutils``. Operators convert their mesh data with ``foreach_get`` and
+call these kernels, so they can also run in worker processes and be tested
+or benchmarked with plain ``python`` by putting the add-on folder on
+``sys.path`` and importing ``core``.
+"""
+
+from . import boundary, collapse, edge_flow, relax, resample, topology, uv_map
+
+__all__ = [
+    "boundary",
+    "collapse",
+    "edge_flow",
+    "relax",
+    "resample",
+    "topology",
+    "uv_map",
+]
@@ -0,0 +1,136 @@
+"""
+UV boundary tests.
+
+The UV boundary of a shell is the set of UV segments along mesh edges that
+have a single face. Points are tested against those segments in batches:
+inside/outside by even-odd ray crossing, distance by closest point on any
+segment.
+"""
+
+import numpy as np
+
+from . import topology
+
+# Points closer than this to a segment count as on the boundary (inside)
+ON_BOUNDARY = 1.0e-6
+
+# Step used to probe which side of a segment is inside
+_PROBE = 1.0e-3
+
+# (point, segment) pairs evaluated per batch, bounds peak memory
+_BATCH_PAIRS = 1 << 22
+
+
+def uv_segments(loop_verts, loop_start, loop_total, loop_uv):
+    """Return the (S, 2, 2) UV segments along the open boundary of a mesh.
+
+    Args:
+        loop_verts, loop_start, loop_total: Face corners (see ``topology``)
+        loop_uv: (L, 2) UV of every face corner
+    """
+    loop_uv = np.asarray(loop_uv, dtype=np.float64).reshape(-1, 2)
+    corners = np.flatnonzero(
+        topology.boundary_corners(loop_verts, loop_start, loop_total)
+    )
+    following = topology.loop_next(loop_start, loop_total)[corners]
+    return np.stack((loop_uv[corners], loop_uv[following]), axis=1)
+
+
+def _batches(count, segments):
+    step = max(1, _BATCH_PAIRS // max(1, len(segments)))
+    for lo in range(0, count, step):
+        yield slice(lo, min(count, lo + step))
+
+
+def closest_points(points, segments):
+    """Return the closest boundary point to each of ``points``.
+
+    Returns:
+        (closest, distance, segment): (N, 2) points, (N,) distances and the
+        (N,) index of the segment they lie on
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    closest = np.zeros_like(points)
+    distance = np.full(len(points), np.inf)
+    segment = np.full(len(points), -1, dtype=np.int64)
+    if not len(segments):
+        return closest, distance, segment
+
+    a = segments[:, 0]
+    ab = segments[:, 1] - a
+    d2 = np.einsum("ij,ij->i", ab, ab)
+    safe_d2 = np.where(d2 > 0.0, d2, 1.0)
+    for batch in _batches(len(points), segments):
+        p = points[batch, None, :]
+        t = np.einsum("nsj,sj->ns", p - a, ab) / safe_d2
+        t = np.clip(np.where(d2 > 0.0, t, 0.0), 0.0, 1.0)
+        c = a + t[..., None] * ab
+        dist = np.linalg.norm(c - p, axis=-1)
+        best = np.argmin(dist, axis=1)
+        rows = np.arange(len(best))
+        closest[batch] = c[rows, best]
+        distance[batch] = dist[rows, best]
+        segment[batch] = best
+    return closest, distance, segment
+
+
+def outside(points, segments, tolerance=ON_BOUNDARY):
+    """Return a bool mask of the points outside the boundary.
+
+    Points outside the unit UV square are always outside; points within
+    ``tolerance`` of a segment count as inside.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    result = np.any((points < 0.0) | (points > 1.0), axis=1)
+    test = np.flatnonzero(~result)
+    if not len(test) or not len(segments):
+        result[test] = True
+        return result
+
+    x0, y0 = segments[:, 0, 0], segments[:, 0, 1]
+    x1, y1 = segments[:, 1, 0], segments[:, 1, 1]
+    dy = y1 - y0
+    safe_dy = np.where(dy != 0.0, dy, 1.0)
+    inside = np.zeros(len(test), dtype=bool)
+    for batch in _batches(len(test), segments):
+        p = points[test[batch]]
+        px, py = p[:, 0:1], p[:, 1:2]
+        # Half-open rule so a ray through a shared vertex counts once
+        straddles = (y0 > py) != (y1 > py)
+        x_hit = x0 + (py - y0) * (x1 - x0) / safe_dy
+        crossings = np.count_nonzero(straddles & (x_hit > px), axis=1)
+        inside[batch] = crossings % 2 == 1
+
+    if tolerance > 0.0:
+        near = closest_points(points[test[~inside]], segments)[1] <= tolerance
+        inside[np.flatnonzero(~inside)[near]] = True
+    result[test] = ~inside
+    return result
+
+
+def inward_directions(anchors, segments, segment):
+    """Return unit directions pointing from boundary points into the inside.
+
+    Args:
+        anchors: (N, 2) points on the boundary
+        segments: (S, 2, 2) boundary segments
+        segment: (N,) index of the segment each anchor lies on
+    """
+    anchors = np.asarray(anchors, dtype=np.float64).reshape(-1, 2)
+    tangent = segments[segment, 1] - segments[segment, 0]
+    length = np.linalg.norm(tangent, axis=1)
+    normal = np.stack((-tangent[:, 1], tangent[:, 0]), axis=-1)
+    normal[length > 0.0] /= length[length > 0.0, None]
+
+    flip = outside(anchors + normal * _PROBE, segments)
+    normal[flip] *= -1.0
+
+    # Degenerate segments: head for the centroid of the boundary
+    degenerate = length <= 0.0
+    if degenerate.any():
+        to_centre = segments.reshape(-1, 2).mean(axis=0) - anchors[degenerate]
+        norm = np.linalg.norm(to_centre, axis=1)
+        to_centre[norm > 0.0] /= norm[norm > 0.0, None]
+        to_centre[norm <= 0.0] = (0.0, -1.0)
+        normal[degenerate] = to_centre
+    return normal
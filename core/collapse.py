@@ -0,0 +1,165 @@
+"""
+Quadric error metrics for edge collapse.
+
+Every vertex accumulates 4x4 quadrics measuring the squared distance to the
+planes of its faces (weighted by area), to a perpendicular plane along open
+boundary edges (so outlines keep their shape) and to the line of wire edges
+(outline polylines have no faces). Collapsing an edge costs the error of the
+summed quadric at the best position; the shortest edge wins ties.
+"""
+
+import numpy as np
+
+from . import topology
+
+# Weight of the boundary constraint planes relative to face planes
+BOUNDARY_WEIGHT = 100.0
+
+_DEGENERATE = 1.0e-12
+
+
+def _accumulate(quadrics, index, values):
+    """Add (K, 4, 4) ``values`` into ``quadrics`` at vertex ``index``."""
+    count = len(quadrics)
+    flat = values.reshape(-1, 16)
+    quadrics += np.stack(
+        [np.bincount(index, weights=flat[:, k], minlength=count) for k in range(16)],
+        axis=-1,
+    ).reshape(-1, 4, 4)
+
+
+def plane_quadrics(normals, points, weights=1.0):
+    """Return (N, 4, 4) quadrics of the planes through ``points``."""
+    normals = np.asarray(normals, dtype=np.float64).reshape(-1, 3)
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    p = np.concatenate(
+        (normals, -np.einsum("ij,ij->i", normals, points)[:, None]), axis=1
+    )
+    weights = np.broadcast_to(np.asarray(weights, dtype=np.float64), len(p))
+    return weights[:, None, None] * p[:, :, None] * p[:, None, :]
+
+
+def line_quadrics(directions, points, weights=1.0):
+    """Return (N, 4, 4) quadrics of the lines along unit ``directions``."""
+    u = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    a = np.eye(3) - u[:, :, None] * u[:, None, :]
+    b = -np.einsum("nij,nj->ni", a, points)
+    c = np.einsum("ni,ni->n", points, -b)
+    q = np.empty((len(u), 4, 4))
+    q[:, :3, :3] = a
+    q[:, :3, 3] = b
+    q[:, 3, :3] = b
+    q[:, 3, 3] = c
+    weights = np.broadcast_to(np.asarray(weights, dtype=np.float64), len(q))
+    return weights[:, None, None] * q
+
+
+def face_normals(co, loop_verts, loop_start, loop_total):
+    """Return unit normals and areas of polygon faces (Newell's method)."""
+    co = np.asarray(co, dtype=np.float64).reshape(-1, 3)
+    edges = topology.face_edges(loop_verts, loop_start, loop_total)
+    a, b = co[edges[:, 0]], co[edges[:, 1]]
+    face = np.repeat(np.arange(len(loop_start)), loop_total)
+    cross = np.cross(a, b)
+    newell = np.stack(
+        [
+            np.bincount(face, weights=cross[:, axis], minlength=len(loop_start))
+            for axis in range(3)
+        ],
+        axis=-1,
+    )
+    length = np.linalg.norm(newell, axis=1)
+    normals = np.zeros_like(newell)
+    valid = length > _DEGENERATE
+    normals[valid] = newell[valid] / length[valid, None]
+    return normals, length * 0.5
+
+
+def vertex_quadrics(
+    co, loop_verts, loop_start, loop_total, edges=(), boundary_weight=BOUNDARY_WEIGHT
+):
+    """Return the (V, 4, 4) accumulated quadric of every vertex.
+
+    Args:
+        co: (V, 3) positions
+        loop_verts, loop_start, loop_total: Face corners
+        edges: (E, 2) mesh edges; edges without faces get line quadrics
+    """
+    co = np.asarray(co, dtype=np.float64).reshape(-1, 3)
+    loop_verts = np.asarray(loop_verts, dtype=np.int64)
+    loop_start = np.asarray(loop_start, dtype=np.int64)
+    loop_total = np.asarray(loop_total, dtype=np.int64)
+    quadrics = np.zeros((len(co), 4, 4))
+
+    normals, areas = face_normals(co, loop_verts, loop_start, loop_total)
+    if len(areas):
+        q = plane_quadrics(normals, co[loop_verts[loop_start]], areas)
+        q[areas <= 0.0] = 0.0
+        face = np.repeat(np.arange(len(loop_start)), loop_total)
+        _accumulate(quadrics, loop_verts, q[face])
+
+    # Open boundary: a plane through the edge, perpendicular to its face
+    corner_edges = topology.face_edges(loop_verts, loop_start, loop_total)
+    corners = np.flatnonzero(
+        topology.boundary_corners(loop_verts, loop_start, loop_total)
+    )
+    if len(corners):
+        pairs = corner_edges[corners]
+        d = co[pairs[:, 1]] - co[pairs[:, 0]]
+        face = np.repeat(np.arange(len(loop_start)), loop_total)[corners]
+        n = np.cross(d, normals[face])
+        n_len = np.linalg.norm(n, axis=1)
+        keep = (np.linalg.norm(d, axis=1) > _DEGENERATE) & (n_len > _DEGENERATE)
+        q = plane_quadrics(
+            n[keep] / n_len[keep, None],
+            co[pairs[keep, 0]],
+            boundary_weight * np.einsum("ij,ij->i", d[keep], d[keep]),
+        )
+        _accumulate(quadrics, pairs[keep, 0], q)
+        _accumulate(quadrics, pairs[keep, 1], q)
+
+    # Wire edges: distance to the edge's line
+    wire = topology.wire_edges(edges, corner_edges)
+    if len(wire):
+        d = co[wire[:, 1]] - co[wire[:, 0]]
+        length = np.linalg.norm(d, axis=1)
+        keep = length > _DEGENERATE
+        if keep.any():
+            q = line_quadrics(
+                d[keep] / length[keep, None], co[wire[keep, 0]], length[keep]
+            )
+            _accumulate(quadrics, wire[keep, 0], q)
+            _accumulate(quadrics, wire[keep, 1], q)
+    return quadrics
+
+
+def quadric_error(q, co):
+    """Return the (non-negative) error of quadric ``q`` at position ``co``."""
+    x, y, z = co
+    v = np.array((x, y, z, 1.0))
+    return max(0.0, float(v @ q @ v))
+
+
+def collapse_position(q, p1, p2):
+    """Return (cost, position) of the cheapest position for merging p1 and p2.
+
+    The candidates are both ends, the midpoint and, when the quadric is
+    invertible, its minimum. Ties go to the earlier candidate.
+    """
+    candidates = np.ones((4, 4))
+    candidates[0, :3] = p1
+    candidates[1, :3] = p2
+    candidates[2, :3] = (candidates[0, :3] + candidates[1, :3]) * 0.5
+    count = 3
+    (a, b, c), (_, d, e), (_, _, f) = q[:3, :3].tolist()
+    # Determinant of the symmetric 3x3 block, written out: np.linalg.det
+    # costs more than the rest of this function
+    det = a * (d * f - e * e) - b * (b * f - c * e) + c * (b * e - c * d)
+    if abs(det) > 1e-10:
+        candidates[3, :3] = -np.linalg.solve(q[:3, :3], q[:3, 3])
+        count = 4
+    candidates = candidates[:count]
+    errors = np.einsum("ci,ij,cj->c", candidates, q, candidates)
+    best = int(np.argmin(errors))
+    return max(0.0, float(errors[best])), candidates[best, :3].copy()
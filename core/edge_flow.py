@@ -0,0 +1,124 @@
+"""
+Hermite edge flow.
+
+Each loop vertex is moved onto the Hermite curve through its two ring
+neighbours (the vertices across the quads on either side of the loop), then
+open loops are blended back toward their original shape near the ends.
+"""
+
+import numpy as np
+
+
+def hermite_3d(p1, p2, p3, p4, mu, tension, bias):
+    """Hermite point between ``p2`` and ``p3``; works on (N, 3) arrays."""
+
+    def h1d(y0, y1, y2, y3, mu):
+        mu2 = mu * mu
+        mu3 = mu2 * mu
+        m0 = (y1 - y0) * (1 - tension) * 0.5 + (y2 - y1) * (1 - tension) * 0.5
+        m1 = (y2 - y1) * (1 - tension) * 0.5 + (y3 - y2) * (1 - tension) * 0.5
+        a0 = 2 * mu3 - 3 * mu2 + 1
+        a1 = mu3 - 2 * mu2 + mu
+        a2 = mu3 - mu2
+        a3 = -2 * mu3 + 3 * mu2
+        return a0 * y1 + a1 * m0 + a2 * m1 + a3 * y2
+
+    return h1d(p1, p2, p3, p4, mu)
+
+
+def blend_position(original, target, blend_factor):
+    return original + (target - original) * blend_factor
+
+
+def ordered_chains(edges):
+    """Split ``edges`` into ordered vertex chains.
+
+    Args:
+        edges: Pairs of hashable vertex keys (indices, or any other key)
+
+    Returns:
+        list: (verts, is_cyclic) per connected chain, verts in walk order
+    """
+    neighbours = {}
+    for a, b in edges:
+        neighbours.setdefault(a, []).append(b)
+        neighbours.setdefault(b, []).append(a)
+
+    visited = set()
+    chains = []
+
+    def walk(start):
+        chain = [start]
+        visited.add(start)
+        prev, cur = None, start
+        while True:
+            nxt = next(
+                (v for v in neighbours[cur] if v != prev and v not in visited),
+                None,
+            )
+            if nxt is None:
+                return chain
+            chain.append(nxt)
+            visited.add(nxt)
+            prev, cur = cur, nxt
+
+    # Open chains first, starting from their ends, then the closed rings
+    for v, linked in neighbours.items():
+        if v not in visited and len(linked) != 2:
+            chains.append((walk(v), False))
+    for v in neighbours:
+        if v not in visited:
+            chains.append((walk(v), True))
+    return chains
+
+
+def flow(positions, centers, ring_a, ring_b, tension, iterations):
+    """Return ``positions`` with each ``centers`` vertex on its Hermite curve.
+
+    Args:
+        positions: (N, 3) positions
+        centers: (K,) indices of the vertices to move
+        ring_a, ring_b: (K,) indices of their two ring neighbours
+        tension: Edge flow tension (higher pulls flatter)
+        iterations: Number of passes
+    """
+    positions = np.array(positions, dtype=np.float64)
+    centers = np.asarray(centers, dtype=np.int64)
+    if not len(centers):
+        return positions
+    ring_a = np.asarray(ring_a, dtype=np.int64)
+    ring_b = np.asarray(ring_b, dtype=np.int64)
+    for _ in range(iterations):
+        p2 = positions[ring_a]
+        p3 = positions[ring_b]
+        p1 = p2 - (p3 - p2)
+        p4 = p3 - (p2 - p3)
+        positions[centers] = hermite_3d(p1, p2, p3, p4, 0.5, -tension, 0)
+    return positions
+
+
+def blend_open_ends(positions, original, chains, zone):
+    """Fade open chains back to ``original`` over ``zone`` vertices per end.
+
+    Args:
+        positions, original: (N, 3) moved and original positions
+        chains: (indices, is_cyclic) per chain
+        zone: Number of vertices from each end to blend
+
+    Returns:
+        (N, 3) blended positions
+    """
+    positions = np.array(positions, dtype=np.float64)
+    if not zone:
+        return positions
+    for idx, is_cyclic in chains:
+        if is_cyclic or len(idx) < 2:
+            continue
+        n = len(idx)
+        order = np.arange(n)
+        from_end = np.minimum(order, n - 1 - order)
+        in_zone = from_end < zone
+        blend = (from_end[in_zone] / zone)[:, None]
+        sel = np.asarray(idx)[in_zone]
+        positions[sel] = blend_position(original[sel], positions[sel], blend)
+    return positions
@@ -0,0 +1,54 @@
+"""
+Laplacian relaxation over an edge graph.
+"""
+
+import numpy as np
+
+
+def neighbour_mean(co, edges):
+    """Return the mean position of each vertex's edge neighbours.
+
+    Returns:
+        (mean, degree): (N, 3) means (the vertex itself when it has no
+        neighbours) and the (N,) neighbour counts
+    """
+    co = np.asarray(co, dtype=np.float64).reshape(-1, 3)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    count = len(co)
+    src = np.concatenate((edges[:, 0], edges[:, 1]))
+    dst = np.concatenate((edges[:, 1], edges[:, 0]))
+    degree = np.bincount(src, minlength=count)
+    total = np.stack(
+        [np.bincount(src, weights=co[dst, axis], minlength=count) for axis in range(3)],
+        axis=-1,
+    )
+    mean = co.copy()
+    linked = degree > 0
+    mean[linked] = total[linked] / degree[linked, None]
+    return mean, degree
+
+
+def laplacian(co, edges, factor=0.5, iterations=1, movable=None):
+    """Move vertices toward the mean of their neighbours.
+
+    Every iteration reads the positions of the previous one (Jacobi style),
+    so the result does not depend on vertex order.
+
+    Args:
+        co: (N, 3) positions
+        edges: (E, 2) vertex index pairs
+        factor: Blend toward the mean, 0 keeps, 1 replaces
+        iterations: Number of passes
+        movable: (N,) bool mask of the vertices allowed to move
+
+    Returns:
+        (N, 3) relaxed positions
+    """
+    co = np.array(co, dtype=np.float64).reshape(-1, 3)
+    if movable is None:
+        movable = np.ones(len(co), dtype=bool)
+    for _ in range(iterations):
+        mean, degree = neighbour_mean(co, edges)
+        move = movable & (degree > 0)
+        co[move] += (mean[move] - co[move]) * factor
+    return co
@@ -0,0 +1,72 @@
+"""
+Polyline extraction and arc-length resampling.
+"""
+
+import numpy as np
+
+
+def order_polylines(vertex_count, edges):
+    """Walk an edge graph into ordered vertex chains.
+
+    Chains start at an open end when one is left, otherwise at the lowest
+    unvisited vertex. Isolated vertices come back as one-vertex chains.
+
+    Returns:
+        list: One (K,) vertex index array per chain
+    """
+    linked = [[] for _ in range(vertex_count)]
+    for a, b in np.asarray(edges, dtype=np.int64).reshape(-1, 2).tolist():
+        linked[a].append(b)
+        linked[b].append(a)
+    ends = [i for i, n in enumerate(linked) if len(n) == 1]
+    next_end = 0
+
+    visited = [False] * vertex_count
+    chains = []
+    for v in range(vertex_count):
+        if visited[v]:
+            continue
+        while next_end < len(ends) and visited[ends[next_end]]:
+            next_end += 1
+        current = ends[next_end] if next_end < len(ends) else v
+
+        chain = []
+        while current != -1 and not visited[current]:
+            visited[current] = True
+            chain.append(current)
+            current = next((n for n in linked[current] if not visited[n]), -1)
+        chains.append(np.asarray(chain, dtype=np.int64))
+    return chains
+
+
+def resample_polyline(points, count):
+    """Return ``count`` points spaced evenly by arc length along ``points``.
+
+    Samples start at the first point and are ``length / count`` apart, so the
+    last input point is not repeated; this suits closed outlines.
+
+    Returns:
+        (count, 3) array, empty when ``count`` < 2
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if not len(points) or count < 2:
+        return np.zeros((0,) + points.shape[1:])
+
+    lengths = np.zeros(len(points))
+    np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1), out=lengths[1:])
+    total = lengths[-1]
+    if total < 1e-6:
+        return np.repeat(points[:1], count, axis=0)
+
+    targets = np.arange(count) * (total / count)
+    segment = np.clip(
+        np.searchsorted(lengths, targets, side="left") - 1, 0, len(points) - 2
+    )
+    seg_length = lengths[segment + 1] - lengths[segment]
+    t = np.where(
+        seg_length > 1e-6,
+        (targets - lengths[segment]) / np.where(seg_length > 1e-6, seg_length, 1.0),
+        0.0,
+    )
+    p0 = points[segment]
+    return p0 + (points[segment + 1] - p0) * t[:, None]
@@ -0,0 +1,93 @@
+"""
+Mesh connectivity from flat loop arrays.
+
+Faces are described the way ``Mesh.polygons`` stores them: ``loop_verts``
+holds the vertex of every face corner, and face ``f`` owns the corners
+``loop_start[f] : loop_start[f] + loop_total[f]``.
+"""
+
+import numpy as np
+
+
+def loop_next(loop_start, loop_total):
+    """Return the index of the next corner around its face for every corner."""
+    loop_start = np.asarray(loop_start, dtype=np.int64)
+    loop_total = np.asarray(loop_total, dtype=np.int64)
+    count = int(loop_total.sum())
+    face = np.repeat(np.arange(len(loop_start)), loop_total)
+    corner = np.arange(count) - np.repeat(loop_start, loop_total)
+    nxt = corner + 1
+    nxt[nxt == loop_total[face]] = 0
+    return loop_start[face] + nxt
+
+
+def face_edges(loop_verts, loop_start, loop_total):
+    """Return the (L, 2) vertex pair of the edge leaving every face corner."""
+    loop_verts = np.asarray(loop_verts, dtype=np.int64)
+    return np.stack(
+        (loop_verts, loop_verts[loop_next(loop_start, loop_total)]), axis=-1
+    )
+
+
+def edge_keys(edges):
+    """Return the sorted (N, 2) vertex pairs so both directions compare equal."""
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    return np.sort(edges, axis=1)
+
+
+def boundary_corners(loop_verts, loop_start, loop_total):
+    """Return a bool mask of the face corners whose edge has only one face."""
+    keys = edge_keys(face_edges(loop_verts, loop_start, loop_total))
+    if not len(keys):
+        return np.zeros(0, dtype=bool)
+    flat = keys[:, 0] * (int(keys.max()) + 1) + keys[:, 1]
+    _unique, inverse, counts = np.unique(flat, return_inverse=True, return_counts=True)
+    return counts[inverse] == 1
+
+
+def boundary_vertex_mask(vertex_count, loop_verts, loop_start, loop_total, edges=()):
+    """Return a bool mask of vertices on an open boundary or a wire edge.
+
+    Args:
+        vertex_count: Number of vertices
+        loop_verts, loop_start, loop_total: Face corners
+        edges: (E, 2) all mesh edges; edges used by no face count as wire
+    """
+    mask = np.zeros(vertex_count, dtype=bool)
+    corner_edges = face_edges(loop_verts, loop_start, loop_total)
+    on_boundary = boundary_corners(loop_verts, loop_start, loop_total)
+    mask[corner_edges[on_boundary].ravel()] = True
+
+    mask[wire_edges(edges, corner_edges).ravel()] = True
+    return mask
+
+
+def wire_edges(edges, corner_edges):
+    """Return the rows of ``edges`` that no face uses.
+
+    Args:
+        edges: (E, 2) mesh edges
+        corner_edges: (L, 2) face edges, see ``face_edges``
+    """
+    edges = edge_keys(edges)
+    if not len(edges):
+        return edges
+    used = edge_keys(corner_edges)
+    span = int(max(edges.max(), used.max() if len(used) else 0)) + 1
+    unused = ~np.isin(edges[:, 0] * span + edges[:, 1], used[:, 0] * span + used[:, 1])
+    return edges[unused]
+
+
+def neighbours(vertex_count, edges):
+    """Return the CSR adjacency (offsets, indices) of an undirected edge list.
+
+    The neighbours of vertex ``i`` are ``indices[offsets[i]:offsets[i + 1]]``.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    both = np.concatenate((edges, edges[:, ::-1]))
+    order = np.argsort(both[:, 0], kind="stable")
+    both = both[order]
+    counts = np.bincount(both[:, 0], minlength=vertex_count)
+    offsets = np.zeros(vertex_count + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets, both[:, 1]
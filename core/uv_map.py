@@ -0,0 +1,193 @@
+"""
+UV to surface mapping by barycentric interpolation.
+
+The shell is given as triangles with a UV and a 3D position per corner. A
+``TriangleGrid`` buckets the UV triangles into a uniform grid so each query
+point is only tested against the few triangles overlapping its cell; all
+points are then resolved together with array arithmetic.
+"""
+
+import numpy as np
+
+# Barycentric tolerance: points this far outside a triangle still count
+EPSILON = 1.0e-6
+
+# Candidate (point, triangle) pairs tested per batch, bounds peak memory
+_BATCH_PAIRS = 1 << 21
+
+
+def to_uv(points, matrix_world_inv, scale):
+    """Map world positions into the UV space of the UV reference mesh.
+
+    Args:
+        points: (N, 3) world positions
+        matrix_world_inv: 4x4 inverse world matrix of the UV reference mesh
+        scale: The mesh's ``spp_applied_scale_factor``
+
+    Returns:
+        (N, 2) UV coordinates
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    m = np.asarray(matrix_world_inv, dtype=np.float64)
+    local = points @ m[:3, :3].T + m[:3, 3]
+    return local[:, :2] / scale
+
+
+def from_uv(uv, matrix_world, scale):
+    """Inverse of ``to_uv``: UV coordinates to world positions on the UV mesh."""
+    uv = np.asarray(uv, dtype=np.float64).reshape(-1, 2)
+    local = np.zeros((len(uv), 3))
+    local[:, :2] = uv * scale
+    m = np.asarray(matrix_world, dtype=np.float64)
+    return local @ m[:3, :3].T + m[:3, 3]
+
+
+class TriangleGrid:
+    """Uniform grid over UV triangles for point location.
+
+    Args:
+        tri_uv: (T, 3, 2) UV corners of every triangle
+        resolution: Cells per side; defaults to about one triangle per cell
+    """
+
+    def __init__(self, tri_uv, resolution=None):
+        tri_uv = np.asarray(tri_uv, dtype=np.float64).reshape(-1, 3, 2)
+        self.tri_uv = tri_uv
+        count = len(tri_uv)
+        if resolution is None:
+            resolution = int(np.clip(np.sqrt(count), 1, 2048))
+        self.resolution = resolution
+
+        if not count:
+            self.origin = np.zeros(2)
+            self.cell = np.ones(2)
+            self.offsets = np.zeros(resolution * resolution + 1, dtype=np.int64)
+            self.triangles = np.zeros(0, dtype=np.int64)
+            return
+
+        lo = tri_uv.min(axis=1)
+        hi = tri_uv.max(axis=1)
+        self.origin = lo.min(axis=0)
+        extent = hi.max(axis=0) - self.origin
+        self.cell = np.where(extent > 0.0, extent / resolution, 1.0)
+
+        first = self._cells(lo)
+        last = self._cells(hi)
+        span = last - first + 1
+        per_tri = span[:, 0] * span[:, 1]
+
+        # Expand every triangle over the cells its bounding box covers
+        tri = np.repeat(np.arange(count), per_tri)
+        local = np.arange(len(tri)) - np.repeat(np.cumsum(per_tri) - per_tri, per_tri)
+        cx = first[tri, 0] + local % span[tri, 0]
+        cy = first[tri, 1] + local // span[tri, 0]
+        cell_id = cy * resolution + cx
+
+        order = np.argsort(cell_id, kind="stable")
+        self.triangles = tri[order]
+        counts = np.bincount(cell_id, minlength=resolution * resolution)
+        self.offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.offsets[1:])
+
+    def _cells(self, uv):
+        cells = np.floor((uv - self.origin) / self.cell).astype(np.int64)
+        return np.clip(cells, 0, self.resolution - 1)
+
+    def candidates(self, uv):
+        """Return the (point index, triangle index) pairs worth testing.
+
+        Pairs are ordered by point, then by triangle index.
+        """
+        uv = np.asarray(uv, dtype=np.float64).reshape(-1, 2)
+        if not len(self.triangles) or not len(uv):
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        upper = self.origin + self.cell * self.resolution
+        inside = np.all((uv >= self.origin) & (uv <= upper), axis=1)
+        points = np.flatnonzero(inside)
+        cells = self._cells(uv[points])
+        cell_id = cells[:, 1] * self.resolution + cells[:, 0]
+        start = self.offsets[cell_id]
+        count = self.offsets[cell_id + 1] - start
+
+        point = np.repeat(points, count)
+        local = np.arange(len(point)) - np.repeat(np.cumsum(count) - count, count)
+        tri = self.triangles[np.repeat(start, count) + local]
+        return point, tri
+
+
+def barycentric(p, a, b, c):
+    """Return (N, 3) barycentric weights of 2D points ``p`` in triangles abc.
+
+    Degenerate triangles get NaN weights.
+    """
+    v0 = b - a
+    v1 = c - a
+    v2 = p - a
+    d00 = np.einsum("ij,ij->i", v0, v0)
+    d01 = np.einsum("ij,ij->i", v0, v1)
+    d11 = np.einsum("ij,ij->i", v1, v1)
+    d20 = np.einsum("ij,ij->i", v2, v0)
+    d21 = np.einsum("ij,ij->i", v2, v1)
+    denom = d00 * d11 - d01 * d01
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w1 = (d11 * d20 - d01 * d21) / denom
+        w2 = (d00 * d21 - d01 * d20) / denom
+    w1[denom == 0.0] = np.nan
+    w2[denom == 0.0] = np.nan
+    return np.stack((1.0 - w1 - w2, w1, w2), axis=-1)
+
+
+def locate(uv, grid, eps=EPSILON):
+    """Find the first triangle containing each UV point.
+
+    Returns:
+        (triangle, weights): (N,) triangle index or -1, and (N, 3) barycentric
+        weights (undefined where the triangle is -1)
+    """
+    uv = np.asarray(uv, dtype=np.float64).reshape(-1, 2)
+    triangle = np.full(len(uv), -1, dtype=np.int64)
+    weights = np.zeros((len(uv), 3))
+    point, tri = grid.candidates(uv)
+
+    for lo in range(0, len(point), _BATCH_PAIRS):
+        p_idx = point[lo : lo + _BATCH_PAIRS]
+        t_idx = tri[lo : lo + _BATCH_PAIRS]
+        corners = grid.tri_uv[t_idx]
+        w = barycentric(uv[p_idx], corners[:, 0], corners[:, 1], corners[:, 2])
+        with np.errstate(invalid="ignore"):
+            valid = np.all(w >= -eps, axis=1)
+        # A batch boundary can split one point's candidates: keep earlier hits
+        valid &= triangle[p_idx] < 0
+        hits = np.flatnonzero(valid)
+        if not len(hits):
+            continue
+        first_points, first = np.unique(p_idx[hits], return_index=True)
+        chosen = hits[first]
+        triangle[first_points] = t_idx[chosen]
+        weights[first_points] = w[chosen]
+    return triangle, weights
+
+
+def uv_to_surface(uv, tri_co, grid, eps=EPSILON):
+    """Map UV points onto the 3D surface of the triangles in ``grid``.
+
+    Args:
+        uv: (N, 2) UV points
+        tri_co: (T, 3, 3) 3D corners matching ``grid.tri_uv``
+        grid: ``TriangleGrid`` of the UV triangles
+
+    Returns:
+        (positions, found): (N, 3) positions (the input UV with z = 0 where
+        not found) and a bool array of the points inside some triangle
+    """
+    uv = np.asarray(uv, dtype=np.float64).reshape(-1, 2)
+    tri_co = np.asarray(tri_co, dtype=np.float64).reshape(-1, 3, 3)
+    triangle, weights = locate(uv, grid, eps)
+    found = triangle >= 0
+
+    positions = np.zeros((len(uv), 3))
+    positions[:, :2] = uv
+    corners = tri_co[triangle[found]]
+    positions[found] = np.einsum("ij,ijk->ik", weights[found], corners)
+    return positions, found
@@ -1,29 +1,247 @@
+import argparse
 import csv
-import sys
 import hashlib
+import sqlite3
+import sys
+import time
 
 OFFLINE_SALT = "enoevol2025"  # must match utils/license_manager.py
 
+DEFAULT_CSV = "issued_keys.csv"
+DEFAULT_DB = "issued_keys.sqlite"
+BATCH_SIZE = 1000
+
+
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
+
 
 def generate_offline_key(email: str) -> str:
+    """Key for ``email``; derived from the normalized email, like the add-on."""
     digest = (
-        hashlib.sha256(f"{email}-{OFFLINE_SALT}".encode("utf-8"))
+        hashlib.sha256(f"{normalize_email(email)}-{OFFLINE_SALT}".encode("utf-8"))
         .hexdigest()[:12]
         .upper()
     )
     return f"SPP-{digest}"
 
 
+# -------------------------------------------------------------------------
+# Key store: one row per buyer, keyed by normalized email
+# -------------------------------------------------------------------------
+def open_store(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS issued_keys (
+            email_norm TEXT PRIMARY KEY,
+            email      TEXT NOT NULL,
+            key        TEXT NOT NULL,
+            issued_at  INTEGER NOT NULL
+        ) WITHOUT ROWID
+        """)
+    return conn
+
+
+def lookup(conn, email: str):
+    row = conn.execute(
+        "SELECT email, key FROM issued_keys WHERE email_norm = ?",
+        (normalize_email(email),),
+    ).fetchone()
+    return row
+
+
+def issue_batch(conn, emails):
+    """Issue keys for ``emails``; already issued buyers keep their key.
+
+    Yields:
+        (email, key, is_new) in input order
+    """
+    now = int(time.time())
+    rows = {}
+    for email in emails:
+        email = email.strip()
+        if email:
+            rows.setdefault(normalize_email(email), email)
+
+    known = {}
+    norms = list(rows)
+    # Stay below SQLite's bound-parameter limit
+    for start in range(0, len(norms), 500):
+        chunk = norms[start : start + 500]
+        marks = ",".join("?" * len(chunk))
+        for norm, key in conn.execute(
+            f"SELECT email_norm, key FROM issued_keys WHERE email_norm IN ({marks})",
+            chunk,
+        ):
+            known[norm] = key
+
+    new_rows = [
+        (norm, email, generate_offline_key(email), now)
+        for norm, email in rows.items()
+        if norm not in known
+    ]
+    with conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO issued_keys VALUES (?, ?, ?, ?)", new_rows
+        )
+
+    fresh = {norm: key for norm, _email, key, _t in new_rows}
+    for norm, email in rows.items():
+        if norm in known:
+            yield email, known[norm], False
+        else:
+            yield email, fresh[norm], True
+
+
+def iter_emails(csv_path: str):
+    """Stream buyer emails from a CSV; uses an ``email`` column if present."""
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        column = 0
+        for i, row in enumerate(reader):
+            if not row:
+                continue
+            if i == 0:
+                header = [c.strip().lower() for c in row]
+                if "email" in header:
+                    column = header.index("email")
+                    continue
+                if "@" not in row[0]:
+                    continue  # Some other header row
+            if column < len(row):
+                yield row[column]
+
+
+def _batched(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _open_out(path):
+    if path == "-":
+        return sys.stdout
+    return open(path, "w", newline="", encoding="utf-8")
+
+
+# -------------------------------------------------------------------------
+# Commands
+# -------------------------------------------------------------------------
+def run_single(conn, email: str, csv_path: str):
+    email, key, is_new = next(issue_batch(conn, [email]))
+    if is_new:
+        with open(csv_path, "a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow([email, key])
+        print(f"Generated key for {email}: {key}\nSaved to {csv_path}")
+    else:
+        print(f"Key already issued for {email}: {key}")
+
+
+def run_bulk(conn, input_csv: str, out_path: str):
+    """Issue keys for every buyer in ``input_csv``, streaming rows to ``out_path``."""
+    new = existing = 0
+    out = _open_out(out_path)
+    try:
+        writer = csv.writer(out)
+        writer.writerow(["email", "key", "status"])
+        for batch in _batched(iter_emails(input_csv), BATCH_SIZE):
+            for email, key, is_new in issue_batch(conn, batch):
+                writer.writerow([email, key, "new" if is_new else "existing"])
+                if is_new:
+                    new += 1
+                else:
+                    existing += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"{new} new key(s), {existing} already issued", file=sys.stderr)
+
+
+def run_import(conn, csv_path: str):
+    """Load a legacy ``email,key`` CSV into the store (existing rows win)."""
+    now = int(time.time())
+    count = 0
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for batch in _batched(csv.reader(f), BATCH_SIZE):
+            rows = [
+                (normalize_email(r[0]), r[0].strip(), r[1].strip(), now)
+                for r in batch
+                if len(r) >= 2 and "@" in r[0]
+            ]
+            with conn:
+                count += conn.executemany(
+                    "INSERT OR IGNORE INTO issued_keys VALUES (?, ?, ?, ?)", rows
+                ).rowcount
+    print(f"Imported {count} key(s) from {csv_path}")
+
+
+def run_export(conn, out_path: str):
+    """Stream the whole store to CSV without loading it into memory."""
+    out = _open_out(out_path)
+    try:
+        writer = csv.writer(out)
+        writer.writerow(["email", "key", "issued_at"])
+        for row in conn.execute(
+            "SELECT email, key, issued_at FROM issued_keys ORDER BY email_norm"
+        ):
+            writer.writerow(row)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python generate_keys.py buyer@example.com [issued_keys.csv]")
-        return
-    email = sys.argv[1].strip()
-    csv_path = sys.argv[2] if len(sys.argv) > 2 else "issued_keys.csv"
-    key = generate_offline_key(email)
-    with open(csv_path, "a", newline="", encoding="utf-8") as f:
-        csv.writer(f).writerow([email, key])
-    print(f"Generated key for {email}: {key}\nSaved to {csv_path}")
+    parser = argparse.ArgumentParser(
+        description="Issue Sneaker Panel Pro offline license keys."
+    )
+    parser.add_argument("email", nargs="?", help="Buyer email (single key mode)")
+    parser.add_argument(
+        "csv_path",
+        nargs="?",
+        default=DEFAULT_CSV,
+        help=f"CSV log for single keys (default: {DEFAULT_CSV})",
+    )
+    parser.add_argument("--db", default=DEFAULT_DB, help="Key store (SQLite)")
+    parser.add_argument(
+        "--bulk", metavar="BUYERS_CSV", help="Issue keys for every email in a CSV"
+    )
+    parser.add_argument(
+        "--out", default="-", help="Output CSV for --bulk/--export (default: stdout)"
+    )
+    parser.add_argument(
+        "--import-csv",
+        metavar="CSV",
+        help="Load a legacy email,key CSV into the store",
+    )
+    parser.add_argument(
+        "--lookup", metavar="EMAIL", help="Show the key issued to EMAIL"
+    )
+    parser.add_argument("--export", action="store_true", help="Dump the store as CSV")
+    args = parser.parse_args()
+
+    conn = open_store(args.db)
+    try:
+        if args.import_csv:
+            run_import(conn, args.import_csv)
+        if args.bulk:
+            run_bulk(conn, args.bulk, args.out)
+        elif args.lookup:
+            row = lookup(conn, args.lookup)
+            print(f"{row[0]}: {row[1]}" if row else f"No key issued for {args.lookup}")
+        elif args.export:
+            run_export(conn, args.out)
+        elif args.email:
+            run_single(conn, args.email.strip(), args.csv_path)
+        elif not args.import_csv:
+            print("Usage: python generate_keys.py buyer@example.com [issued_keys.csv]")
+            print("       python generate_keys.py --bulk buyers.csv --out keys.csv")
+    finally:
+        conn.close()
 
 
 if __name__ == "__main__":
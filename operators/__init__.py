@@ -47,9 +47,11 @@ from . import (
     uv_to_mesh,
     spp_auto_pave_align,
 )
+from ..utils import profiling, undo
 
 
 def register():
+    profiling.register()
     add_gp_draw.register()
     gp_to_curve.register()
     decimate_curve.register()
@@ -84,6 +86,7 @@ def register():
     set_edge_linear.register()
     ref_image_gen.register()
     spp_auto_pave_align.register()
+    undo.register()
 
 def unregister():
     orient_uv_island.unregister()
@@ -120,4 +123,5 @@ def unregister():
     add_subsurf.unregister()
     set_edge_linear.unregister()
     ref_image_gen.unregister()
-    spp_auto_pave_align.unregister()
\ No newline at end of file
+    spp_auto_pave_align.unregister()
+    profiling.unregister()
@@ -14,8 +14,6 @@ class OBJECT_OT_AddGPDraw(bpy.types.Operator):
         return context.mode == "OBJECT"
 
     def execute(self, context):
-        bpy.ops.ed.undo_push(message="Add Grease Pencil")
-
         bpy.context.tool_settings.use_mesh_automerge = True
         bpy.ops.object.grease_pencil_add(location=(0, 0, 0))
         gp_obj = context.active_object
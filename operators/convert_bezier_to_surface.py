@@ -1,7 +1,10 @@
 import bpy
+import numpy as np
 from bpy.props import BoolProperty, IntProperty
 
+from ..utils import conform
 from ..utils.collections import add_object_to_panel_collection
+from ..utils.panel_utils import apply_surface_snap
 
 
 # --- Helper Functions ---
@@ -36,276 +39,139 @@ def selected_1_or_more_curves():
     return False
 
 
-# --- Core Surface Conversion Function ---
-def surface_from_bezier(context_ref, surfacedata, points, center):
-    len_points = len(points) - 1
-    if len_points % 2 == 0:  # Ensure odd number of points for pairing algorithm
-        h = subdivide_cubic_bezier(
-            points[len_points].co,
-            points[len_points].handle_right,
-            points[0].handle_left,
-            points[0].co,
-            0.5,
-        )
-        points.add(1)
-        len_points = len(points) - 1
-        points[len_points - 1].handle_right = h[0]
-        points[len_points].handle_left = h[1]
-        points[len_points].co = h[2]
-        points[len_points].handle_right = h[3]
-        points[0].handle_left = h[4]
-
-    half = round((len_points + 1) / 2) - 1
-
-    # Create guiding NURBS splines and add them to surfacedata
-    # (Detailed spline creation logic from your original file)
-    temp_splines_for_make_segment = []  # Store newly created splines to operate on later
-
-    surfacespline1 = surfacedata.splines.new(type="NURBS")
-    temp_splines_for_make_segment.append(surfacespline1)
-    surfacespline1.points.add(3)
-    surfacespline1.points[0].co = [points[0].co.x, points[0].co.y, points[0].co.z, 1]
-    surfacespline1.points[1].co = [
-        points[0].handle_left.x,
-        points[0].handle_left.y,
-        points[0].handle_left.z,
-        1,
-    ]
-    surfacespline1.points[2].co = [
-        points[len_points].handle_right.x,
-        points[len_points].handle_right.y,
-        points[len_points].handle_right.z,
-        1,
-    ]
-    surfacespline1.points[3].co = [
-        points[len_points].co.x,
-        points[len_points].co.y,
-        points[len_points].co.z,
-        1,
-    ]
-    for p_nurbs in surfacespline1.points:
-        p_nurbs.select = True
-    surfacespline1.use_endpoint_u = True
-    surfacespline1.use_endpoint_v = True
-
+# --- Control-Point Arrays ---
+def _bezier_point_arrays(bezier_points):
+    """Read co/handles of a Bezier spline into (N, 3) arrays in one pass each.
+
+    When the point count is odd the closing segment is split at t=0.5 (in the
+    arrays only, the source curve is left untouched) so the points pair up
+    across the outline.
+    """
+    n = len(bezier_points)
+    arrays = []
+    for attr in ("co", "handle_left", "handle_right"):
+        flat = np.empty(n * 3, dtype=np.float32)
+        bezier_points.foreach_get(attr, flat)
+        arrays.append(flat.reshape(n, 3).astype(np.float64))
+    co, hl, hr = arrays
+
+    if (n - 1) % 2 == 0:  # Ensure odd number of points for pairing algorithm
+        h = subdivide_cubic_bezier(co[-1], hr[-1], hl[0], co[0], 0.5)
+        hr[-1] = h[0]
+        hl[0] = h[4]
+        co = np.vstack((co, h[2]))
+        hl = np.vstack((hl, h[1]))
+        hr = np.vstack((hr, h[3]))
+    return co, hl, hr
+
+
+def surface_rows_from_bezier(co, hl, hr, center):
+    """Compute the guiding NURBS rows for one Bezier outline.
+
+    Each row spans the outline from one side to the paired point on the other
+    side. Returns an (R, 4, 4) float array of homogeneous control points.
+    """
+    last = len(co) - 1
+    half = round((last + 1) / 2) - 1
+    src = np.stack((co, hl, hr))
+    CO, HL, HR = 0, 1, 2
+
+    # (kind, index) pairs for the two ends of every straight row
+    ends = []
     for i in range(0, half):
+        inner = i + 1 <= half and last - i - 1 >= half + 1
         if center:
-            surfacespline2 = surfacedata.splines.new(type="NURBS")
-            temp_splines_for_make_segment.append(surfacespline2)
-            surfacespline2.points.add(3)
-            # ... (fill points as before) ...
-            surfacespline2.points[0].co = [
-                points[i].co.x,
-                points[i].co.y,
-                points[i].co.z,
-                1,
-            ]
-            surfacespline2.points[1].co = [
-                (points[i].co.x + points[len_points - i].co.x) / 2,
-                (points[i].co.y + points[len_points - i].co.y) / 2,
-                (points[i].co.z + points[len_points - i].co.z) / 2,
-                1,
-            ]
-            surfacespline2.points[2].co = [
-                (points[len_points - i].co.x + points[i].co.x) / 2,
-                (points[len_points - i].co.y + points[i].co.y) / 2,
-                (points[len_points - i].co.z + points[i].co.z) / 2,
-                1,
-            ]
-            surfacespline2.points[3].co = [
-                points[len_points - i].co.x,
-                points[len_points - i].co.y,
-                points[len_points - i].co.z,
-                1,
-            ]
-            for p_nurbs in surfacespline2.points:
-                p_nurbs.select = True
-            surfacespline2.use_endpoint_u = True
-            surfacespline2.use_endpoint_v = True
-
-        surfacespline3 = surfacedata.splines.new(type="NURBS")
-        temp_splines_for_make_segment.append(surfacespline3)
-        surfacespline3.points.add(3)
-        # ... (fill points as before) ...
-        surfacespline3.points[0].co = [
-            points[i].handle_right.x,
-            points[i].handle_right.y,
-            points[i].handle_right.z,
-            1,
-        ]
-        surfacespline3.points[1].co = [
-            (points[i].handle_right.x + points[len_points - i].handle_left.x) / 2,
-            (points[i].handle_right.y + points[len_points - i].handle_left.y) / 2,
-            (points[i].handle_right.z + points[len_points - i].handle_left.z) / 2,
-            1,
-        ]
-        surfacespline3.points[2].co = [
-            (points[len_points - i].handle_left.x + points[i].handle_right.x) / 2,
-            (points[len_points - i].handle_left.y + points[i].handle_right.y) / 2,
-            (points[len_points - i].handle_left.z + points[i].handle_right.z) / 2,
-            1,
-        ]
-        surfacespline3.points[3].co = [
-            points[len_points - i].handle_left.x,
-            points[len_points - i].handle_left.y,
-            points[len_points - i].handle_left.z,
-            1,
-        ]
-        for p_nurbs in surfacespline3.points:
-            p_nurbs.select = True
-        surfacespline3.use_endpoint_u = True
-        surfacespline3.use_endpoint_v = True
-
-        if i + 1 <= half and len_points - i - 1 >= half + 1:
-            surfacespline4 = surfacedata.splines.new(type="NURBS")
-            temp_splines_for_make_segment.append(surfacespline4)
-            surfacespline4.points.add(3)
-            # ... (fill points as before) ...
-            surfacespline4.points[0].co = [
-                points[i + 1].handle_left.x,
-                points[i + 1].handle_left.y,
-                points[i + 1].handle_left.z,
-                1,
-            ]
-            surfacespline4.points[1].co = [
-                (
-                    points[i + 1].handle_left.x
-                    + points[len_points - i - 1].handle_right.x
-                )
-                / 2,
-                (
-                    points[i + 1].handle_left.y
-                    + points[len_points - i - 1].handle_right.y
-                )
-                / 2,
-                (
-                    points[i + 1].handle_left.z
-                    + points[len_points - i - 1].handle_right.z
-                )
-                / 2,
-                1,
-            ]
-            surfacespline4.points[2].co = [
-                (
-                    points[len_points - i - 1].handle_right.x
-                    + points[i + 1].handle_left.x
-                )
-                / 2,
-                (
-                    points[len_points - i - 1].handle_right.y
-                    + points[i + 1].handle_left.y
-                )
-                / 2,
-                (
-                    points[len_points - i - 1].handle_right.z
-                    + points[i + 1].handle_left.z
-                )
-                / 2,
-                1,
-            ]
-            surfacespline4.points[3].co = [
-                points[len_points - i - 1].handle_right.x,
-                points[len_points - i - 1].handle_right.y,
-                points[len_points - i - 1].handle_right.z,
-                1,
-            ]
-            for p_nurbs in surfacespline4.points:
-                p_nurbs.select = True
-            surfacespline4.use_endpoint_u = True
-            surfacespline4.use_endpoint_v = True
+            ends.append((CO, i, CO, last - i))
+        ends.append((HR, i, HL, last - i))
+        if inner:
+            ends.append((HL, i + 1, HR, last - i - 1))
+        if center and inner:
+            ends.append((CO, i + 1, CO, last - i - 1))
+
+    rows = np.empty((len(ends) + 2, 4, 4), dtype=np.float64)
+    rows[..., 3] = 1.0
+
+    # Closing segment and middle segment keep their handles as inner points
+    rows[0, :, :3] = (co[0], hl[0], hr[last], co[last])
+    rows[-1, :, :3] = (co[half], hr[half], hl[half + 1], co[half + 1])
+
+    if ends:
+        idx = np.array(ends, dtype=np.int64)
+        a = src[idx[:, 0], idx[:, 1]]
+        b = src[idx[:, 2], idx[:, 3]]
+        mid = (a + b) * 0.5
+        rows[1:-1, 0, :3] = a
+        rows[1:-1, 1, :3] = mid
+        rows[1:-1, 2, :3] = mid
+        rows[1:-1, 3, :3] = b
+    return rows
 
-        if center:
-            if i + 1 <= half and len_points - i - 1 >= half + 1:
-                surfacespline5 = surfacedata.splines.new(type="NURBS")
-                temp_splines_for_make_segment.append(surfacespline5)
-                surfacespline5.points.add(3)
-                # ... (fill points as before) ...
-                surfacespline5.points[0].co = [
-                    points[i + 1].co.x,
-                    points[i + 1].co.y,
-                    points[i + 1].co.z,
-                    1,
-                ]
-                surfacespline5.points[1].co = [
-                    (points[i + 1].co.x + points[len_points - i - 1].co.x) / 2,
-                    (points[i + 1].co.y + points[len_points - i - 1].co.y) / 2,
-                    (points[i + 1].co.z + points[len_points - i - 1].co.z) / 2,
-                    1,
-                ]
-                surfacespline5.points[2].co = [
-                    (points[len_points - i - 1].co.x + points[i + 1].co.x) / 2,
-                    (points[len_points - i - 1].co.y + points[i + 1].co.y) / 2,
-                    (points[len_points - i - 1].co.z + points[i + 1].co.z) / 2,
-                    1,
-                ]
-                surfacespline5.points[3].co = [
-                    points[len_points - i - 1].co.x,
-                    points[len_points - i - 1].co.y,
-                    points[len_points - i - 1].co.z,
-                    1,
-                ]
-                for p_nurbs in surfacespline5.points:
-                    p_nurbs.select = True
-                surfacespline5.use_endpoint_u = True
-                surfacespline5.use_endpoint_v = True
-
-    surfacespline6 = surfacedata.splines.new(type="NURBS")
-    temp_splines_for_make_segment.append(surfacespline6)
-    surfacespline6.points.add(3)
-    surfacespline6.points[0].co = [
-        points[half].co.x,
-        points[half].co.y,
-        points[half].co.z,
-        1,
-    ]
-    surfacespline6.points[1].co = [
-        points[half].handle_right.x,
-        points[half].handle_right.y,
-        points[half].handle_right.z,
-        1,
-    ]
-    surfacespline6.points[2].co = [
-        points[half + 1].handle_left.x,
-        points[half + 1].handle_left.y,
-        points[half + 1].handle_left.z,
-        1,
-    ]
-    surfacespline6.points[3].co = [
-        points[half + 1].co.x,
-        points[half + 1].co.y,
-        points[half + 1].co.z,
-        1,
-    ]
-    for p_nurbs in surfacespline6.points:
-        p_nurbs.select = True
-    surfacespline6.use_endpoint_u = True
-    surfacespline6.use_endpoint_v = True
-
-    # Assumes context_ref.active_object is the surface object.
-    # The calling function (SP_OT_ConvertBezierToSurface.execute) ensures this.
+
+# --- Core Surface Conversion Function ---
+def build_surface_patch(surfacedata, rows):
+    """Create one surface patch from precomputed rows.
+
+    Must run with the surface object in edit mode: the rows are written with
+    bulk ``foreach_set`` and skinned by a single ``make_segment``, which is the
+    only API able to create a spline with more than one point row in V.
+    """
+    for spline in surfacedata.splines:
+        spline.points.foreach_set("select", [False] * len(spline.points))
+
+    for row in rows:
+        spline = surfacedata.splines.new(type="NURBS")
+        spline.points.add(3)
+        spline.points.foreach_set("co", row.ravel())
+        spline.points.foreach_set("select", [True] * 4)
+        spline.use_endpoint_u = True
+        spline.use_endpoint_v = True
+
+    bpy.ops.curve.make_segment()  # Skins all selected rows into one patch
+
+
+def surface_from_bezier(context_ref, surfacedata, bezier_points, center):
+    """Convert one Bezier spline into a NURBS surface patch.
+
+    Kept for callers converting a single spline; the operator batches all
+    splines through ``build_surface_patch`` inside one edit-mode session.
+    """
+    rows = surface_rows_from_bezier(*_bezier_point_arrays(bezier_points), center)
     original_mode = context_ref.active_object.mode
-    bpy.ops.object.mode_set(mode="EDIT")
-    bpy.ops.curve.make_segment()  # This skins the surface across the selected points of the new splines
-
-    # Set properties for the NURBS splines that constitute the surface patch
-    for s_nurbs in (
-        temp_splines_for_make_segment
-    ):  # Iterate over splines created in this function call
-        s_nurbs.resolution_u = 4  # Default U resolution for each patch segment
-        s_nurbs.resolution_v = 4  # Default V resolution for each patch segment
-        if hasattr(s_nurbs, "order_u"):
-            s_nurbs.order_u = 4
-            s_nurbs.order_v = 4
-        elif hasattr(s_nurbs, "degree_u"):
-            s_nurbs.degree_u = 3
-            s_nurbs.degree_v = 3
-        for p_nurbs in s_nurbs.points:  # Deselect points after operation
-            p_nurbs.select = False
-
-    if context_ref.active_object.mode != original_mode:  # Usually back to 'OBJECT'
+    if original_mode != "EDIT":
+        bpy.ops.object.mode_set(mode="EDIT")
+    build_surface_patch(surfacedata, rows)
+    if original_mode != "EDIT":
         bpy.ops.object.mode_set(mode=original_mode)
 
 
+def _finalize_surface_splines(surfacedata):
+    for spline in surfacedata.splines:
+        spline.resolution_u = 4  # Default U resolution for each patch segment
+        spline.resolution_v = 4  # Default V resolution for each patch segment
+        spline.use_endpoint_u = True
+        spline.use_endpoint_v = True
+        spline.points.foreach_set("select", [False] * len(spline.points))
+
+
+def snap_surface_to_shell(surfaceobject, shell_obj, depsgraph):
+    """Move every control point to the nearest point on ``shell_obj``.
+
+    Control points are read and written in bulk and conformed against the
+    cached world-space BVH of the evaluated shell.
+    """
+    mw = np.array(surfaceobject.matrix_world, dtype=np.float64)
+    to_local = np.linalg.inv(mw)
+    for spline in surfaceobject.data.splines:
+        count = len(spline.points)
+        co = np.empty(count * 4, dtype=np.float32)
+        spline.points.foreach_get("co", co)
+        co = co.reshape(count, 4)
+        world = co[:, :3] @ mw[:3, :3].T + mw[:3, 3]
+        world, hit = conform.conform_points(world, shell_obj, depsgraph=depsgraph)
+        co[hit, :3] = world[hit] @ to_local[:3, :3].T + to_local[:3, 3]
+        spline.points.foreach_set("co", co.ravel())
+
+
 # --- Operator Definition ---
 class SP_OT_ConvertBezierToSurface(bpy.types.Operator):
     bl_idname = "spp.convert_bezier_to_surface"
@@ -387,18 +253,19 @@ class SP_OT_ConvertBezierToSurface(bpy.types.Operator):
         # Ensure surfaceobject is active for surface_from_bezier operations
         bpy.context.view_layer.objects.active = surfaceobject
 
-        for spline in original_bezier_curvedata.splines:
-            if spline.type == "BEZIER":
-                surface_from_bezier(
-                    context, surfacedata, spline.bezier_points, self.center
-                )
-
-        # After loop, surfaceobject should be active. Set overall resolution.
-        bpy.context.view_layer.objects.active = surfaceobject  # Re-ensure
-        if (
-            context.active_object.mode != "OBJECT"
-        ):  # surface_from_bezier should leave it as it found it
-            bpy.ops.object.mode_set(mode="OBJECT")
+        # Compute every patch up front, then skin them in one edit-mode session
+        patches = [
+            surface_rows_from_bezier(
+                *_bezier_point_arrays(spline.bezier_points), self.center
+            )
+            for spline in original_bezier_curvedata.splines
+            if spline.type == "BEZIER" and len(spline.bezier_points) >= 2
+        ]
+        bpy.ops.object.mode_set(mode="EDIT")
+        for rows in patches:
+            build_surface_patch(surfacedata, rows)
+        bpy.ops.object.mode_set(mode="OBJECT")
+        _finalize_surface_splines(surfacedata)
 
         surfacedata.resolution_u = (
             self.Resolution_U
@@ -406,34 +273,16 @@ class SP_OT_ConvertBezierToSurface(bpy.types.Operator):
         surfacedata.resolution_v = self.Resolution_V
 
         # --- Snap surface to shell ---
-        # self.report({'INFO'}, f"Snapping {surfaceobject.name} to nearest surface.") # Report at the end
-        bpy.ops.object.select_all(action="DESELECT")
-        surfaceobject.select_set(True)
-        bpy.context.view_layer.objects.active = surfaceobject
-
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.curve.select_all(action="SELECT")
-        bpy.ops.transform.translate(
-            value=(0, 0, 0),
-            orient_type="GLOBAL",
-            orient_matrix=((1, 0, 0), (0, 1, 0), (0, 0, 1)),
-            orient_matrix_type="GLOBAL",
-            mirror=False,
-            use_proportional_edit=False,
-            proportional_edit_falloff="SMOOTH",
-            proportional_size=1,
-            use_proportional_connected=False,
-            use_proportional_projected=False,
-            snap=True,
-            snap_elements={"FACE_NEAREST"},
-            snap_target="CLOSEST",
-            use_snap_project=False,
-            use_snap_self=True,
-            use_snap_edit=True,
-            use_snap_nonedit=True,
-            use_snap_selectable=False,
-        )
-        bpy.ops.object.mode_set(mode="OBJECT")
+        shell_obj = getattr(context.scene, "spp_shell_object", None)
+        if shell_obj and shell_obj.type == "MESH":
+            snap_surface_to_shell(
+                surfaceobject, shell_obj, context.evaluated_depsgraph_get()
+            )
+        else:
+            bpy.ops.object.mode_set(mode="EDIT")
+            bpy.ops.curve.select_all(action="SELECT")
+            apply_surface_snap()
+            bpy.ops.object.mode_set(mode="OBJECT")
         # --- End of Snap surface to shell ---
 
         # --- Finalizing object: Naming, Collection, Hiding Input ---
@@ -36,8 +36,6 @@ class MESH_OT_CreateQuadPanelFromOutline(Operator):
             self.report({"ERROR"}, "An active Mesh outline object is required.")
             return {"CANCELLED"}
 
-        bpy.ops.ed.undo_push(message=self.bl_label)
-
         bpy.ops.object.select_all(action="DESELECT")
         original_outline_obj.select_set(True)
         context.view_layer.objects.active = original_outline_obj
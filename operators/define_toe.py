@@ -13,8 +13,6 @@ class OBJECT_OT_DefineToe(Operator):
         return True
 
     def execute(self, context):
-        bpy.ops.ed.undo_push(message="Define Toe Tip")
-
         # Get the 3D cursor position
         cursor_location = context.scene.cursor.location.copy()
 
@@ -49,8 +47,6 @@ class OBJECT_OT_DefineUpDirection(Operator):
         return True
 
     def execute(self, context):
-        bpy.ops.ed.undo_push(message="Define Up Direction")
-
         # Get the 3D cursor position
         cursor_location = context.scene.cursor.location.copy()
 
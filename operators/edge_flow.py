@@ -1,34 +1,36 @@
 import bmesh
 import bpy
-import mathutils
+import numpy as np
 
-
-def hermite_3d(p1, p2, p3, p4, mu, tension, bias):
-    def h1d(y0, y1, y2, y3, mu):
-        mu2 = mu * mu
-        mu3 = mu2 * mu
-        m0 = (y1 - y0) * (1 - tension) * 0.5 + (y2 - y1) * (1 - tension) * 0.5
-        m1 = (y2 - y1) * (1 - tension) * 0.5 + (y3 - y2) * (1 - tension) * 0.5
-        a0 = 2 * mu3 - 3 * mu2 + 1
-        a1 = mu3 - 2 * mu2 + mu
-        a2 = mu3 - mu2
-        a3 = -2 * mu3 + 3 * mu2
-        return a0 * y1 + a1 * m0 + a2 * m1 + a3 * y2
-
-    x = h1d(p1.x, p2.x, p3.x, p4.x, mu)
-    y = h1d(p1.y, p2.y, p3.y, p4.y, mu)
-    z = h1d(p1.z, p2.z, p3.z, p4.z, mu)
-    return mathutils.Vector((x, y, z))
-
-
-def blend_position(original, target, blend_factor):
-    return original.lerp(target, blend_factor)
+from ..core.edge_flow import blend_open_ends, flow, ordered_chains
 
 
 def is_boundary_vert(vert):
     return any(e.is_boundary for e in vert.link_edges)
 
 
+def ring_neighbours(vert, loop_edges):
+    """Return the two vertices across the quads on either side of the loop.
+
+    For a loop edge A-B and quads ABCD / BAEF this is (C, F) for B: the
+    neighbours of B along the ring direction. None when the vertex is on a
+    boundary or not surrounded by quads.
+    """
+    if is_boundary_vert(vert):
+        return None
+    for edge in vert.link_edges:
+        if edge not in loop_edges:
+            continue
+        for loop in edge.link_loops:
+            if loop.vert is vert or len(loop.face.verts) != 4:
+                continue
+            radial = loop.link_loop_radial_prev
+            if radial is loop or len(radial.face.verts) != 4:
+                continue
+            return loop.link_loop_next.link_loop_next.vert, radial.link_loop_prev.vert
+    return None
+
+
 class OBJECT_OT_set_edge_flow(bpy.types.Operator):
     bl_idname = "mesh.set_edge_flow"
     bl_label = "Set Edge Flow"
@@ -50,54 +52,48 @@ class OBJECT_OT_set_edge_flow(bpy.types.Operator):
             self.report({"WARNING"}, "No valid edges selected")
             return {"CANCELLED"}
 
-        original_positions = {
-            v.index: v.co.copy() for e in selected_edges for v in e.verts
-        }
-
-        for _ in range(self.iterations):
-            updated_positions = {}
-
-            for edge in selected_edges:
-                for loop in edge.link_loops:
-                    if not loop.face or len(loop.face.verts) != 4:
-                        continue
-                    try:
-                        ring1 = loop.link_loop_next.link_loop_next
-                        ring2 = loop.link_loop_radial_prev.link_loop_prev.link_loop_prev
-                        center = edge.other_vert(loop.vert)
-                        if is_boundary_vert(center):
-                            continue
-                        p2 = ring1.vert.co
-                        p3 = ring2.link_loop_radial_next.vert.co
-                        p1 = p2 - (p3 - p2)
-                        p4 = p3 - (p2 - p3)
-                        new_pos = hermite_3d(p1, p2, p3, p4, 0.5, -self.tension, 0)
-                        updated_positions[center.index] = new_pos
-                    except Exception:
-                        continue
-
-            for vidx, new_co in updated_positions.items():
-                bm.verts[vidx].co = new_co
-
-        # Apply blending near boundaries
-        for edge in selected_edges:
-            loop_verts = list(
-                dict.fromkeys([v for e in selected_edges for v in e.verts])
-            )
-            if len(loop_verts) < 2:
-                continue
-
-            for i, v in enumerate(loop_verts):
-                if i < self.blend_zone:
-                    blend = i / self.blend_zone
-                    bm.verts[v.index].co = blend_position(
-                        original_positions[v.index], v.co, blend
-                    )
-                elif i >= len(loop_verts) - self.blend_zone:
-                    blend = (len(loop_verts) - i - 1) / self.blend_zone
-                    bm.verts[v.index].co = blend_position(
-                        original_positions[v.index], v.co, blend
-                    )
+        # Ordered loops and the ring neighbours of each loop vertex, once
+        edge_set = set(selected_edges)
+        loops = ordered_chains(tuple(e.verts) for e in selected_edges)
+        slots = {}
+
+        def slot(v):
+            return slots.setdefault(v, len(slots))
+
+        loop_slots = []
+        centers, ring_a, ring_b = [], [], []
+        for verts, _is_cyclic in loops:
+            loop_slots.append(np.array([slot(v) for v in verts], dtype=np.int64))
+            for v in verts:
+                ring = ring_neighbours(v, edge_set)
+                if ring is None:
+                    continue
+                centers.append(slot(v))
+                ring_a.append(slot(ring[0]))
+                ring_b.append(slot(ring[1]))
+
+        vert_list = list(slots)
+        original = np.array([v.co for v in vert_list], dtype=np.float64)
+        centers = np.array(centers, dtype=np.int64)
+        ring_a = np.array(ring_a, dtype=np.int64)
+        ring_b = np.array(ring_b, dtype=np.int64)
+
+        positions = flow(
+            original, centers, ring_a, ring_b, self.tension, self.iterations
+        )
+
+        # Blend back toward the original shape near the ends of open loops
+        positions = blend_open_ends(
+            positions,
+            original,
+            [(idx, is_cyclic) for (_verts, is_cyclic), idx in zip(loops, loop_slots)],
+            self.blend_zone,
+        )
+
+        # Only loop vertices move; ring vertices are read-only
+        moved = np.unique(np.concatenate(loop_slots))
+        for i in moved:
+            vert_list[i].co = positions[i]
 
         bmesh.update_edit_mesh(obj.data, loop_triangles=True)
         self.report({"INFO"}, f"Edge Flow applied with {self.iterations} iterations")
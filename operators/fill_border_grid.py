@@ -34,9 +34,6 @@ class MESH_OT_FillBorderGrid(Operator):
         return obj and obj.type == "MESH" and obj.mode == "EDIT"
 
     def execute(self, context):
-        # Add undo checkpoint
-        bpy.ops.ed.undo_push(message="Fill Border with Grid")
-
         try:
             # Get the current selection mode
             select_mode = context.tool_settings.mesh_select_mode[:]
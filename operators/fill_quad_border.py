@@ -32,8 +32,6 @@ class MESH_OT_FillQuadBorder(bpy.types.Operator):
         return obj and obj.type == "MESH" and obj.mode == "EDIT"
 
     def execute(self, context):
-        bpy.ops.ed.undo_push(message="Fill Quad Border")
-
         original_mode = context.active_object.mode
         if original_mode != "EDIT":
             bpy.ops.object.mode_set(mode="EDIT")
@@ -7,11 +7,9 @@ class OBJECT_OT_GPToCurve(bpy.types.Operator):
     bl_idname = "object.gp_to_curve"
     bl_label = "GP To Curve"
     bl_description = "Convert a Grease Pencil stroke into a cyclic Bezier curve with automatic surface snapping"
+    bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context):
-        # Add undo checkpoint
-        bpy.ops.ed.undo_push(message="Convert GP to Curve")
-
         bpy.ops.object.gpto_simple_curve_convert()
         curve_obj = bpy.context.object
         curve_data = curve_obj.data
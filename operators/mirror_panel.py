@@ -2,6 +2,8 @@ import bpy
 from bpy.props import BoolProperty, EnumProperty
 from bpy.types import Operator
 
+from ..utils import conform, mirror_pair, profiling
+
 
 class OBJECT_OT_mirror_panel(Operator):
     bl_idname = "mesh.mirror_panel"
@@ -28,6 +30,15 @@ class OBJECT_OT_mirror_panel(Operator):
         default=True,
     )
 
+    symmetric_pair: BoolProperty(
+        name="Symmetric Pair",
+        description=(
+            "Create a separate mirrored twin that follows this panel: edits to "
+            "the panel re-conform only the matching twin vertices"
+        ),
+        default=False,
+    )
+
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
 
@@ -35,7 +46,10 @@ class OBJECT_OT_mirror_panel(Operator):
         layout = self.layout
         layout.prop(self, "mirror_axis", expand=True)
         layout.separator()
-        layout.prop(self, "apply_modifier")
+        layout.prop(self, "symmetric_pair")
+        row = layout.row()
+        row.enabled = not self.symmetric_pair
+        row.prop(self, "apply_modifier")
         shell = getattr(context.scene, "spp_shell_object", None)
         if shell and isinstance(shell, str):
             shell = bpy.data.objects.get(shell)
@@ -46,6 +60,7 @@ class OBJECT_OT_mirror_panel(Operator):
             layout.separator()
             layout.label(text="Warning: No shell object!", icon="ERROR")
 
+    @profiling.instrument
     def execute(self, context):
         obj = context.active_object
         if not obj or obj.type != "MESH":
@@ -57,6 +72,9 @@ class OBJECT_OT_mirror_panel(Operator):
         if shell and isinstance(shell, str):
             shell = bpy.data.objects.get(shell)
 
+        if self.symmetric_pair:
+            return self.execute_pair(context, obj, shell)
+
         # ensure object mode & active
         if obj.mode != "OBJECT":
             bpy.ops.object.mode_set(mode="OBJECT")
@@ -77,49 +95,122 @@ class OBJECT_OT_mirror_panel(Operator):
         mirror_mod.use_mirror_merge = True
         mirror_mod.merge_threshold = 0.001
 
-        # 2) add Shrinkwrap modifier (if shell)
-        shrink_mod = None
-        if shell and shell.type == "MESH":
-            shrink_mod = obj.modifiers.new(name="Shrinkwrap_Shell", type="SHRINKWRAP")
-            shrink_mod.target = shell
-            shrink_mod.wrap_method = "NEAREST_SURFACEPOINT"
-            shrink_mod.wrap_mode = "ON_SURFACE"
-            shrink_mod.offset = 0.001
+        has_shell = bool(shell and shell.type == "MESH")
 
-        # 3) apply modifiers in correct order (mirror first, then shrinkwrap) - only if requested
+        # 2) apply the mirror, then conform straight onto the shell BVH
         if self.apply_modifier:
-            to_apply = []
-            to_apply.append(mirror_mod)  # Mirror first
-            if shrink_mod:
-                to_apply.append(shrink_mod)  # Shrinkwrap second
-
-            for mod in to_apply:
+            try:
+                bpy.ops.object.modifier_apply(modifier=mirror_mod.name)
+            except Exception as e:
+                self.report({"WARNING"}, f"Failed to apply {mirror_mod.name}: {e}")
+            if has_shell:
                 try:
-                    bpy.ops.object.modifier_apply(modifier=mod.name)
+                    conform.conform_object(
+                        obj,
+                        shell,
+                        offset=0.001,
+                        depsgraph=context.evaluated_depsgraph_get(),
+                    )
                 except Exception as e:
-                    self.report({"WARNING"}, f"Failed to apply {mod.name}: {e}")
+                    self.report({"WARNING"}, f"Failed to conform to shell: {e}")
+                    has_shell = False
 
             self.report(
                 {"INFO"},
                 f"Applied mirror across {self.mirror_axis}-axis"
-                + (f" and shrink-wrapped to '{shell.name}'" if shrink_mod else ""),
+                + (f" and conformed to '{shell.name}'" if has_shell else ""),
             )
         else:
+            # Left live: keep a Shrinkwrap after the Mirror so both stay editable
+            if has_shell:
+                shrink_mod = obj.modifiers.new(
+                    name="Shrinkwrap_Shell", type="SHRINKWRAP"
+                )
+                shrink_mod.target = shell
+                shrink_mod.wrap_method = "NEAREST_SURFACEPOINT"
+                shrink_mod.wrap_mode = "ON_SURFACE"
+                shrink_mod.offset = 0.001
             self.report(
                 {"INFO"},
                 f"Added mirror modifier across {self.mirror_axis}-axis"
-                + (f" and shrinkwrap to '{shell.name}'" if shrink_mod else ""),
+                + (f" and shrinkwrap to '{shell.name}'" if has_shell else ""),
+            )
+
+        return {"FINISHED"}
+
+    def execute_pair(self, context, obj, shell):
+        if obj.spp_mirror_source is not None:
+            self.report({"ERROR"}, "This panel is already a mirrored twin")
+            return {"CANCELLED"}
+        if obj.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+        try:
+            twin = mirror_pair.create_twin(
+                obj,
+                axis=self.mirror_axis,
+                scene=context.scene,
+                depsgraph=context.evaluated_depsgraph_get(),
             )
+        except Exception as e:
+            self.report({"ERROR"}, f"Failed to create mirrored twin: {e}")
+            return {"CANCELLED"}
 
+        conformed = bool(shell and shell.type == "MESH")
+        self.report(
+            {"INFO"},
+            f"Created mirrored twin '{twin.name}' across {self.mirror_axis}-axis"
+            + (f", conformed to '{shell.name}'" if conformed else ""),
+        )
         return {"FINISHED"}
 
 
+class OBJECT_OT_sync_mirror_pair(Operator):
+    bl_idname = "mesh.sync_mirror_pair"
+    bl_label = "Sync Mirrored Twin"
+    bl_description = (
+        "Re-mirror and re-conform every vertex of the selected mirrored twins, "
+        "e.g. after the shell changed"
+    )
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        return any(
+            obj.type == "MESH"
+            and (obj.spp_mirror_source is not None or mirror_pair.twins_of(obj))
+            for obj in context.selected_objects
+        )
+
+    def execute(self, context):
+        twins = set()
+        for obj in context.selected_objects:
+            if obj.type != "MESH":
+                continue
+            if obj.spp_mirror_source is not None:
+                twins.add(obj)
+            twins.update(mirror_pair.twins_of(obj))
+
+        depsgraph = context.evaluated_depsgraph_get()
+        total = 0
+        for twin in twins:
+            total += mirror_pair.sync(
+                twin, full=True, scene=context.scene, depsgraph=depsgraph
+            )
+        self.report({"INFO"}, f"Synced {len(twins)} twin(s), {total} vertices")
+        return {"FINISHED"}
+
+
+classes = (OBJECT_OT_mirror_panel, OBJECT_OT_sync_mirror_pair)
+
+
 def register():
-    bpy.utils.register_class(OBJECT_OT_mirror_panel)
+    for cls in classes:
+        bpy.utils.register_class(cls)
 
 
 def unregister():
-    bpy.utils.unregister_class(OBJECT_OT_mirror_panel)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
 
 
 if __name__ == "__main__":
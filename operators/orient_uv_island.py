@@ -1,9 +1,9 @@
 import math
 
-import bmesh
 import bpy
+import numpy as np
 from bpy.types import Operator
-from mathutils import Vector
+from mathutils.kdtree import KDTree
 
 
 class OBJECT_OT_OrientUVIsland(Operator):
@@ -24,8 +24,6 @@ class OBJECT_OT_OrientUVIsland(Operator):
         )
 
     def execute(self, context):
-        bpy.ops.ed.undo_push(message="Orient UV Island")
-
         obj = context.active_object
         toe_marker = bpy.data.objects.get("Toe_Marker")
         direction_marker = bpy.data.objects.get("Toe_Direction_Marker")
@@ -62,54 +60,40 @@ class OBJECT_OT_OrientUVIsland(Operator):
         uv_layer = mesh.uv_layers.active
 
         try:
-            bm = bmesh.new()
-            bm.from_mesh(mesh)
-            uv_layer_bm = bm.loops.layers.uv.active
-            world_coords = [(v.index, obj.matrix_world @ v.co) for v in bm.verts]
-
-            toe_pos = toe_marker.location
-            direction_pos = direction_marker.location
-
-            toe_vertex_index = min(world_coords, key=lambda x: (x[1] - toe_pos).length)[
-                0
-            ]
-            direction_vertex_index = min(
-                world_coords, key=lambda x: (x[1] - direction_pos).length
-            )[0]
-
-            toe_uvs = []
-            direction_uvs = []
-
-            for face in bm.faces:
-                for loop in face.loops:
-                    if loop.vert.index == toe_vertex_index:
-                        toe_uvs.append(loop[uv_layer_bm].uv.copy())
-                    elif loop.vert.index == direction_vertex_index:
-                        direction_uvs.append(loop[uv_layer_bm].uv.copy())
-
-            if not toe_uvs:
+            # Nearest shell vertex to each marker, in world space
+            co = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+            mesh.vertices.foreach_get("co", co)
+            world = co.reshape(-1, 3) @ np.array(obj.matrix_world.to_3x3()).T
+            world += np.array(obj.matrix_world.translation)
+
+            tree = KDTree(len(world))
+            for index, position in enumerate(world):
+                tree.insert(position, index)
+            tree.balance()
+
+            toe_vertex_index = tree.find(toe_marker.location)[1]
+            direction_vertex_index = tree.find(direction_marker.location)[1]
+
+            loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+            mesh.loops.foreach_get("vertex_index", loop_verts)
+            uvs = np.empty(len(mesh.loops) * 2, dtype=np.float64)
+            uv_layer.data.foreach_get("uv", uvs)
+            uvs = uvs.reshape(-1, 2)
+
+            toe_uvs = uvs[loop_verts == toe_vertex_index]
+            direction_uvs = uvs[loop_verts == direction_vertex_index]
+
+            if not len(toe_uvs):
                 self.report({"ERROR"}, "Couldn't find UVs for toe marker vertex.")
-                bm.free()
-                bpy.ops.object.mode_set(mode=original_mode)
                 return {"CANCELLED"}
 
-            if not direction_uvs:
+            if not len(direction_uvs):
                 self.report({"ERROR"}, "Couldn't find UVs for direction marker vertex.")
-                bm.free()
-                bpy.ops.object.mode_set(mode=original_mode)
                 return {"CANCELLED"}
 
-            toe_uv = sum(toe_uvs, Vector((0, 0))) / len(toe_uvs)
-            direction_uv = sum(direction_uvs, Vector((0, 0))) / len(direction_uvs)
-
-            all_uvs = [
-                loop[uv_layer_bm].uv.copy() for face in bm.faces for loop in face.loops
-            ]
-            center = sum(all_uvs, Vector((0, 0))) / len(all_uvs)
-
-            uv_direction_vec = direction_uv - toe_uv
+            uv_direction_vec = direction_uvs.mean(axis=0) - toe_uvs.mean(axis=0)
 
-            current_angle = math.atan2(uv_direction_vec.y, uv_direction_vec.x)
+            current_angle = math.atan2(uv_direction_vec[1], uv_direction_vec[0])
             desired_angle = math.pi / 2
             rotation = (
                 desired_angle - current_angle + math.pi
@@ -117,80 +101,31 @@ class OBJECT_OT_OrientUVIsland(Operator):
 
             cos_a = math.cos(rotation)
             sin_a = math.sin(rotation)
-
-            for face in bm.faces:
-                for loop in face.loops:
-                    uv = loop[uv_layer_bm].uv
-                    offset = uv - center
-                    rotated = Vector(
-                        (
-                            offset.x * cos_a - offset.y * sin_a,
-                            offset.x * sin_a + offset.y * cos_a,
-                        )
-                    )
-                    loop[uv_layer_bm].uv = center + rotated
-
-            # Recalculate bounds after rotation
-            all_uvs = [
-                loop[uv_layer_bm].uv.copy() for face in bm.faces for loop in face.loops
-            ]
-            min_u = min(uv.x for uv in all_uvs)
-            max_u = max(uv.x for uv in all_uvs)
-            min_v = min(uv.y for uv in all_uvs)
-            max_v = max(uv.y for uv in all_uvs)
-
-            # Calculate current dimensions
-            width = max_u - min_u
-            height = max_v - min_v
-
-            # Calculate the center of the UV island
-            island_center = Vector(((min_u + max_u) / 2, (min_v + max_v) / 2))
-
-            # The toe UV position after rotation is already calculated
-            # We don't need to recalculate it since we're using the direction vector
-
-            # Center the UV island at (0.5, 0.5) first
-            center_target = Vector((0.5, 0.5))
-            translation_to_center = center_target - island_center
-
-            # Apply centering translation
-            for face in bm.faces:
-                for loop in face.loops:
-                    loop[uv_layer_bm].uv += translation_to_center
-
-            # Now maximize the scale to fill the UV space (similar to unwrap behavior)
-            # Recalculate bounds after centering
-            all_uvs_centered = [
-                loop[uv_layer_bm].uv.copy() for face in bm.faces for loop in face.loops
-            ]
-            min_u_centered = min(uv.x for uv in all_uvs_centered)
-            max_u_centered = max(uv.x for uv in all_uvs_centered)
-            min_v_centered = min(uv.y for uv in all_uvs_centered)
-            max_v_centered = max(uv.y for uv in all_uvs_centered)
-
-            # Calculate dimensions after centering
-            centered_width = max_u_centered - min_u_centered
-            centered_height = max_v_centered - min_v_centered
-
-            # Calculate scale to maximize UV space usage (like unwrap does)
+            rot = np.array(((cos_a, -sin_a), (sin_a, cos_a)))
+
+            # Bounds of the rotated island decide the centring and the scale.
+            # Rotating about the UV centroid only shifts the island, which the
+            # centring absorbs, so the rotation can be taken about the origin.
+            rotated = uvs @ rot.T
+            lo = rotated.min(axis=0)
+            hi = rotated.max(axis=0)
+            size = hi - lo
+            island_center = (lo + hi) / 2
+
+            # Maximize the scale to fill the UV space (similar to unwrap behavior)
             # Use a very small margin to match unwrap behavior
             margin = 0.001  # Same small margin as unwrap operation
             max_scale = min(
-                (1.0 - 2 * margin) / centered_width if centered_width > 0 else 1.0,
-                (1.0 - 2 * margin) / centered_height if centered_height > 0 else 1.0,
+                (1.0 - 2 * margin) / size[0] if size[0] > 0 else 1.0,
+                (1.0 - 2 * margin) / size[1] if size[1] > 0 else 1.0,
             )
 
-            # Apply maximizing scale around the center (0.5, 0.5)
-            for face in bm.faces:
-                for loop in face.loops:
-                    uv = loop[uv_layer_bm].uv
-                    # Scale around center to maximize UV space usage
-                    uv_from_center = uv - center_target
-                    uv_scaled = uv_from_center * max_scale
-                    loop[uv_layer_bm].uv = center_target + uv_scaled
-
-            # Apply changes to the mesh
-            bm.to_mesh(mesh)
+            # Rotate, centre at (0.5, 0.5) and scale as one affine transform
+            linear = rot * max_scale
+            offset = 0.5 - island_center * max_scale
+            uvs = uvs @ linear.T + offset
+
+            uv_layer.data.foreach_set("uv", uvs.astype(np.float32).ravel())
             mesh.update()
 
             # Clean up markers after successful orientation
@@ -205,10 +140,6 @@ class OBJECT_OT_OrientUVIsland(Operator):
             self.report({"ERROR"}, f"Error orienting UV island: {str(e)}")
             return {"CANCELLED"}
         finally:
-            # Clean up bmesh
-            if "bm" in locals():
-                bm.free()
-
             # Return to original mode
             bpy.ops.object.mode_set(mode=original_mode)
 
@@ -1,6 +1,8 @@
 import bpy
 from bpy.types import Operator
 
+from ..utils import conform, profiling
+
 
 class OBJECT_OT_quick_conform(Operator):
     bl_idname = "mesh.quick_conform"
@@ -8,6 +10,7 @@ class OBJECT_OT_quick_conform(Operator):
     bl_description = "Quickly snap the selected mesh to conform to the shell surface"
     bl_options = {"REGISTER", "UNDO"}
 
+    @profiling.instrument
     def execute(self, context):
         obj = context.active_object
         if not obj or obj.type != "MESH":
@@ -26,48 +29,19 @@ class OBJECT_OT_quick_conform(Operator):
             )
             return {"CANCELLED"}
 
-        # Store original mode
-        original_mode = obj.mode
-
         try:
-            # Ensure we're in object mode first
-            if obj.mode != "OBJECT":
-                bpy.ops.object.mode_set(mode="OBJECT")
-
-            # Make sure object is active and selected
-            context.view_layer.objects.active = obj
-            obj.select_set(True)
-
-            # Add shrinkwrap modifier temporarily
-            shrink_mod = obj.modifiers.new(name="QuickConform_Temp", type="SHRINKWRAP")
-            shrink_mod.target = shell
-            shrink_mod.wrap_method = "NEAREST_SURFACEPOINT"
-            shrink_mod.wrap_mode = "ON_SURFACE"
-            shrink_mod.offset = 0.0001  # Very small offset to prevent z-fighting
-
-            # Apply the modifier immediately
-            bpy.ops.object.modifier_apply(modifier=shrink_mod.name)
-
-            # Return to original mode if it was edit mode
-            if original_mode == "EDIT":
-                bpy.ops.object.mode_set(mode="EDIT")
-                # Select all vertices in edit mode
-                bpy.ops.mesh.select_all(action="SELECT")
-
-            self.report(
-                {"INFO"}, f"Quick conform applied - mesh conformed to '{shell.name}'"
+            # Works on the edit mesh directly, no mode switch needed
+            moved = conform.conform_object(
+                obj, shell, offset=0.0001, depsgraph=context.evaluated_depsgraph_get()
             )
-
         except Exception as e:
             self.report({"ERROR"}, f"Failed to apply quick conform: {e}")
-            # Try to restore original mode
-            try:
-                if original_mode != "OBJECT":
-                    bpy.ops.object.mode_set(mode=original_mode)
-            except Exception:
-                pass
             return {"CANCELLED"}
 
+        self.report(
+            {"INFO"},
+            f"Quick conform applied - {moved} vertices conformed to '{shell.name}'",
+        )
         return {"FINISHED"}
 
 
@@ -1,9 +1,164 @@
+import heapq
+import itertools
+
 import bmesh
 import bpy
+import numpy as np
 
+from ..core import collapse
+from ..utils import profiling
 from ..utils.panel_utils import apply_surface_snap
 
 
+# -------------------------------------------------------------------------
+# Quadric error metrics (see core.collapse)
+# -------------------------------------------------------------------------
+def _is_boundary_vert(v):
+    return any(e.is_wire or e.is_boundary for e in v.link_edges)
+
+
+def _build_quadrics(bm):
+    bm.verts.index_update()
+    co = np.array([v.co for v in bm.verts], dtype=np.float64).reshape(-1, 3)
+    loop_verts = np.array([v.index for f in bm.faces for v in f.verts], dtype=np.int64)
+    loop_total = np.array([len(f.verts) for f in bm.faces], dtype=np.int64)
+    loop_start = np.cumsum(loop_total) - loop_total
+    edges = np.array(
+        [(e.verts[0].index, e.verts[1].index) for e in bm.edges], dtype=np.int64
+    ).reshape(-1, 2)
+    q = collapse.vertex_quadrics(co, loop_verts, loop_start, loop_total, edges)
+    return {v: q[i] for i, v in enumerate(bm.verts)}
+
+
+def _collapse_target(edge, q, boundary, preserve_boundary):
+    """Return (cost, keep, remove, position) for collapsing ``edge``, or None
+    when the collapse would violate the boundary or manifold constraints."""
+    v1, v2 = edge.verts
+    b1, b2 = boundary[v1], boundary[v2]
+
+    if preserve_boundary and b1 and b2 and not (edge.is_wire or edge.is_boundary):
+        # Collapsing an interior edge between two boundary verts pinches the outline
+        return None
+
+    # Link condition: shared neighbours must only be those across the edge's faces
+    n1 = {e.other_vert(v1) for e in v1.link_edges}
+    n2 = {e.other_vert(v2) for e in v2.link_edges}
+    if len(n1 & n2) > len(edge.link_faces):
+        return None
+
+    if preserve_boundary and b1 != b2:
+        keep, remove = (v1, v2) if b1 else (v2, v1)
+        return collapse.quadric_error(q, keep.co), keep, remove, keep.co.copy()
+
+    p1, p2 = np.asarray(v1.co), np.asarray(v2.co)
+    best_cost, best_co = collapse.collapse_position(q, p1, p2)
+    # Keep the vertex nearest the new position so UVs/attributes drift least
+    d1, d2 = p1 - best_co, p2 - best_co
+    if d1 @ d1 <= d2 @ d2:
+        return best_cost, v1, v2, best_co
+    return best_cost, v2, v1, best_co
+
+
+def _qem_reduce(bm, target, preserve_boundary=True):
+    """Collapse edges in quadric-error order until ``bm`` has ``target`` verts.
+
+    A single priority queue drives the whole reduction; stale entries are
+    skipped via per-vertex version stamps rather than removed. Each collapse
+    removes exactly one vertex, so the target is reached exactly unless the
+    constraints leave no legal collapse.
+
+    Returns:
+        int: Number of vertices removed
+    """
+    if len(bm.verts) <= target:
+        return 0
+
+    quadrics = _build_quadrics(bm)
+    boundary = {v: _is_boundary_vert(v) for v in bm.verts}
+    version = {v: 0 for v in bm.verts}
+    counter = itertools.count()
+    heap = []
+
+    def push(edge):
+        v1, v2 = edge.verts
+        result = _collapse_target(
+            edge, quadrics[v1] + quadrics[v2], boundary, preserve_boundary
+        )
+        if result is None:
+            return
+        cost, keep, remove, co = result
+        # Tie-break on length so flat regions collapse their shortest edges first
+        cost += 1e-9 * (v1.co - v2.co).length_squared
+        heapq.heappush(
+            heap,
+            (cost, next(counter), keep, remove, version[keep], version[remove], co),
+        )
+
+    for edge in bm.edges:
+        push(edge)
+
+    removed = 0
+    remaining = len(bm.verts)
+    while heap and remaining > target:
+        _, _, keep, remove, ver_keep, ver_remove, co = heapq.heappop(heap)
+        if not (keep.is_valid and remove.is_valid):
+            continue
+        if version[keep] != ver_keep or version[remove] != ver_remove:
+            continue
+        edge = bm.edges.get((keep, remove))
+        if edge is None:
+            continue
+        # Neighbouring collapses may have changed the link condition since push
+        result = _collapse_target(
+            edge, quadrics[keep] + quadrics[remove], boundary, preserve_boundary
+        )
+        if result is None:
+            continue
+        _, keep, remove, co = result
+
+        keep.co = co
+        bmesh.ops.weld_verts(bm, targetmap={remove: keep})
+        quadrics[keep] = quadrics[keep] + quadrics.pop(remove)
+        # Popped first: ``or`` would skip the pop when keep is on the boundary
+        on_boundary = boundary.pop(remove)
+        boundary[keep] = boundary[keep] or on_boundary
+        version.pop(remove)
+        removed += 1
+        remaining -= 1
+
+        # Invalidate every queued edge touching the merged vertex
+        version[keep] += 1
+        for e in keep.link_edges:
+            push(e)
+
+    return removed
+
+
+def _reduce_to_count(bm, target):
+    """Reduce ``bm`` to exactly ``target`` verts, relaxing constraints last."""
+    removed = _qem_reduce(bm, target, preserve_boundary=True)
+    if len(bm.verts) > target:
+        removed += _qem_reduce(bm, target, preserve_boundary=False)
+    return removed
+
+
+def _open_bmesh(obj):
+    if obj.mode == "EDIT":
+        return bmesh.from_edit_mesh(obj.data)
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+    return bm
+
+
+def _write_bmesh(obj, bm):
+    if obj.mode == "EDIT":
+        bmesh.update_edit_mesh(obj.data, loop_triangles=True, destructive=True)
+    else:
+        bm.to_mesh(obj.data)
+        bm.free()
+        obj.data.update()
+
+
 def _collapse_shortest_edge_to_make_even(obj, context):
     if not obj or obj.type != "MESH":
         return False
@@ -11,86 +166,16 @@ def _collapse_shortest_edge_to_make_even(obj, context):
     if obj.mode != "EDIT" and len(obj.data.vertices) % 2 == 0:
         return False
 
-    original_mode = obj.mode
-    try:
+    bm = _open_bmesh(obj)
+    count = len(bm.verts)
+    if count % 2 == 0 or len(bm.edges) == 0:
         if obj.mode != "EDIT":
-            bpy.ops.object.mode_set(mode="EDIT")
-
-        me = obj.data
-        bm = bmesh.from_edit_mesh(me)
-
-        if len(bm.verts) % 2 == 0:
-            return False
-        if len(bm.edges) == 0:
-            return False
-
-        # Find shortest edge to minimally affect shape
-        shortest = None
-        shortest_len = 1e30
-        for edge in bm.edges:
-            edge_length = (edge.verts[0].co - edge.verts[1].co).length
-            if edge_length < shortest_len:
-                shortest_len = edge_length
-                shortest = edge
-        if not shortest:
-            return False
-
-        # Select only the two verts of the shortest edge
-        for v in bm.verts:
-            v.select = False
-        for v in shortest.verts:
-            v.select = True
-        bmesh.update_edit_mesh(me, loop_triangles=False, destructive=False)
-
-        # Ensure vertex select mode
-        try:
-            context.tool_settings.mesh_select_mode = (True, False, False)
-        except Exception:
-            pass
-
-        # Merge to center to collapse one vertex
-        bpy.ops.mesh.merge(type="CENTER")
-        bmesh.update_edit_mesh(me, loop_triangles=False, destructive=False)
-        return True
-    finally:
-        if original_mode != "EDIT":
-            try:
-                bpy.ops.object.mode_set(mode=original_mode)
-            except Exception:
-                pass
-
+            bm.free()
+        return False
 
-def _collapse_n_shortest_edges(obj, count):
-    if count <= 0:
-        return 0
-    if not obj or obj.type != "MESH":
-        return 0
-    # Ensure we're in edit mode; caller should manage this, but be safe
-    if obj.mode != "EDIT":
-        bpy.ops.object.mode_set(mode="EDIT")
-    me = obj.data
-    bm = bmesh.from_edit_mesh(me)
-    collapsed = 0
-    for _ in range(count):
-        if len(bm.edges) == 0:
-            break
-        # Find shortest edge
-        shortest = None
-        shortest_len = 1e30
-        for edge in bm.edges:
-            edge_length = (edge.verts[0].co - edge.verts[1].co).length
-            if edge_length < shortest_len:
-                shortest = edge
-                shortest_len = edge_length
-        if not shortest:
-            break
-        try:
-            bmesh.ops.collapse(bm, edges=[shortest])
-            collapsed += 1
-        except Exception:
-            break
-    bmesh.update_edit_mesh(me, loop_triangles=False, destructive=False)
-    return collapsed
+    changed = _reduce_to_count(bm, count - 1) > 0
+    _write_bmesh(obj, bm)
+    return changed
 
 
 class MESH_OT_MakeEvenVerts(bpy.types.Operator):
@@ -128,6 +213,12 @@ class OBJECT_OT_ReduceVerts(bpy.types.Operator):
         default=0.2,
     )
 
+    snap_to_surface: bpy.props.BoolProperty(
+        name="Snap to Surface",
+        description="Snap the reduced vertices back onto the nearest surface",
+        default=True,
+    )
+
     @classmethod
     def poll(cls, context):
         """Check if the operator can be executed.
@@ -140,85 +231,47 @@ class OBJECT_OT_ReduceVerts(bpy.types.Operator):
         """
         return context.active_object and context.active_object.type == "MESH"
 
+    @profiling.instrument
     def execute(self, context):
-        # Add undo checkpoint
-        bpy.ops.ed.undo_push(message="Reduce Vertices")
+        obj = context.active_object
+        if not obj or obj.type != "MESH":
+            self.report({"WARNING"}, "Active object is not a mesh")
+            return {"CANCELLED"}
 
+        original_mode = obj.mode
         try:
-            obj = context.active_object
-            if not obj or obj.type != "MESH":
-                self.report({"WARNING"}, "Active object is not a mesh")
-                return {"CANCELLED"}
-
-            # Store original mode and switch to object mode
-            original_mode = obj.mode
-            bpy.ops.object.mode_set(mode="OBJECT")
-            original_verts = len(obj.data.vertices)
+            bm = _open_bmesh(obj)
+            original_verts = len(bm.verts)
 
             # Calculate target vertex count and ensure it's even
             target_verts = int(original_verts * (1.0 - self.factor))
-            # Make sure target_verts is even
             if target_verts % 2 != 0:
                 target_verts -= 1  # Subtract 1 to make it even
 
-            if target_verts >= original_verts:
+            if target_verts >= original_verts or target_verts < 2:
+                if obj.mode != "EDIT":
+                    bm.free()
                 self.report(
                     {"WARNING"}, "Reduction factor too small to make any changes"
                 )
-                bpy.ops.object.mode_set(mode=original_mode)
                 return {"CANCELLED"}
 
-            # Go to Edit Mode and select all
-            bpy.ops.object.mode_set(mode="EDIT")
-            bpy.ops.mesh.select_all(action="SELECT")
+            # Single quadric-error pass straight to the (even) target count
+            _reduce_to_count(bm, target_verts)
+            current_verts = len(bm.verts)
+            _write_bmesh(obj, bm)
 
-            # Try increasing dissolve angles until desired reduction
-            current_verts = original_verts
-            for angle in [0.01, 0.05, 0.1, 0.2, 0.4, 0.8]:
-                bpy.ops.mesh.dissolve_limited(angle_limit=angle)
-                bpy.ops.object.mode_set(mode="OBJECT")
-                current_verts = len(obj.data.vertices)
-
-                if current_verts <= target_verts:
-                    break
-
-                if current_verts > target_verts:
+            if self.snap_to_surface:
+                if obj.mode != "EDIT":
                     bpy.ops.object.mode_set(mode="EDIT")
+                bpy.ops.mesh.select_all(action="SELECT")
+                try:
+                    apply_surface_snap()
+                except Exception as e:
+                    self.report({"WARNING"}, f"Could not apply surface snap: {str(e)}")
+                if original_mode != "EDIT":
+                    bpy.ops.object.mode_set(mode=original_mode)
 
-            # If we're still above target, collapse the shortest edges to hit it exactly
-            if current_verts > target_verts:
-                bpy.ops.object.mode_set(mode="EDIT")
-                _collapse_n_shortest_edges(obj, current_verts - target_verts)
-                bpy.ops.object.mode_set(mode="OBJECT")
-                current_verts = len(obj.data.vertices)
-
-            # Ensure we're in edit mode for Loop Tools
-            bpy.ops.object.mode_set(mode="EDIT")
-
-            # Run Loop Tools Space operator
-            try:
-                bpy.ops.mesh.looptools_space()
-            except Exception as e:
-                self.report(
-                    {"WARNING"},
-                    f"Could not run Loop Tools Space operator: {str(e)}. Make sure Loop Tools is enabled.",
-                )
-
-            # Apply surface snap
-            try:
-                apply_surface_snap()
-            except Exception as e:
-                self.report({"WARNING"}, f"Could not apply surface snap: {str(e)}")
-
-            # Enforce even vertex count at the end (safety)
-            bpy.ops.object.mode_set(mode="OBJECT")
-            _collapse_shortest_edge_to_make_even(obj, context)
-
-            # Restore original mode
-            bpy.ops.object.mode_set(mode=original_mode)
-
-            # Recompute current vert count for accurate reporting
-            current_verts = len(obj.data.vertices)
             reduction_percent = (
                 (original_verts - current_verts) / original_verts
             ) * 100
@@ -232,7 +285,8 @@ class OBJECT_OT_ReduceVerts(bpy.types.Operator):
             self.report({"ERROR"}, f"Error reducing vertices: {str(e)}")
             # Try to restore original mode
             try:
-                bpy.ops.object.mode_set(mode=original_mode)
+                if obj.mode != original_mode:
+                    bpy.ops.object.mode_set(mode=original_mode)
             except Exception:
                 pass
             return {"CANCELLED"}
@@ -1,11 +1,42 @@
 # Blender 4.4+ — Profile Projection: Auto Clone Transfer (Tester, simplified)
 # Run in Scripting (Alt+P). N-panel: View3D > "ProfileProj"
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import bpy
+import numpy as np
 from bpy.types import Operator, PropertyGroup
-from bpy.props import StringProperty, EnumProperty, PointerProperty
+from bpy.props import (
+    BoolProperty,
+    CollectionProperty,
+    EnumProperty,
+    FloatVectorProperty,
+    IntProperty,
+    PointerProperty,
+    StringProperty,
+)
 from mathutils import Vector
-from bpy_extras import view3d_utils
+from mathutils.bvhtree import BVHTree
+
+from ..utils import image_registry
+
+# Destination tile edge in pixels; bounds per-worker scratch memory
+TILE_SIZE = 256
+MAX_WORKERS = 8
+# Exponent on the facing cosine; higher values favour head-on views harder
+FACING_POWER = 2.0
+
+# Registered reference views and their default object-space view direction
+VIEW_SIDES = {
+    "LATERAL": ("Lateral", (1.0, 0.0, 0.0)),
+    "MEDIAL": ("Medial", (-1.0, 0.0, 0.0)),
+    "TOP": ("Top", (0.0, 0.0, 1.0)),
+    "TOE": ("Toe", (0.0, -1.0, 0.0)),
+}
+
+# (object name, view side) -> (mesh/direction signature, visibility array)
+_visibility_cache = {}
 
 
 # -------------------------
@@ -17,16 +48,7 @@ def get_shell(context):
 
 
 def load_or_get_image(path):
-    if not path:
-        return None
-    abspath = bpy.path.abspath(path)
-    for img in bpy.data.images:
-        try:
-            if img.filepath and bpy.path.abspath(img.filepath) == abspath:
-                return img
-        except Exception:
-            pass
-    return bpy.data.images.load(abspath)
+    return image_registry.get_image(path)
 
 
 def ensure_uv_layer(obj, name):
@@ -127,126 +149,380 @@ def ensure_reference_material_on_main_uv(obj, baked_image, main_uv_name):
     return mat
 
 
-def find_view3d_area_region():
-    for area in bpy.context.window.screen.areas:
-        if area.type == "VIEW_3D":
-            for region in area.regions:
-                if region.type == "WINDOW":
-                    for space in area.spaces:
-                        if space.type == "VIEW_3D":
-                            return area, region, space
-    return None, None, None
-
-
-def obj_screen_bounds(obj, area, region, space):
-    coords = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-    xs, ys = [], []
-    for co in coords:
-        p = view3d_utils.location_3d_to_region_2d(region, space.region_3d, co)
-        if p is not None:
-            xs.append(p.x)
-            ys.append(p.y)
-    if not xs or not ys:
-        return None
-    return (min(xs), min(ys)), (max(xs), max(ys))
-
-
-def build_stroke_line(x0, y, x1, steps, size_px, pressure=1.0):
-    pts = []
-    if steps < 2:
-        steps = 2
-    dx = (x1 - x0) / (steps - 1)
-    for i in range(steps):
-        x = x0 + i * dx
-        pts.append(
-            {
-                "name": "stroke",
-                "mouse": (x, y),
-                "mouse_event": (x, y),
-                "is_start": (i == 0),
-                "pen_flip": False,
-                "pressure": pressure,
-                "size": size_px,
-                "time": 0.0,
-            }
+def _image_pixels(img):
+    """Return the pixels of ``img`` as an (H, W, 4) float32 array."""
+    width, height = img.size
+    buf = np.empty(width * height * 4, dtype=np.float32)
+    img.pixels.foreach_get(buf)
+    return buf.reshape(height, width, 4)
+
+
+def _triangle_uvs(mesh, uv_name):
+    """Return (T, 3, 2) UV coordinates of every loop triangle for ``uv_name``."""
+    mesh.calc_loop_triangles()
+    tris = mesh.loop_triangles
+    loops = np.empty(len(tris) * 3, dtype=np.int32)
+    tris.foreach_get("loops", loops)
+    uv = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    mesh.uv_layers[uv_name].data.foreach_get("uv", uv)
+    return uv.reshape(-1, 2)[loops].reshape(-1, 3, 2)
+
+
+def sample_bilinear(pixels, uv):
+    """Bilinearly sample ``pixels`` (H, W, C) at ``uv`` (N, 2), clamped to edge."""
+    height, width = pixels.shape[:2]
+    x = uv[:, 0] * width - 0.5
+    y = uv[:, 1] * height - 0.5
+    x0 = np.floor(x)
+    y0 = np.floor(y)
+    fx = (x - x0)[:, None]
+    fy = (y - y0)[:, None]
+    x0 = x0.astype(np.int64)
+    y0 = y0.astype(np.int64)
+    x1 = np.clip(x0 + 1, 0, width - 1)
+    y1 = np.clip(y0 + 1, 0, height - 1)
+    x0 = np.clip(x0, 0, width - 1)
+    y0 = np.clip(y0, 0, height - 1)
+    top = pixels[y0, x0] * (1.0 - fx) + pixels[y0, x1] * fx
+    bottom = pixels[y1, x0] * (1.0 - fx) + pixels[y1, x1] * fx
+    return top * (1.0 - fy) + bottom * fy
+
+
+def rasterize_uv_transfer(
+    px_tris, src_tris, source, accum, weight_sum, origin=(0, 0), corner_weights=None
+):
+    """Accumulate ``source`` texels into ``accum`` through paired UV triangles.
+
+    Every texel centre of ``accum`` that falls inside a triangle of
+    ``px_tris`` (main UV, in destination pixels) is mapped by its
+    barycentrics into the matching triangle of ``src_tris`` (projection UV)
+    and sampled from ``source``. Texels whose projection lands outside the
+    source image get no contribution.
+
+    Args:
+        px_tris: (T, 3, 2) destination triangles in pixel coordinates
+        src_tris: (T, 3, 2) source UVs
+        source: (H, W, 4) source pixels
+        accum: (h, w, 4) weighted colour sum, added to in place
+        weight_sum: (h, w) weight sum, added to in place
+        origin: (x, y) pixel position of ``accum[0, 0]`` in the destination
+        corner_weights: optional (T, 3) weights interpolated across each
+            triangle; every texel weighs 1 when None
+    """
+    height, width = accum.shape[:2]
+    ox, oy = origin
+    eps = 1e-6
+
+    for t in range(len(px_tris)):
+        if corner_weights is not None and corner_weights[t].max() <= 0.0:
+            continue
+        a, b, c = px_tris[t].astype(np.float64)
+        v0 = b - a
+        v1 = c - a
+        denom = v0[0] * v1[1] - v1[0] * v0[1]
+        if abs(denom) < 1e-12:
+            continue
+
+        lo = np.floor(np.minimum(np.minimum(a, b), c) - 0.5).astype(int)
+        hi = np.ceil(np.maximum(np.maximum(a, b), c) - 0.5).astype(int)
+        x0, y0 = max(lo[0], ox), max(lo[1], oy)
+        x1, y1 = min(hi[0], ox + width - 1), min(hi[1], oy + height - 1)
+        if x0 > x1 or y0 > y1:
+            continue
+
+        xs, ys = np.meshgrid(
+            np.arange(x0, x1 + 1) + 0.5 - a[0], np.arange(y0, y1 + 1) + 0.5 - a[1]
         )
-    return pts
+        l1 = (xs * v1[1] - v1[0] * ys) / denom
+        l2 = (v0[0] * ys - xs * v0[1]) / denom
+        l0 = 1.0 - l1 - l2
+        inside = (l0 >= -eps) & (l1 >= -eps) & (l2 >= -eps)
+        if not inside.any():
+            continue
+
+        bary = np.stack((l0[inside], l1[inside], l2[inside]), axis=1)
+        uv = bary @ src_tris[t]
+        keep = (uv >= 0.0).all(axis=1) & (uv <= 1.0).all(axis=1)
+        if corner_weights is None:
+            weights = np.ones(len(uv), dtype=np.float32)
+        else:
+            weights = np.clip(bary @ corner_weights[t], 0.0, None)
+            keep &= weights > 0.0
+        if not keep.any():
+            continue
+
+        rows, cols = np.nonzero(inside)
+        rows = rows[keep] + (y0 - oy)
+        cols = cols[keep] + (x0 - ox)
+        weights = weights[keep]
+        accum[rows, cols] += sample_bilinear(source, uv[keep]) * weights[:, None]
+        weight_sum[rows, cols] += weights
+
+
+def build_tile_index(px_tris, width, height, tile_size, pad=0):
+    """Bucket triangles by the destination tiles their bounding box touches.
+
+    Args:
+        px_tris: (T, 3, 2) triangles in destination pixel coordinates
+        pad: pixels added around each bounding box (seam bleed margin)
+
+    Returns:
+        dict: ``(tile_x, tile_y) -> int array`` of triangle indices
+    """
+    tiles_x = (width + tile_size - 1) // tile_size
+    tiles_y = (height + tile_size - 1) // tile_size
+    lo = np.floor(px_tris.min(axis=1) - 0.5 - pad).astype(np.int64) // tile_size
+    hi = np.ceil(px_tris.max(axis=1) - 0.5 + pad).astype(np.int64) // tile_size
+    valid = (
+        (hi[:, 0] >= 0) & (hi[:, 1] >= 0) & (lo[:, 0] < tiles_x) & (lo[:, 1] < tiles_y)
+    )
+    lo = np.maximum(lo, 0)
+    hi = np.minimum(hi, (tiles_x - 1, tiles_y - 1))
+
+    buckets = {}
+    for t in np.nonzero(valid)[0]:
+        for ty in range(lo[t, 1], hi[t, 1] + 1):
+            for tx in range(lo[t, 0], hi[t, 0] + 1):
+                buckets.setdefault((tx, ty), []).append(t)
+    return {key: np.asarray(ids) for key, ids in buckets.items()}
+
+
+def bleed_seams(out, covered, margin):
+    """Extend written texels ``margin`` pixels outward to hide UV seams."""
+    height, width = covered.shape
+    for _ in range(margin):
+        grown = covered.copy()
+        for dy, dx in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+            # Texel (y, x) takes its neighbour (y - dy, x - dx) when that is set
+            dst = (
+                slice(max(dy, 0), height + min(dy, 0)),
+                slice(max(dx, 0), width + min(dx, 0)),
+            )
+            src = (
+                slice(max(-dy, 0), height + min(-dy, 0)),
+                slice(max(-dx, 0), width + min(-dx, 0)),
+            )
+            fill = covered[src] & ~grown[dst]
+            if fill.any():
+                out[dst][fill] = out[src][fill]
+                grown[dst] |= fill
+        covered = grown
+    return covered
+
+
+def _transfer_tile(rect, tri_ids, px_tris, layers, out, margin):
+    """Rasterize, merge and bleed one tile, then write its interior into ``out``.
+
+    The tile is processed with a ``margin`` halo so the seam bleed matches a
+    full-image pass. Scratch memory is bounded by the tile size.
+    """
+    x0, y0, x1, y1 = rect
+    height, width = out.shape[:2]
+    hx0, hy0 = max(x0 - margin, 0), max(y0 - margin, 0)
+    hx1, hy1 = min(x1 + margin, width), min(y1 + margin, height)
+
+    tile = np.zeros((hy1 - hy0, hx1 - hx0, 4), dtype=np.float32)
+    weight_sum = np.zeros(tile.shape[:2], dtype=np.float32)
+    for src_tris, source, corner_weights in layers:
+        rasterize_uv_transfer(
+            px_tris[tri_ids],
+            src_tris[tri_ids],
+            source,
+            tile,
+            weight_sum,
+            (hx0, hy0),
+            None if corner_weights is None else corner_weights[tri_ids],
+        )
+    covered = weight_sum > 0.0
+    tile[covered] /= weight_sum[covered][:, None]
 
+    interior = (slice(y0 - hy0, y1 - hy0), slice(x0 - hx0, x1 - hx0))
+    written = int(covered[interior].sum())
+    if margin:
+        bleed_seams(tile, covered, margin)
+    # Tiles never overlap, so workers can write their interiors concurrently
+    out[y0:y1, x0:x1] = tile[interior]
+    return written
 
-def set_clone_context(
-    obj, src_img, proj_uv_name, main_uv_name, dest_img, brush_size=60, strength=1.0
-):
-    # Activate Texture Paint mode
-    try:
-        bpy.ops.object.mode_set(mode="TEXTURE_PAINT")
-    except Exception:
-        pass
 
-    me = obj.data
-    # Set active UV to main UV (for painting)
-    if me.uv_layers.get(main_uv_name):
-        me.uv_layers.active = me.uv_layers.get(main_uv_name)
-    # Set clone UV to projection UV
-    for uv in me.uv_layers:
-        uv.active_clone = uv.name == proj_uv_name
-
-    # Tool settings → Single Image mode targeting "Projected Design"
-    ts = bpy.context.scene.tool_settings
-    ip = ts.image_paint
-    ip.mode = "IMAGE"  # <-- Single Image mode
-    ip.canvas = dest_img  # <-- Texture Slot image = Projected Design
-    ip.seam_bleed = 2
-
-    # Switch to Clone tool (minimal override to avoid context errors)
-    area, region, space = find_view3d_area_region()
-    if area and region:
-        override = {"area": area}
-        try:
-            bpy.ops.wm.tool_set_by_id(override, name="builtin.clone")
-        except Exception:
-            pass
-
-    # Configure clone settings using correct API paths
-    # Set clone image on image paint settings (not brush)
-    if hasattr(ip, "clone_image"):
-        ip.clone_image = src_img  # Clone Image = 2D profile image
-
-    # Enable Clone From Paint Slot
-    if hasattr(ip, "use_clone_layer"):
-        ip.use_clone_layer = True  # Clone From Paint Slot = True
-
-    # Find or create clone brush and set it active
-    clone_brush = None
-    for brush in bpy.data.brushes:
-        if brush.image_tool == "CLONE":
-            clone_brush = brush
-            break
-
-    if not clone_brush:
-        try:
-            clone_brush = bpy.data.brushes.new("SPP_Clone", mode="TEXTURE_PAINT")
-            clone_brush.image_tool = "CLONE"
-        except Exception:
-            pass
-
-    if clone_brush:
-        # Configure basic brush settings
-        clone_brush.strength = strength
-        clone_brush.size = brush_size
-
-    return clone_brush
+def transfer_views(
+    obj, dest_img, main_uv, views, margin=2, tile_size=TILE_SIZE, workers=None
+):
+    """Merge one or more projected images into ``dest_img`` on ``main_uv``.
+
+    Runs entirely on pixel buffers, so it needs no 3D view and covers every
+    face of the mesh in one pass. The destination is processed in fixed-size
+    tiles, each rasterizing only the triangles its bounding-box index lists,
+    on a pool of worker threads. Besides the source pixels and the one
+    destination buffer ``foreach_set`` needs, memory stays at one tile per
+    worker regardless of the output size.
+
+    Args:
+        views: ``(projection UV name, source image, corner weights)`` tuples;
+            overlapping views are blended by their (T, 3) loop-triangle
+            corner weights, or equally when the weights are None
+
+    Returns:
+        int: number of destination texels written
+    """
+    mesh = obj.data
+    width, height = dest_img.size
+    scale = np.array((width, height), dtype=np.float32)
+    px_tris = _triangle_uvs(mesh, main_uv) * scale
+    layers = [
+        (_triangle_uvs(mesh, proj_uv), _image_pixels(src_img), corner_weights)
+        for proj_uv, src_img, corner_weights in views
+    ]
+
+    out = np.zeros((height, width, 4), dtype=np.float32)
+    index = build_tile_index(px_tris, width, height, tile_size, pad=margin)
+    jobs = [
+        (
+            (
+                tx * tile_size,
+                ty * tile_size,
+                min((tx + 1) * tile_size, width),
+                min((ty + 1) * tile_size, height),
+            ),
+            tri_ids,
+        )
+        for (tx, ty), tri_ids in index.items()
+    ]
+
+    def run(job):
+        rect, tri_ids = job
+        return _transfer_tile(rect, tri_ids, px_tris, layers, out, margin)
+
+    workers = workers or min(MAX_WORKERS, os.cpu_count() or 1)
+    if workers > 1 and len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            written = sum(pool.map(run, jobs))
+    else:
+        written = sum(map(run, jobs))
+
+    dest_img.pixels.foreach_set(out.ravel())
+    dest_img.update()
+    return written
+
+
+def transfer_projection(obj, src_img, dest_img, proj_uv, main_uv, **kwargs):
+    """Transfer ``src_img`` seen through ``proj_uv`` into ``dest_img``."""
+    return transfer_views(obj, dest_img, main_uv, [(proj_uv, src_img, None)], **kwargs)
+
+
+def _triangle_vertices(mesh):
+    """Return (co (V, 3), loop-triangle vertex indices (T, 3))."""
+    mesh.calc_loop_triangles()
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    tri_verts = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", tri_verts)
+    return co.reshape(-1, 3), tri_verts.reshape(-1, 3)
+
+
+def facing_weights(mesh, direction):
+    """Return (T, 3) facing weights of the loop-triangle corners.
+
+    The weight is the cosine between the corner normal and ``direction``
+    (object space, pointing at the viewer) raised to ``FACING_POWER``, so
+    surfaces seen at grazing angles fade out of the blend.
+    """
+    mesh.calc_loop_triangles()
+    normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+    mesh.corner_normals.foreach_get("vector", normals)
+    loops = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("loops", loops)
+    d = np.array(direction, dtype=np.float32)
+    d /= max(np.linalg.norm(d), 1e-12)
+    facing = normals.reshape(-1, 3)[loops] @ d
+    return np.clip(facing, 0.0, None).reshape(-1, 3) ** FACING_POWER
+
+
+def view_visibility(obj, key, direction, candidates=None):
+    """Return the visible fraction (T,) of each loop triangle from ``direction``.
+
+    Rays are cast toward the viewer from the centroid and three inset corners
+    of every triangle; the fraction that escape the mesh is the visibility.
+    Results are cached per ``key`` and reused until the mesh or the view
+    direction changes.
+
+    Args:
+        candidates: optional bool mask of triangles worth testing; the rest
+            are reported as hidden
+    """
+    co, tri_verts = _triangle_vertices(obj.data)
+    d = Vector(direction).normalized()
+    signature = (
+        hash(co.tobytes()),
+        hash(tri_verts.tobytes()),
+        tuple(round(x, 5) for x in d),
+    )
+    cached = _visibility_cache.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    pts = co[tri_verts]
+    centroids = pts.mean(axis=1, keepdims=True)
+    samples = np.concatenate((centroids, pts + (centroids - pts) * 0.5), axis=1)
+    offset = d * (float(np.ptp(co, axis=0).max()) * 1e-4 if len(co) else 0.0)
+
+    bvh = BVHTree.FromPolygons(co.tolist(), tri_verts.tolist())
+    visibility = np.zeros(len(tri_verts), dtype=np.float32)
+    test = range(len(tri_verts)) if candidates is None else np.nonzero(candidates)[0]
+    for t in test:
+        escaped = 0
+        for p in samples[t]:
+            if bvh.ray_cast(Vector(p) + offset, d)[0] is None:
+                escaped += 1
+        visibility[t] = escaped / len(samples[t])
+
+    _visibility_cache[key] = (signature, visibility)
+    return visibility
+
+
+def view_corner_weights(obj, view):
+    """Blend weights (T, 3) of ``view``: facing angle times visibility."""
+    weights = facing_weights(obj.data, view.direction)
+    visibility = view_visibility(
+        obj, (obj.name, view.side), view.direction, weights.max(axis=1) > 0.0
+    )
+    return weights * visibility[:, None]
 
 
 # -------------------------
 # Properties & UI
 # -------------------------
+class ProfileProjView(PropertyGroup):
+    side: EnumProperty(
+        name="Side",
+        items=[(key, label, "") for key, (label, _dir) in VIEW_SIDES.items()],
+        default="LATERAL",
+    )
+    enabled: BoolProperty(name="Use", default=True)
+    image_path: StringProperty(name="Image", subtype="FILE_PATH")
+    projection_uv: StringProperty(name="Projection UV", default="Projection")
+    direction: FloatVectorProperty(
+        name="View Direction",
+        description="Object-space direction toward the viewer, set by Project From View",
+        size=3,
+        subtype="DIRECTION",
+        default=(1.0, 0.0, 0.0),
+    )
+
+
 class ProfileProjProps(PropertyGroup):
+    views: CollectionProperty(type=ProfileProjView)
     image_path: StringProperty(name="2D Profile Image", subtype="FILE_PATH")
     projection_uv: StringProperty(name="Projection UV", default="Projection")
     main_uv: StringProperty(name="Main UV", default="UV Mesh")
     dest_size: EnumProperty(
         name="Dest Size",
-        items=[("1024", "1K", ""), ("2048", "2K", ""), ("4096", "4K", "")],
+        items=[
+            ("1024", "1K", ""),
+            ("2048", "2K", ""),
+            ("4096", "4K", ""),
+            ("8192", "8K", ""),
+        ],
         default="2048",
     )
 
@@ -259,18 +535,34 @@ class PP_OT_CreateProjectionUV(Operator):
     bl_label = "1. Create 'Projection' UV + From View"
     bl_options = {"REGISTER", "UNDO"}
 
+    view_index: IntProperty(
+        name="View",
+        description="Registered view to project; -1 uses the single projection settings",
+        default=-1,
+        options={"SKIP_SAVE"},
+    )
+
     def execute(self, context):
         props = context.scene.profile_proj
         obj = get_shell(context)
         if not obj:
             self.report({"ERROR"}, "Select a mesh object")
             return {"CANCELLED"}
-        if not props.image_path:
+
+        view = None
+        if self.view_index >= 0:
+            if self.view_index >= len(props.views):
+                self.report({"ERROR"}, "Unknown projection view")
+                return {"CANCELLED"}
+            view = props.views[self.view_index]
+        image_path = view.image_path if view else props.image_path
+        projection_uv = view.projection_uv if view else props.projection_uv
+        if not image_path:
             self.report({"ERROR"}, "Pick your 2D profile image")
             return {"CANCELLED"}
 
         # Show the image in UV editor so the user can align
-        img = load_or_get_image(props.image_path)
+        img = load_or_get_image(image_path)
         for area in bpy.context.window.screen.areas:
             if area.type == "IMAGE_EDITOR":
                 for space in area.spaces:
@@ -278,12 +570,19 @@ class PP_OT_CreateProjectionUV(Operator):
                         space.image = img
 
         # Create/activate Projection UV and Project From View (use current view)
-        ensure_uv_layer(obj, props.projection_uv)
+        ensure_uv_layer(obj, projection_uv)
         bpy.ops.object.mode_set(mode="EDIT")
         bpy.ops.mesh.select_all(action="SELECT")
         bpy.ops.uv.project_from_view(correct_aspect=True, scale_to_bounds=False)
         bpy.ops.object.mode_set(mode="OBJECT")
 
+        # Remember where this view looks from, in object space, for the merge
+        rv3d = context.region_data
+        if view and rv3d:
+            toward_viewer = rv3d.view_rotation @ Vector((0.0, 0.0, 1.0))
+            local = obj.matrix_world.to_3x3().inverted_safe() @ toward_viewer
+            view.direction = local.normalized()
+
         self.report(
             {"INFO"},
             "Projection UV created from the current view. Align it in the UV Editor.",
@@ -291,6 +590,49 @@ class PP_OT_CreateProjectionUV(Operator):
         return {"FINISHED"}
 
 
+class PP_OT_AddProjectionView(Operator):
+    bl_idname = "pp.add_projection_view"
+    bl_label = "Add Projection View"
+    bl_description = "Register a reference view with its own image and projection UV"
+    bl_options = {"REGISTER", "UNDO"}
+
+    side: EnumProperty(
+        name="Side",
+        items=[(key, label, "") for key, (label, _dir) in VIEW_SIDES.items()],
+    )
+
+    def execute(self, context):
+        props = context.scene.profile_proj
+        if any(v.side == self.side for v in props.views):
+            self.report({"WARNING"}, f"{self.side.title()} view already registered")
+            return {"CANCELLED"}
+
+        label, direction = VIEW_SIDES[self.side]
+        view = props.views.add()
+        view.side = self.side
+        view.projection_uv = f"Projection {label}"
+        view.direction = direction
+        return {"FINISHED"}
+
+
+class PP_OT_RemoveProjectionView(Operator):
+    bl_idname = "pp.remove_projection_view"
+    bl_label = "Remove Projection View"
+    bl_options = {"REGISTER", "UNDO"}
+
+    index: IntProperty()
+
+    def execute(self, context):
+        props = context.scene.profile_proj
+        if not 0 <= self.index < len(props.views):
+            return {"CANCELLED"}
+        side = props.views[self.index].side
+        for key in [k for k in _visibility_cache if k[1] == side]:
+            del _visibility_cache[key]
+        props.views.remove(self.index)
+        return {"FINISHED"}
+
+
 class PP_OT_CreateDestMaterial(Operator):
     bl_idname = "pp.create_dest_and_material"
     bl_label = "2. Create Img Texture + Material"
@@ -348,82 +690,107 @@ class PP_OT_AutoCloneTransfer(Operator):
             self.report({"ERROR"}, "Mesh has no UVs. Unwrap first.")
             return {"CANCELLED"}
 
-        # Ensure destination image + material and set Texture Paint Single Image targeting it
+        # Ensure destination image + material
         size = int(props.dest_size)
         dest_img = bpy.data.images.get("Projected Design") or bpy.data.images.new(
             "Projected Design", width=size, height=size, alpha=True
         )
-        dest_img.generated_color = (0, 0, 0, 0)
+        if tuple(dest_img.size) != (size, size):
+            dest_img.scale(size, size)
         ensure_reference_material_on_main_uv(obj, dest_img, main_uv)
 
-        # Prepare clone context (Single Image mode + canvas=Projected Design + clone_image=src)
-        clone_brush = set_clone_context(obj, src_img, proj_uv, main_uv, dest_img)
-
-        # Additional brush configuration for clone painting
-        if clone_brush:
-            ts = bpy.context.scene.tool_settings
-            # Ensure clone settings are properly configured
-            if hasattr(ts.image_paint, "use_clone_layer"):
-                ts.image_paint.use_clone_layer = True
-
-        # Switch to Texture Paint workspace/context
-        try:
-            # Switch to Texture Painting workspace if available
-            for workspace in bpy.data.workspaces:
-                if "Texture" in workspace.name or "Paint" in workspace.name:
-                    bpy.context.window.workspace = workspace
-                    break
-        except Exception:
-            pass
-
-        # Configure Image Editor to show Projected Design in VIEW mode
-        for area in bpy.context.window.screen.areas:
+        if obj.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+
+        written = transfer_projection(obj, src_img, dest_img, proj_uv, main_uv)
+        if not written:
+            self.report(
+                {"WARNING"},
+                "No texels transferred. Check that the Projection UV overlaps the image.",
+            )
+            return {"CANCELLED"}
+
+        # Show the result in any open Image Editor
+        screen = context.window.screen if context.window else None
+        for area in screen.areas if screen else ():
             if area.type == "IMAGE_EDITOR":
-                for space in area.spaces:
-                    if space.type == "IMAGE_EDITOR":
-                        # Set the image and ensure it's properly loaded
-                        space.image = dest_img  # Set to Projected Design
-                        space.mode = "VIEW"  # Set mode to VIEW
-                        # Force update the area
-                        area.tag_redraw()
-                        break
-
-        # Also set the image in tool settings for texture paint context
-        try:
-            bpy.context.scene.tool_settings.image_paint.canvas = dest_img
-        except Exception:
-            pass
-
-        # Find a 3D view to paint into
-        area, region, space = find_view3d_area_region()
-        if not area:
-            self.report({"ERROR"}, "No 3D View area found")
+                area.spaces.active.image = dest_img
+                area.tag_redraw()
+
+        self.report(
+            {"INFO"},
+            f"Transferred {written} texels into '{dest_img.name}'",
+        )
+        return {"FINISHED"}
+
+
+class PP_OT_MultiViewTransfer(Operator):
+    bl_idname = "pp.multi_view_transfer"
+    bl_label = "Transfer All Views"
+    bl_description = (
+        "Merge every registered view into the destination image in one pass, "
+        "blending by facing angle and visibility"
+    )
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        props = context.scene.profile_proj
+        obj = get_shell(context)
+        if not obj:
+            self.report({"ERROR"}, "Select a mesh object")
+            return {"CANCELLED"}
+        main_uv = get_or_active_main_uv(obj, props.main_uv)
+        if not main_uv:
+            self.report({"ERROR"}, "Mesh has no UVs. Unwrap first.")
             return {"CANCELLED"}
-        override = {"area": area, "region": region}
 
-        # Compute on-screen bounds of the object to sweep strokes over
-        bounds = obj_screen_bounds(obj, area, region, space)
-        if bounds is None:
-            self.report({"ERROR"}, "Cannot compute screen bounds for object")
+        active = [v for v in props.views if v.enabled]
+        if not active:
+            self.report({"ERROR"}, "Add at least one projection view")
             return {"CANCELLED"}
-        (x0, y0), (x1, y1) = bounds
-
-        # Use conservative defaults (no UI knobs): 28 rows, 80 samples, 64px brush, full strength
-        rows, samples, size_px, pressure = 28, 80, 64, 1.0
-        dy = (y1 - y0) / (rows + 1)
-        for i in range(1, rows + 1):
-            y = y0 + i * dy
-            stroke = build_stroke_line(
-                x0, y, x1, steps=samples, size_px=size_px, pressure=pressure
+        for view in active:
+            if not load_or_get_image(view.image_path):
+                self.report(
+                    {"ERROR"}, f"Pick an image for the {view.side.title()} view"
+                )
+                return {"CANCELLED"}
+            if obj.data.uv_layers.get(view.projection_uv) is None:
+                self.report(
+                    {"ERROR"},
+                    f"Run Project From View for the {view.side.title()} view first",
+                )
+                return {"CANCELLED"}
+
+        size = int(props.dest_size)
+        dest_img = bpy.data.images.get("Projected Design") or bpy.data.images.new(
+            "Projected Design", width=size, height=size, alpha=True
+        )
+        if tuple(dest_img.size) != (size, size):
+            dest_img.scale(size, size)
+        ensure_reference_material_on_main_uv(obj, dest_img, main_uv)
+
+        if obj.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+
+        layers = [
+            (
+                view.projection_uv,
+                load_or_get_image(view.image_path),
+                view_corner_weights(obj, view),
             )
-            try:
-                bpy.ops.paint.image_paint(override, stroke=stroke, mode="NORMAL")
-            except Exception:
-                pass
+            for view in active
+        ]
+        written = transfer_views(obj, dest_img, main_uv, layers)
+        if not written:
+            self.report(
+                {"WARNING"},
+                "No texels transferred. Check that the Projection UVs overlap the images.",
+            )
+            return {"CANCELLED"}
 
         self.report(
             {"INFO"},
-            "Auto Clone Transfer complete for current view. Repeat from the opposite side if needed.",
+            f"Merged {len(active)} views: {written} texels into '{dest_img.name}'",
         )
         return {"FINISHED"}
 
@@ -432,10 +799,14 @@ class PP_OT_AutoCloneTransfer(Operator):
 # Register
 # -------------------------
 classes = (
+    ProfileProjView,
     ProfileProjProps,
     PP_OT_CreateProjectionUV,
+    PP_OT_AddProjectionView,
+    PP_OT_RemoveProjectionView,
     PP_OT_CreateDestMaterial,
     PP_OT_AutoCloneTransfer,
+    PP_OT_MultiViewTransfer,
 )
 
 
@@ -446,6 +817,7 @@ def register():
 
 
 def unregister():
+    _visibility_cache.clear()
     del bpy.types.Scene.profile_proj
     for c in reversed(classes):
         bpy.utils.unregister_class(c)
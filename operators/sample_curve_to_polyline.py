@@ -1,95 +1,18 @@
 import bpy
 
+from ..core import resample
+from ..utils import mesh_arrays, profiling
 from ..utils.collections import add_object_to_panel_collection
 
 
-# --- Helper Function: Resample Polyline (from your script) ---
-def resample_polyline(points, num_samples):
-    if not points or num_samples < 2:
-        return []
-
-    lengths = [0.0]
-    total_length = 0.0
-
-    for i in range(1, len(points)):
-        seg_length = (points[i] - points[i - 1]).length
-        total_length += seg_length
-        lengths.append(total_length)
-
-    if total_length < 1e-6:
-        return [points[0]] * num_samples
-    spacing = total_length / num_samples if num_samples > 0 else 0
-    if spacing < 1e-9:
-        return [points[0]] * num_samples
-
-    target_distances = [i * spacing for i in range(num_samples)]
-    resampled_points = []
-    current_seg_index = 0
-
-    for d in target_distances:
-        while (
-            current_seg_index < len(lengths) - 2 and d > lengths[current_seg_index + 1]
-        ):
-            current_seg_index += 1
-
-        seg_start_length = lengths[current_seg_index]
-        seg_end_length = lengths[current_seg_index + 1]
-        segment_length = seg_end_length - seg_start_length
-        t = (d - seg_start_length) / segment_length if segment_length > 1e-6 else 0.0
-        p0 = points[current_seg_index]
-        p1 = points[current_seg_index + 1]
-        resampled_points.append(p0.lerp(p1, t))
-
-    return resampled_points
-
-
 # --- Helper Function: Extract ordered points from a mesh outline ---
 def get_ordered_points_from_mesh(mesh_data):
+    """Return one (K, 3) array of ordered vertex positions per outline chain."""
     if not mesh_data or not mesh_data.edges:
         return []
-
-    edge_lookup = {v.index: [] for v in mesh_data.vertices}
-    for e in mesh_data.edges:
-        edge_lookup[e.vertices[0]].append(e.vertices[1])
-        edge_lookup[e.vertices[1]].append(e.vertices[0])
-
-    all_polylines = []
-    visited_globally = set()
-
-    for v_idx in edge_lookup:
-        if v_idx not in visited_globally:
-            current_polyline = []
-            visited_locally = set()
-            start_node = v_idx
-
-            # Prefer to start at an endpoint (a vertex with only one edge connection) if one exists in this island
-            for check_v_idx, neighbors in edge_lookup.items():
-                if len(neighbors) == 1 and check_v_idx not in visited_globally:
-                    start_node = check_v_idx
-                    break
-
-            current_node = start_node
-            # Loop while the current node is valid and hasn't been visited in this local pass
-            while current_node != -1 and current_node not in visited_locally:
-                visited_locally.add(current_node)
-                visited_globally.add(current_node)
-                current_polyline.append(mesh_data.vertices[current_node].co.copy())
-
-                # Find the next unvisited neighbor
-                next_node = -1  # Default to -1 (not found)
-                # Use .get() for safety in case current_node somehow becomes an invalid key
-                for neighbor_idx in edge_lookup.get(current_node, []):
-                    if neighbor_idx not in visited_locally:
-                        next_node = neighbor_idx
-                        break
-
-                # Update current_node for the next iteration
-                current_node = next_node
-
-            if current_polyline:
-                all_polylines.append(current_polyline)
-
-    return all_polylines
+    co = mesh_arrays.coords(mesh_data)
+    chains = resample.order_polylines(len(co), mesh_arrays.edges(mesh_data))
+    return [co[chain] for chain in chains]
 
 
 # --- Main Operator ---
@@ -112,6 +35,7 @@ class CURVE_OT_SampleToPolyline(bpy.types.Operator):
         obj = context.active_object
         return obj and obj.type == "CURVE"
 
+    @profiling.instrument
     def execute(self, context):
         # Context-agnostic execution - automatically switch to required mode
         original_curve_obj = context.active_object
@@ -178,7 +102,9 @@ class CURVE_OT_SampleToPolyline(bpy.types.Operator):
                 if len(poly) < 2:
                     continue
 
-                resampled = resample_polyline(poly, samples_per_spline)
+                resampled = resample.resample_polyline(
+                    poly, samples_per_spline
+                ).tolist()
 
                 panel_count = getattr(context.scene, "spp_panel_count", 1)
                 panel_name_prop = getattr(context.scene, "spp_panel_name", "Panel")
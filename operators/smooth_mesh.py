@@ -1,8 +1,11 @@
 import bmesh
 import bpy
+import numpy as np
 from bpy.props import BoolProperty, FloatProperty, IntProperty
 from bpy.types import Operator
 
+from ..core import relax
+
 
 class MESH_OT_SmoothMesh(Operator):
     bl_idname = "mesh.smooth_mesh"
@@ -52,65 +55,43 @@ class MESH_OT_SmoothMesh(Operator):
         bm.edges.ensure_lookup_table()
         bm.faces.ensure_lookup_table()
 
+        bm.verts.index_update()
+        co = np.array([v.co for v in bm.verts], dtype=np.float64).reshape(-1, 3)
+        edges = np.array(
+            [(e.verts[0].index, e.verts[1].index) for e in bm.edges], dtype=np.int64
+        ).reshape(-1, 2)
+
         # Get vertices to smooth
         if self.selected_only:
-            verts_to_smooth = [v for v in bm.verts if v.select]
+            movable = np.array([v.select for v in bm.verts], dtype=bool)
         else:
-            verts_to_smooth = list(bm.verts)
+            movable = np.ones(len(co), dtype=bool)
 
         # Filter out boundary vertices if preserve_boundary is True
         if self.preserve_boundary:
-            boundary_verts = set()
-            for edge in bm.edges:
-                if edge.is_boundary:
-                    boundary_verts.update(edge.verts)
-
-            verts_to_smooth = [v for v in verts_to_smooth if v not in boundary_verts]
-            boundary_count = len(boundary_verts)
-            smooth_count = len(verts_to_smooth)
+            on_boundary = np.array([e.is_boundary for e in bm.edges], dtype=bool)
+            boundary_verts = np.zeros(len(co), dtype=bool)
+            boundary_verts[edges[on_boundary].ravel()] = True
+            movable &= ~boundary_verts
+            boundary_count = int(boundary_verts.sum())
+            smooth_count = int(movable.sum())
             self.report(
                 {"INFO"},
                 f"Smoothing {smooth_count} vertices, preserving {boundary_count} boundary vertices",
             )
         else:
-            smooth_count = len(verts_to_smooth)
+            smooth_count = int(movable.sum())
             self.report({"INFO"}, f"Smoothing {smooth_count} vertices")
 
-        if not verts_to_smooth:
+        if not smooth_count:
             self.report({"WARNING"}, "No vertices to smooth")
             return False
 
         # Apply smoothing iterations
-        for iteration in range(self.iterations):
-            # Store new positions
-            new_positions = {}
-
-            for vert in verts_to_smooth:
-                if len(vert.link_edges) == 0:
-                    continue
-
-                # Calculate average position of connected vertices
-                connected_positions = []
-                for edge in vert.link_edges:
-                    other_vert = edge.other_vert(vert)
-                    connected_positions.append(other_vert.co.copy())
-
-                if connected_positions:
-                    # Use mathutils.Vector for proper vector math
-                    from mathutils import Vector
-
-                    avg_pos = Vector((0, 0, 0))
-                    for pos in connected_positions:
-                        avg_pos += pos
-                    avg_pos /= len(connected_positions)
-
-                    # Blend between original and average position
-                    new_pos = vert.co.lerp(avg_pos, self.factor)
-                    new_positions[vert] = new_pos
-
-            # Apply new positions
-            for vert, new_pos in new_positions.items():
-                vert.co = new_pos
+        relaxed = relax.laplacian(co, edges, self.factor, self.iterations, movable)
+        verts = bm.verts
+        for i in np.flatnonzero(movable):
+            verts[i].co = relaxed[i]
 
         # Update mesh
         bmesh.update_edit_mesh(obj.data)
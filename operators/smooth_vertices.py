@@ -31,9 +31,6 @@ class OBJECT_OT_SmoothVertices(bpy.types.Operator):
         Returns:
             set: {'FINISHED'} on success, {'CANCELLED'} on error
         """
-        # Add undo checkpoint
-        bpy.ops.ed.undo_push(message="Smooth Vertices")
-
         try:
             obj = context.active_object
             if not obj or obj.type != "MESH":
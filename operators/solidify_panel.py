@@ -42,9 +42,6 @@ class OBJECT_OT_SolidifyPanel(Operator):
         Returns:
             set: {'FINISHED'} on success, {'CANCELLED'} on error
         """
-        # Add undo checkpoint
-        bpy.ops.ed.undo_push(message="Add Solidify Modifier")
-
         try:
             obj = context.active_object
             if not obj or obj.type != "MESH":
@@ -127,9 +124,6 @@ class OBJECT_OT_ApplySolidify(Operator):
         Returns:
             set: {'FINISHED'} on success, {'CANCELLED'} on error
         """
-        # Add undo checkpoint
-        bpy.ops.ed.undo_push(message="Apply Solidify Modifier")
-
         try:
             obj = context.active_object
             solidify = obj.modifiers.get("Solidify")
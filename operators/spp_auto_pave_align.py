@@ -14,6 +14,8 @@ from mathutils.bvhtree import BVHTree
 from bpy.types import Operator
 from bpy.props import StringProperty
 
+from ..utils import profiling
+
 # -----------------------------------------------------------------------------
 # BVH + nearest sampling (world space), based on your current build
 # -----------------------------------------------------------------------------
@@ -211,6 +213,7 @@ class SPP_OT_AutoPaveGridAlign(Operator):
         default="3DShoeShell"
     )
 
+    @profiling.instrument
     def execute(self, context):
         # Store original mode for restoration
         original_mode = context.mode
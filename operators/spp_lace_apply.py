@@ -4,6 +4,7 @@ Applies geometry nodes modifier with selected lace profile to curve objects
 """
 
 import bpy
+import numpy as np
 from bpy.types import Operator
 from bpy.props import (
     EnumProperty,
@@ -11,11 +12,181 @@ from bpy.props import (
     IntProperty,
     BoolProperty,
     StringProperty,
-    PointerProperty,
     FloatVectorProperty,
 )
+from ..utils import lace_sockets
 from .spp_lace_loader import ensure_lace_assets
 
+# Map lace type to correct node group name from asset file
+NODE_GROUP_MAP = {
+    "ROUND": "spp_lace_round",
+    "OVAL": "spp_lace_oval",
+    "FLAT": "spp_lace_flat",
+    "CUSTOM": "spp_lace_custom",
+}
+
+
+def resolve_lace_node_group(scene, targets):
+    """Validate the scene lace settings for ``targets``.
+
+    Returns:
+        tuple: (node_group, error message); node_group is None on error
+    """
+    lace_type = scene.spp_lace_profile
+
+    # Validate custom profile if needed and ensure it's different from targets
+    if lace_type == "CUSTOM":
+        if not scene.spp_lace_custom_profile:
+            return None, "Custom profile object not specified"
+        if scene.spp_lace_custom_profile in targets:
+            return None, (
+                "Custom profile cannot be the same as the target curve. "
+                "Please select a different curve as the custom profile."
+            )
+
+    node_group_name = NODE_GROUP_MAP.get(lace_type)
+    if not node_group_name:
+        return None, f"Unknown lace type: {lace_type}"
+
+    # Get the node group from loaded assets
+    node_group = bpy.data.node_groups.get(node_group_name)
+    if not node_group:
+        return None, (
+            f"Node group '{node_group_name}' not found. Make sure lace assets are loaded."
+        )
+    return node_group, None
+
+
+def build_lace_inputs(scene):
+    """Collect the modifier input values from the scene lace settings.
+
+    Computed once per apply and shared by every target curve.
+    """
+    inputs = {
+        "scale": getattr(scene, "spp_lace_scale", 0.05),
+        "resample": getattr(scene, "spp_lace_resample", 64),
+        "tilt": getattr(scene, "spp_lace_tilt", 0.0),
+        "normal_mode": int(getattr(scene, "spp_lace_normal_mode", "0")),
+        "color": tuple(getattr(scene, "spp_lace_color", (0.8, 0.8, 0.8, 1.0))),
+        "flip_normal": getattr(scene, "spp_lace_flip_normal", False),
+        "shade_smooth": getattr(scene, "spp_lace_shade_smooth", True),
+    }
+
+    # Free Normal Controls (only when Normal Mode is Free). Keep the scene
+    # property as the single source of truth and propagate it to the modifier.
+    if scene.spp_lace_normal_mode == "2" and hasattr(scene, "spp_lace_free_normal"):
+        inputs["free_normal"] = tuple(scene.spp_lace_free_normal)
+
+    # Material - use default lace material
+    default_material = bpy.data.materials.get("spp_lace_material")
+    if default_material:
+        inputs["material"] = default_material
+
+    # Custom Profile (only for spp_lace_custom)
+    if scene.spp_lace_profile == "CUSTOM" and scene.spp_lace_custom_profile:
+        inputs["custom_profile"] = scene.spp_lace_custom_profile
+    return inputs
+
+
+def apply_lace_modifier(target_curve, node_group, inputs):
+    """Replace any lace modifier on ``target_curve`` and set its inputs.
+
+    Does not trigger a depsgraph update; callers refresh once when done.
+    """
+    # Remove existing lace modifiers from target curve
+    stale = [m for m in target_curve.modifiers if lace_sockets.is_lace_modifier(m)]
+    for modifier in stale:
+        target_curve.modifiers.remove(modifier)
+
+    # Add new geometry nodes modifier to target curve
+    modifier = target_curve.modifiers.new(name="SPP Lace", type="NODES")
+    modifier.node_group = node_group
+    lace_sockets.remember_lace_modifier(target_curve, modifier)
+
+    # Identifiers come from the cached per-node-group socket map
+    for logical, value in inputs.items():
+        key = lace_sockets.input_key(modifier, logical)
+        if key is None:
+            continue
+        try:
+            modifier[key] = value
+        except Exception as e:
+            print(f"Error setting lace input {logical} ({key}): {e}")
+    return modifier
+
+
+def _copy_spline_world(src, dst_data, matrix):
+    """Copy ``src`` into ``dst_data`` with its points moved to world space.
+
+    Empty splines are skipped.
+    """
+    points = src.bezier_points if src.type == "BEZIER" else src.points
+    if not len(points):
+        return
+    dst = dst_data.splines.new(src.type)
+    mat = np.array(matrix, dtype=np.float64)
+    if src.type == "BEZIER":
+        count = len(src.bezier_points)
+        dst.bezier_points.add(count - 1)
+        # Handle types first so the explicit handles below are kept as-is
+        for s_pt, d_pt in zip(src.bezier_points, dst.bezier_points):
+            d_pt.handle_left_type = s_pt.handle_left_type
+            d_pt.handle_right_type = s_pt.handle_right_type
+        for attr in ("co", "handle_left", "handle_right"):
+            co = np.empty(count * 3, dtype=np.float32)
+            src.bezier_points.foreach_get(attr, co)
+            co = co.reshape(count, 3) @ mat[:3, :3].T + mat[:3, 3]
+            dst.bezier_points.foreach_set(attr, co.astype(np.float32).ravel())
+        points_src, points_dst = src.bezier_points, dst.bezier_points
+    else:
+        count = len(src.points)
+        dst.points.add(count - 1)
+        co = np.empty(count * 4, dtype=np.float32)
+        src.points.foreach_get("co", co)
+        co = co.reshape(count, 4)
+        co[:, :3] = co[:, :3] @ mat[:3, :3].T + mat[:3, 3]
+        dst.points.foreach_set("co", co.ravel())
+        points_src, points_dst = src.points, dst.points
+
+    for attr in ("radius", "tilt"):
+        values = np.empty(count, dtype=np.float32)
+        points_src.foreach_get(attr, values)
+        points_dst.foreach_set(attr, values)
+
+    # Set once the points exist: Blender clamps order_u to the point count
+    for attr in ("use_cyclic_u", "resolution_u", "order_u", "use_endpoint_u"):
+        try:
+            setattr(dst, attr, getattr(src, attr))
+        except Exception:
+            pass
+
+
+def merge_curves_to_one(curves, name):
+    """Build one multi-spline curve object from ``curves`` (world space).
+
+    The source curves are hidden; the new object is linked next to the first.
+    """
+    first = curves[0]
+    data = bpy.data.curves.new(name, type="CURVE")
+    data.dimensions = "3D"
+    data.twist_mode = first.data.twist_mode
+    for curve in curves:
+        for spline in curve.data.splines:
+            _copy_spline_world(spline, data, curve.matrix_world)
+
+    merged = bpy.data.objects.new(name, data)
+    collections = first.users_collection or [bpy.context.scene.collection]
+    collections[0].objects.link(merged)
+    for curve in curves:
+        curve.hide_viewport = True
+    return merged
+
+
+def _redraw_3d_views(context):
+    for area in context.screen.areas:
+        if area.type == "VIEW_3D":
+            area.tag_redraw()
+
 
 class SPP_OT_apply_lace(Operator):
     """Apply lace geometry to selected curve"""
@@ -110,12 +281,6 @@ class SPP_OT_apply_lace(Operator):
         max=1.0,
     )
 
-    custom_profile: PointerProperty(
-        name="Custom Profile",
-        description="Custom curve object to use as profile",
-        type=bpy.types.Object,
-    )
-
     @classmethod
     def poll(cls, context):
         obj = context.active_object
@@ -135,137 +300,12 @@ class SPP_OT_apply_lace(Operator):
             self.report({"ERROR"}, "Please select a curve object to apply lace to")
             return {"CANCELLED"}
 
-        # Get lace type from scene properties
-        lace_type = scene.spp_lace_profile
-
-        # Validate custom profile if needed and ensure it's different from target
-        if lace_type == "CUSTOM":
-            if not scene.spp_lace_custom_profile:
-                self.report({"ERROR"}, "Custom profile object not specified")
-                return {"CANCELLED"}
-
-            # Ensure the custom profile is not the same as the target curve
-            if scene.spp_lace_custom_profile == target_curve:
-                self.report(
-                    {"ERROR"},
-                    "Custom profile cannot be the same as the target curve. Please select a different curve as the custom profile.",
-                )
-                return {"CANCELLED"}
-
-        # Map lace type to correct node group name from asset file
-        node_group_map = {
-            "ROUND": "spp_lace_round",
-            "OVAL": "spp_lace_oval",
-            "FLAT": "spp_lace_flat",
-            "CUSTOM": "spp_lace_custom",
-        }
-
-        node_group_name = node_group_map.get(lace_type)
-        if not node_group_name:
-            self.report({"ERROR"}, f"Unknown lace type: {lace_type}")
-            return {"CANCELLED"}
-
-        # Get the node group from loaded assets
-        node_group = bpy.data.node_groups.get(node_group_name)
-        if not node_group:
-            self.report(
-                {"ERROR"},
-                f"Node group '{node_group_name}' not found. Make sure lace assets are loaded.",
-            )
+        node_group, error = resolve_lace_node_group(scene, {target_curve})
+        if error:
+            self.report({"ERROR"}, error)
             return {"CANCELLED"}
 
-        # Remove existing lace modifiers from target curve
-        modifiers_to_remove = []
-        for modifier in target_curve.modifiers:
-            if modifier.type == "NODES" and modifier.node_group:
-                # Check if it's one of our lace modifiers
-                if any(
-                    lace_name in modifier.node_group.name
-                    for lace_name in [
-                        "spp_lace_round",
-                        "spp_lace_oval",
-                        "spp_lace_flat",
-                        "spp_lace_custom",
-                    ]
-                ):
-                    modifiers_to_remove.append(modifier)
-
-        for modifier in modifiers_to_remove:
-            target_curve.modifiers.remove(modifier)
-
-        # Add new geometry nodes modifier to target curve
-        modifier = target_curve.modifiers.new(name="SPP Lace", type="NODES")
-        modifier.node_group = node_group
-
-        # Set modifier inputs using named inputs (each node group has its own input structure)
-        try:
-            # Basic parameters that should exist in all node groups
-            if "Scale" in modifier:
-                modifier["Scale"] = (
-                    scene.spp_lace_scale if hasattr(scene, "spp_lace_scale") else 0.05
-                )
-
-            if "Resample" in modifier:
-                modifier["Resample"] = (
-                    scene.spp_lace_resample
-                    if hasattr(scene, "spp_lace_resample")
-                    else 64
-                )
-
-            if "Tilt" in modifier:
-                modifier["Tilt"] = (
-                    scene.spp_lace_tilt if hasattr(scene, "spp_lace_tilt") else 0.0
-                )
-
-            if "Normal Mode" in modifier:
-                normal_mode = (
-                    int(scene.spp_lace_normal_mode)
-                    if hasattr(scene, "spp_lace_normal_mode")
-                    else 0
-                )
-                modifier["Normal Mode"] = normal_mode
-
-            # Free Normal Controls (only when Normal Mode is Free)
-            # In the loaded asset, the free normal vector lives on Socket_10.  Keep
-            # the scene property as the single source of truth and propagate it to
-            # the modifier.
-            if (
-                "Socket_10" in modifier
-                and hasattr(scene, "spp_lace_free_normal")
-                and scene.spp_lace_normal_mode == "2"
-            ):
-                modifier["Socket_10"] = scene.spp_lace_free_normal
-
-            # Material - use default lace material
-            if "Material" in modifier:
-                default_material = bpy.data.materials.get("spp_lace_material")
-                if default_material:
-                    modifier["Material"] = default_material
-
-            # Color
-            if "Color" in modifier and hasattr(scene, "spp_lace_color"):
-                modifier["Color"] = scene.spp_lace_color
-
-            # Flip Normal
-            if "Flip Normal" in modifier and hasattr(scene, "spp_lace_flip_normal"):
-                modifier["Flip Normal"] = scene.spp_lace_flip_normal
-
-            # Shade Smooth
-            if "Shade Smooth" in modifier and hasattr(scene, "spp_lace_shade_smooth"):
-                modifier["Shade Smooth"] = scene.spp_lace_shade_smooth
-
-            # Custom Profile (only for spp_lace_custom)
-            if lace_type == "CUSTOM" and scene.spp_lace_custom_profile:
-                # According to the asset file, the custom profile input lives on Socket_12
-                try:
-                    modifier["Socket_12"] = scene.spp_lace_custom_profile
-                except Exception as e:
-                    # Fallback: print a warning and log available inputs
-                    print(f"Warning: Could not set custom profile on Socket_12: {e}")
-                    print(f"Available modifier keys: {list(modifier.keys())}")
-
-        except Exception as e:
-            print(f"Error setting modifier inputs: {e}")
+        apply_lace_modifier(target_curve, node_group, build_lace_inputs(scene))
 
         # Success reporting has been removed to avoid the redundant pop-up in the
         # viewport.  Instead, silently return success.  A console message can be
@@ -273,9 +313,7 @@ class SPP_OT_apply_lace(Operator):
         # print(f"Applied {lace_type.lower()} lace profile to {target_curve.name}")
 
         # Force viewport update
-        for area in context.screen.areas:
-            if area.type == "VIEW_3D":
-                area.tag_redraw()
+        _redraw_3d_views(context)
         return {"FINISHED"}
 
     def draw(self, context):
@@ -311,9 +349,87 @@ class SPP_OT_apply_lace(Operator):
             col.prop_search(self, "custom_material", bpy.data, "materials")
 
 
+class SPP_OT_apply_lace_batch(Operator):
+    """Apply lace geometry to every selected curve in one step"""
+
+    bl_idname = "spp.apply_lace_batch"
+    bl_label = "Apply Lace to Selected"
+    bl_description = (
+        "Apply the current lace settings to all selected curves with a single "
+        "update and undo step"
+    )
+    bl_options = {"UNDO"}
+
+    merge_into_one: BoolProperty(
+        name="Merge Into One Lace",
+        description=(
+            "Join the selected curves into one multi-spline curve so the lace "
+            "Geometry Nodes evaluate once instead of once per object"
+        ),
+        default=False,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return any(obj.type == "CURVE" for obj in context.selected_objects)
+
+    def execute(self, context):
+        scene = context.scene
+
+        # Ensure lace assets are loaded
+        if not ensure_lace_assets():
+            self.report({"ERROR"}, "Failed to load lace assets")
+            return {"CANCELLED"}
+
+        curves = [obj for obj in context.selected_objects if obj.type == "CURVE"]
+        # The custom profile curve may be selected alongside the targets
+        profile = scene.spp_lace_custom_profile
+        if scene.spp_lace_profile == "CUSTOM" and profile in curves:
+            curves.remove(profile)
+        if not curves:
+            self.report({"ERROR"}, "Please select curve objects to apply lace to")
+            return {"CANCELLED"}
+
+        node_group, error = resolve_lace_node_group(scene, set(curves))
+        if error:
+            self.report({"ERROR"}, error)
+            return {"CANCELLED"}
+
+        # Shared parameters are gathered once for all targets
+        inputs = build_lace_inputs(scene)
+
+        if self.merge_into_one and len(curves) > 1:
+            merged = merge_curves_to_one(curves, "SPP_Lace_Merged")
+            apply_lace_modifier(merged, node_group, inputs)
+            for obj in context.selected_objects:
+                obj.select_set(False)
+            merged.select_set(True)
+            context.view_layer.objects.active = merged
+            targets = [merged]
+        else:
+            targets = curves
+            for curve in targets:
+                apply_lace_modifier(curve, node_group, inputs)
+
+        # One evaluation for the whole batch
+        context.view_layer.update()
+        _redraw_3d_views(context)
+
+        if self.merge_into_one and len(curves) > 1:
+            self.report({"INFO"}, f"Merged {len(curves)} curves into one lace")
+        else:
+            self.report({"INFO"}, f"Applied lace to {len(targets)} curve(s)")
+        return {"FINISHED"}
+
+
+classes = [SPP_OT_apply_lace, SPP_OT_apply_lace_batch]
+
+
 def register():
-    bpy.utils.register_class(SPP_OT_apply_lace)
+    for cls in classes:
+        bpy.utils.register_class(cls)
 
 
 def unregister():
-    bpy.utils.unregister_class(SPP_OT_apply_lace)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -3,89 +3,162 @@ Asset loader utility for SPP Lace Generator
 Loads geometry node groups and materials from the asset blend file
 """
 
+import hashlib
+import os
+
 import bpy
 from pathlib import Path
 
+from ..prefs import debug
+
+# Define the assets to load
+NODE_GROUPS = [
+    "spp_lace_round",
+    "spp_lace_oval",
+    "spp_lace_flat",
+    "spp_lace_custom",
+]
+MATERIALS = ["spp_lace_material"]
+
+# Manifest keys stored on every loaded datablock
+MTIME_KEY = "spp_asset_mtime"
+HASH_KEY = "spp_asset_hash"
+
+# Path -> (mtime, sha1) so the file is hashed at most once per change
+_hash_cache = {}
+
 
 def get_addon_directory():
     """Get the addon directory path"""
     return Path(__file__).parent.parent
 
 
-def load_lace_assets():
+def get_asset_path():
+    return get_addon_directory() / "assets" / "spp_lace_assets.blend"
+
+
+def _file_hash(path, mtime):
+    cached = _hash_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    _hash_cache[path] = (mtime, digest.hexdigest())
+    return _hash_cache[path][1]
+
+
+def _required_datablocks():
+    """Yield (collection, name) for every required asset."""
+    for name in NODE_GROUPS:
+        yield bpy.data.node_groups, name
+    for name in MATERIALS:
+        yield bpy.data.materials, name
+
+
+def _stale_assets(asset_path):
+    """Return the required asset names that are missing or out of date.
+
+    A datablock is current when its stored mtime matches the asset file; if
+    only the mtime changed, the content hash decides and the stored mtime is
+    refreshed so the next check stays a single ``stat``.
+    """
+    mtime = os.path.getmtime(asset_path)
+    stale = []
+    for collection, name in _required_datablocks():
+        block = collection.get(name)
+        if block is None:
+            stale.append(name)
+            continue
+        if block.get(MTIME_KEY) == mtime:
+            continue
+        if block.get(HASH_KEY) == _file_hash(str(asset_path), mtime):
+            block[MTIME_KEY] = mtime
+            continue
+        stale.append(name)
+    return stale
+
+
+def _stamp(block, mtime, digest):
+    block[MTIME_KEY] = mtime
+    block[HASH_KEY] = digest
+    block.use_fake_user = True
+
+
+def load_lace_assets(names=None):
     """
     Load lace geometry node groups and materials from the asset file.
     This is idempotent - safe to call multiple times.
+
+    Args:
+        names: Asset names to (re)load; all required assets when None.
+            Outdated datablocks already in the file are replaced and their
+            users remapped to the fresh copy.
     """
-    addon_dir = get_addon_directory()
-    asset_path = addon_dir / "assets" / "spp_lace_assets.blend"
+    asset_path = get_asset_path()
 
     if not asset_path.exists():
         print(f"ERROR: Asset file not found at {asset_path}")
         print("Please ensure spp_lace_assets.blend exists in the assets folder")
         return False
 
-    print(f"Loading lace assets from: {asset_path}")
-
-    # Define the assets to load
-    node_groups_to_load = [
-        "spp_lace_round",
-        "spp_lace_oval",
-        "spp_lace_flat",
-        "spp_lace_custom",
-    ]
+    if names is None:
+        names = NODE_GROUPS + MATERIALS
+    names = set(names)
+    debug(f"Loading lace assets from: {asset_path}")
 
-    materials_to_load = ["spp_lace_material"]
+    # Move outdated copies aside so the library load gets the real names
+    outdated = {}
+    for collection, name in _required_datablocks():
+        block = collection.get(name)
+        if name in names and block is not None:
+            block.name = f"{name}.outdated"
+            outdated[name] = (collection, block)
 
-    # Load node groups
     try:
         with bpy.data.libraries.load(str(asset_path), link=False) as (
             data_from,
             data_to,
         ):
-            print(f"Available node groups in asset file: {data_from.node_groups}")
-            print(f"Available materials in asset file: {data_from.materials}")
-
-            # Check which node groups need to be loaded
-            for node_group_name in node_groups_to_load:
-                if node_group_name not in bpy.data.node_groups:
-                    if node_group_name in data_from.node_groups:
-                        data_to.node_groups.append(node_group_name)
-                        print(f"Queuing node group for loading: {node_group_name}")
+            debug(f"Available node groups in asset file: {data_from.node_groups}")
+            debug(f"Available materials in asset file: {data_from.materials}")
+
+            for source, target, wanted, kind in (
+                (data_from.node_groups, data_to.node_groups, NODE_GROUPS, "Node group"),
+                (data_from.materials, data_to.materials, MATERIALS, "Material"),
+            ):
+                for name in wanted:
+                    if name not in names:
+                        continue
+                    if name in source:
+                        target.append(name)
+                        debug(f"Queuing {kind.lower()} for loading: {name}")
                     else:
-                        print(
-                            f"WARNING: Node group '{node_group_name}' not found in asset file"
-                        )
-
-            # Check which materials need to be loaded
-            for material_name in materials_to_load:
-                if material_name not in bpy.data.materials:
-                    if material_name in data_from.materials:
-                        data_to.materials.append(material_name)
-                        print(f"Queuing material for loading: {material_name}")
-                    else:
-                        print(
-                            f"WARNING: Material '{material_name}' not found in asset file"
-                        )
+                        print(f"WARNING: {kind} '{name}' not found in asset file")
     except Exception as e:
         print(f"ERROR loading assets: {e}")
+        for name, (_collection, block) in outdated.items():
+            block.name = name
         return False
 
-    # Set fake user on loaded assets to ensure persistence
-    loaded_groups = []
-    for node_group_name in node_groups_to_load:
-        if node_group_name in bpy.data.node_groups:
-            bpy.data.node_groups[node_group_name].use_fake_user = True
-            loaded_groups.append(node_group_name)
-
-    loaded_materials = []
-    for material_name in materials_to_load:
-        if material_name in bpy.data.materials:
-            bpy.data.materials[material_name].use_fake_user = True
-            loaded_materials.append(material_name)
-
-    print(f"Successfully loaded node groups: {loaded_groups}")
-    print(f"Successfully loaded materials: {loaded_materials}")
+    mtime = os.path.getmtime(asset_path)
+    digest = _file_hash(str(asset_path), mtime)
+    loaded = []
+    for collection, name in _required_datablocks():
+        block = collection.get(name)
+        old = outdated.get(name)
+        if block is None:
+            if old:
+                old[1].name = name  # Keep the previous copy rather than nothing
+            continue
+        if old:
+            old[1].user_remap(block)
+            old[0].remove(old[1])
+        _stamp(block, mtime, digest)
+        loaded.append(name)
+
+    debug(f"Successfully loaded lace assets: {loaded}")
     return True
 
 
@@ -93,30 +166,19 @@ def ensure_lace_assets():
     """
     Ensure lace assets are loaded. Call this before using any lace functionality.
     Returns True if assets are available, False otherwise.
+
+    Assets load lazily on first use. Later calls only compare the stored
+    manifest with the asset file and reopen the library when something is
+    missing or the file content changed.
     """
-    # Check if assets are already loaded
-    required_groups = [
-        "spp_lace_round",
-        "spp_lace_oval",
-        "spp_lace_flat",
-        "spp_lace_custom",
-    ]
-    required_materials = ["spp_lace_material"]
-
-    all_loaded = True
-    for group_name in required_groups:
-        if group_name not in bpy.data.node_groups:
-            all_loaded = False
-            break
-
-    if all_loaded:
-        for mat_name in required_materials:
-            if mat_name not in bpy.data.materials:
-                all_loaded = False
-                break
-
-    # If not all loaded, try to load them
-    if not all_loaded:
+    asset_path = get_asset_path()
+    if not asset_path.exists():
+        # Nothing to check against; fall back to whatever is in the file
+        if all(collection.get(name) for collection, name in _required_datablocks()):
+            return True
         return load_lace_assets()
 
-    return True
+    stale = _stale_assets(asset_path)
+    if not stale:
+        return True
+    return load_lace_assets(stale)
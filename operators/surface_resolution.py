@@ -1,7 +1,83 @@
+import time
+
+import bpy
+
+# Seconds without a new slider value before the drag counts as released
+SETTLE_DELAY = 0.25
+# Seconds the tessellation cost stays in the status bar
+STATUS_DURATION = 4.0
+
+# Object name -> (full_u, full_v, last_change_time) for drags in progress
+_pending = {}
+
+
+def _clear_status():
+    try:
+        bpy.context.workspace.status_text_set(None)
+    except Exception:
+        pass
+    return None
+
+
+def _report_status(text):
+    try:
+        bpy.context.workspace.status_text_set(text)
+    except Exception:
+        print(text)
+        return
+    if bpy.app.timers.is_registered(_clear_status):
+        bpy.app.timers.unregister(_clear_status)
+    bpy.app.timers.register(_clear_status, first_interval=STATUS_DURATION)
+
+
+def _set_resolution(curve_data, res_u, res_v):
+    if curve_data.resolution_u != res_u:
+        curve_data.resolution_u = res_u
+    if curve_data.resolution_v != res_v:
+        curve_data.resolution_v = res_v
+
+
+def _apply_full_resolution():
+    """Timer callback: apply the final resolution once the slider settles."""
+    now = time.monotonic()
+    wait = 0.0
+    for name, (res_u, res_v, changed) in list(_pending.items()):
+        remaining = SETTLE_DELAY - (now - changed)
+        if remaining > 0.0:
+            wait = max(wait, remaining)
+            continue
+        del _pending[name]
+
+        obj = bpy.data.objects.get(name)
+        if not obj or not hasattr(obj.data, "resolution_u"):
+            continue
+
+        start = time.perf_counter()
+        _set_resolution(obj.data, res_u, res_v)
+        try:
+            # Evaluate now so the measured cost is the real tessellation time
+            bpy.context.view_layer.update()
+        except Exception:
+            pass
+        elapsed = (time.perf_counter() - start) * 1000.0
+        _report_status(
+            f"{obj.name}: resolution {res_u} x {res_v} tessellated in {elapsed:.1f} ms"
+        )
+
+    return wait if _pending else None
+
+
 def update_active_surface_resolution(scene_self, context):
+    """Resolution slider callback with level-of-detail preview.
+
+    While the slider is moving the curve shows at most the preview cap, so
+    each drag step stays cheap; the full resolution is applied once, after no
+    new value has arrived for ``SETTLE_DELAY`` seconds.
+    """
     try:
         new_resolution_u = getattr(scene_self, "spp_resolution_u", 12)
         new_resolution_v = getattr(scene_self, "spp_resolution_v", 12)
+        preview_cap = getattr(scene_self, "spp_resolution_preview_cap", 6)
 
         # Get the active object
         active_obj = context.active_object
@@ -12,11 +88,27 @@ def update_active_surface_resolution(scene_self, context):
         if active_obj.type in {"CURVE", "SURFACE"} and hasattr(
             active_obj.data, "resolution_u"
         ):
-            # Update the resolution
             curve_data = active_obj.data
-            curve_data.resolution_u = new_resolution_u
-            curve_data.resolution_v = new_resolution_v
-            curve_data.update()
+            if max(new_resolution_u, new_resolution_v) <= preview_cap:
+                # Cheap enough to apply directly
+                _pending.pop(active_obj.name, None)
+                _set_resolution(curve_data, new_resolution_u, new_resolution_v)
+                return
+
+            _set_resolution(
+                curve_data,
+                min(new_resolution_u, preview_cap),
+                min(new_resolution_v, preview_cap),
+            )
+            _pending[active_obj.name] = (
+                new_resolution_u,
+                new_resolution_v,
+                time.monotonic(),
+            )
+            if not bpy.app.timers.is_registered(_apply_full_resolution):
+                bpy.app.timers.register(
+                    _apply_full_resolution, first_interval=SETTLE_DELAY
+                )
     except Exception as e:
         print(f"Error updating surface resolution: {str(e)}")
 
@@ -27,7 +119,10 @@ def register():
 
 
 def unregister():
-    pass
+    _pending.clear()
+    for func in (_apply_full_resolution, _clear_status):
+        if bpy.app.timers.is_registered(func):
+            bpy.app.timers.unregister(func)
 
 
 if __name__ == "__main__":
@@ -23,9 +23,6 @@ class OBJECT_OT_UnwrapShell(Operator):
         Returns:
             set: {'FINISHED'} on success, {'CANCELLED'} on error
         """
-        # Add undo checkpoint
-        bpy.ops.ed.undo_push(message="Unwrap Shell")
-
         try:
             # Get the active object
             obj = context.active_object
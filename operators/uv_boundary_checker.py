@@ -1,12 +1,14 @@
 import bmesh
 import bpy
-from mathutils import Vector
+import numpy as np
+
+from ..core import boundary, uv_map
+from ..utils import mesh_arrays, profiling, uv_reference
 
 # Hidden defaults (no UI exposure except Padding (UV))
 SMART_FACTOR = 0.20
 MARGIN_UV = 0.01
 EDGE_CHECK_LIMIT = 1000
-TIMEOUT_SEC = 30.0
 
 
 class MESH_OT_CheckUVBoundary(bpy.types.Operator):
@@ -29,111 +31,32 @@ class MESH_OT_CheckUVBoundary(bpy.types.Operator):
         )
 
     # ------------------------ Boundary Utils ----------------------
-    def find_uv_reference_mesh(self, context, shell_obj_name):
-        for obj in context.scene.objects:
-            if obj.type == "MESH" and "spp_original_3d_mesh_name" in obj:
-                if obj["spp_original_3d_mesh_name"] == shell_obj_name:
-                    return obj
-        return None
-
     def get_uv_boundary_edges(self, shell_obj, uv_layer_name):
+        """Return the (S, 2, 2) UV segments along the shell's open boundary."""
         depsgraph = bpy.context.evaluated_depsgraph_get()
         eval_shell = shell_obj.evaluated_get(depsgraph)
         eval_mesh = eval_shell.to_mesh()
-        bm_shell = bmesh.new()
-        bm_shell.from_mesh(eval_mesh)
-        bm_shell.verts.ensure_lookup_table()
-        bm_shell.edges.ensure_lookup_table()
-        bm_shell.faces.ensure_lookup_table()
-        uv_layer = (
-            bm_shell.loops.layers.uv.get(uv_layer_name)
-            or bm_shell.loops.layers.uv.active
+        try:
+            layer = mesh_arrays.uv_layer(eval_mesh, uv_layer_name)
+            if layer is None:
+                return np.zeros((0, 2, 2))
+            return boundary.uv_segments(
+                *mesh_arrays.face_loops(eval_mesh), mesh_arrays.loop_uvs(layer)
+            )
+        finally:
+            eval_shell.to_mesh_clear()
+
+    def panel_uvs(self, panel_obj, uv_mesh_obj, scale_factor):
+        world = mesh_arrays.to_world(
+            mesh_arrays.coords(panel_obj.data), panel_obj.matrix_world
+        )
+        return uv_map.to_uv(
+            world, mesh_arrays.matrix(uv_mesh_obj.matrix_world.inverted()), scale_factor
         )
-        edges = []
-        for e in bm_shell.edges:
-            if len(e.link_faces) == 1:
-                f = e.link_faces[0]
-                loops = [lp for lp in f.loops if lp.vert in e.verts]
-                if len(loops) == 2:
-                    uv1 = Vector(loops[0][uv_layer].uv)
-                    uv2 = Vector(loops[1][uv_layer].uv)
-                    edges.append((uv1, uv2))
-        bm_shell.free()
-        eval_shell.to_mesh_clear()
-        return edges
-
-    def closest_point_on_segment(self, p, a, b):
-        ab = b - a
-        d2 = ab.length_squared
-        if d2 == 0.0:
-            return a
-        t = (p - a).dot(ab) / d2
-        return a + max(0.0, min(1.0, t)) * ab
-
-    def ray_line_intersect_2d(self, ray_start, ray_dir, line_start, line_end):
-        rs = Vector((ray_start.x, ray_start.y))
-        rd = Vector((ray_dir.x, ray_dir.y))
-        ls = Vector((line_start.x, line_start.y))
-        le = Vector((line_end.x, line_end.y))
-        ld = le - ls
-        denom = rd.x * ld.y - rd.y * ld.x
-        if abs(denom) < 1e-10:
-            return False
-        diff = rs - ls
-        t2 = (rd.x * diff.y - rd.y * diff.x) / denom
-        t1 = (ld.x * diff.y - ld.y * diff.x) / denom
-        return (t1 >= 0) and (0 <= t2 <= 1)
-
-    def is_point_outside_boundary(self, uv, boundary_edges):
-        # quick bounds
-        if uv.x < 0 or uv.x > 1 or uv.y < 0 or uv.y > 1:
-            return True
-        # points on boundary are inside
-        eps = 1e-6
-        for s, e in boundary_edges:
-            if (self.closest_point_on_segment(uv, s, e) - uv).length <= eps:
-                return False
-        # single horizontal ray
-        hits = 0
-        ray_dir = Vector((1, 0))
-        for s, e in boundary_edges:
-            if self.ray_line_intersect_2d(uv, ray_dir, s, e):
-                hits += 1
-        return (hits % 2) == 0
-
-    def find_closest_on_boundary(self, uv, boundary_edges):
-        q, dmin = None, float("inf")
-        for s, e in boundary_edges:
-            c = self.closest_point_on_segment(uv, s, e)
-            d = (uv - c).length
-            if d < dmin:
-                q, dmin = c, d
-        return q
-
-    def inward_from_boundary_point(self, q, boundary_edges):
-        for s, e in boundary_edges:
-            if (self.closest_point_on_segment(q, s, e) - q).length < 1e-4:
-                t = (e - s).normalized() if (e - s).length > 0 else Vector((1, 0))
-                n1 = Vector((-t.y, t.x))
-                n2 = Vector((t.y, -t.x))
-                return (
-                    n1
-                    if not self.is_point_outside_boundary(q + n1 * 1e-3, boundary_edges)
-                    else n2
-                )
-        # fallback: toward centroid
-        cx = sum(a.x + b.x for a, b in boundary_edges) / (2 * len(boundary_edges))
-        cy = sum(a.y + b.y for a, b in boundary_edges) / (2 * len(boundary_edges))
-        v = Vector((cx, cy)) - q
-        return v.normalized() if v.length > 0 else Vector((0, -1))
 
     # --------------------------- Execute -------------------------
+    @profiling.instrument
     def execute(self, context):
-        import time
-
-        start = time.time()
-        bpy.ops.ed.undo_push(message="Check UV Boundary")
-
         panel_obj = context.active_object
         shell_obj = context.scene.spp_shell_object
         S = context.scene
@@ -145,7 +68,7 @@ class MESH_OT_CheckUVBoundary(bpy.types.Operator):
         user_min_pad_uv = float(getattr(S, "spp_uv_padding_uv", 0.005))
         eps_inside = max(1e-4, 0.25 * MARGIN_UV)
 
-        uv_mesh_obj = self.find_uv_reference_mesh(context, shell_obj.name)
+        uv_mesh_obj = uv_reference.find_uv_reference_mesh(shell_obj, context.scene)
         if not uv_mesh_obj:
             self.report(
                 {"ERROR"}, f"UV reference mesh for '{shell_obj.name}' not found."
@@ -165,67 +88,28 @@ class MESH_OT_CheckUVBoundary(bpy.types.Operator):
             if original_mode != "OBJECT":
                 bpy.ops.object.mode_set(mode="OBJECT")
 
-            boundary_edges = self.get_uv_boundary_edges(shell_obj, source_uv_map)
-            if not boundary_edges:
+            segments = self.get_uv_boundary_edges(shell_obj, source_uv_map)
+            if not len(segments):
                 self.report({"WARNING"}, "No UV boundary edges found.")
                 return {"CANCELLED"}
 
-            bm = bmesh.new()
-            bm.from_mesh(panel_obj.data)
-            bm.verts.ensure_lookup_table()
-            bm.edges.ensure_lookup_table()
-
             # ---- Collect violations (outside OR within safety margin) ----
-            violation_vert_ids = []
-            for i, v in enumerate(bm.verts):
-                if i % 200 == 0 and (time.time() - start) > TIMEOUT_SEC:
-                    bm.free()
-                    S.spp_uv_boundary_status = "ERROR"
-                    self.report({"ERROR"}, "Operation timed out during vertex scan.")
-                    return {"CANCELLED"}
-
-                p_world = panel_obj.matrix_world @ v.co
-                p_uv_local = uv_mesh_obj.matrix_world.inverted() @ p_world
-                uv = Vector((p_uv_local.x / scale_factor, p_uv_local.y / scale_factor))
-
-                if self.is_point_outside_boundary(uv, boundary_edges):
-                    violation_vert_ids.append(i)
-                else:
-                    q = self.find_closest_on_boundary(uv, boundary_edges)
-                    if q and (uv - q).length < MARGIN_UV:
-                        violation_vert_ids.append(i)
-
-            # optional light edge pass (cap for speed)
-            edge_count = 0
-            for e in bm.edges:
-                edge_count += 1
-                if edge_count % 50 == 0:
-                    if (
-                        time.time() - start
-                    ) > TIMEOUT_SEC or edge_count > EDGE_CHECK_LIMIT:
-                        break
-                v1, v2 = e.verts
-                p1w = panel_obj.matrix_world @ v1.co
-                p2w = panel_obj.matrix_world @ v2.co
-                p1u = uv_mesh_obj.matrix_world.inverted() @ p1w
-                p2u = uv_mesh_obj.matrix_world.inverted() @ p2w
-                uv1 = Vector((p1u.x / scale_factor, p1u.y / scale_factor))
-                uv2 = Vector((p2u.x / scale_factor, p2u.y / scale_factor))
-                mid = (uv1 + uv2) * 0.5
-                if (
-                    self.is_point_outside_boundary(uv1, boundary_edges)
-                    or self.is_point_outside_boundary(uv2, boundary_edges)
-                    or self.is_point_outside_boundary(mid, boundary_edges)
-                ):
-                    violation_vert_ids.extend([v1.index, v2.index])
-
-            violation_vert_ids = sorted(set(violation_vert_ids))
+            uv = self.panel_uvs(panel_obj, uv_mesh_obj, scale_factor)
+            violating = boundary.outside(uv, segments)
+            inside = np.flatnonzero(~violating)
+            distance = boundary.closest_points(uv[inside], segments)[1]
+            violating[inside[distance < MARGIN_UV]] = True
+
+            # Light edge pass: an edge whose midpoint is outside flags both ends
+            edges = mesh_arrays.edges(panel_obj.data)[:EDGE_CHECK_LIMIT]
+            mid = (uv[edges[:, 0]] + uv[edges[:, 1]]) * 0.5
+            violating[edges[boundary.outside(mid, segments)].ravel()] = True
+
+            violation_vert_ids = np.flatnonzero(violating).tolist()
 
             # ---- Actions ----
             if action == "CHECK":
-                self._select_in_bmesh(bm, violation_vert_ids)
-                bm.to_mesh(panel_obj.data)
-                panel_obj.data.update()
+                self._select_vertices(panel_obj.data, violating)
                 self._write_violation_group(panel_obj, violation_vert_ids)
 
                 if original_mode == "EDIT_MESH" or violation_vert_ids:
@@ -243,32 +127,22 @@ class MESH_OT_CheckUVBoundary(bpy.types.Operator):
 
             elif action == "FIX":
                 fixed = self._fix_with_padding(
-                    bm,
                     panel_obj,
                     uv_mesh_obj,
                     scale_factor,
-                    boundary_edges,
-                    set(violation_vert_ids),
+                    segments,
+                    uv,
+                    violating,
                     user_min_pad_uv,
                     eps_inside,
                 )
-                bm.to_mesh(panel_obj.data)
-                panel_obj.data.update()
 
                 # quick recheck subset
                 remaining = 0
                 if violation_vert_ids:
-                    bm2 = bmesh.new()
-                    bm2.from_mesh(panel_obj.data)
-                    bm2.verts.ensure_lookup_table()
-                    for vi in violation_vert_ids[: min(1000, len(violation_vert_ids))]:
-                        v = bm2.verts[vi]
-                        p_world = panel_obj.matrix_world @ v.co
-                        p_uv = uv_mesh_obj.matrix_world.inverted() @ p_world
-                        uv = Vector((p_uv.x / scale_factor, p_uv.y / scale_factor))
-                        if self.is_point_outside_boundary(uv, boundary_edges):
-                            remaining += 1
-                    bm2.free()
+                    recheck = np.asarray(violation_vert_ids[:1000])
+                    uv = self.panel_uvs(panel_obj, uv_mesh_obj, scale_factor)
+                    remaining = int(boundary.outside(uv[recheck], segments).sum())
 
                 if fixed > 0 and remaining == 0:
                     S.spp_uv_boundary_status = "PASS"
@@ -284,31 +158,27 @@ class MESH_OT_CheckUVBoundary(bpy.types.Operator):
                     self._clear_violation_group(panel_obj)
                     self.report({"INFO"}, "No violations found to fix")
 
-            bm.free()
-
         except Exception as e:
             S.spp_uv_boundary_status = "ERROR"
             self.report({"ERROR"}, f"UV boundary check failed: {e}")
-            try:
-                if "bm" in locals():
-                    bm.free()
-            except Exception:
-                pass
             return {"CANCELLED"}
 
         return {"FINISHED"}
 
     # -------------------- Selection & Groups ---------------------
-    def _select_in_bmesh(self, bm, vert_ids):
-        for v in bm.verts:
-            v.select = False
+    def _select_vertices(self, mesh, mask):
+        # Through bmesh: writing edge selection on fresh meshes is unreliable
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
         for e in bm.edges:
             e.select = False
         for f in bm.faces:
             f.select = False
-        for vi in vert_ids:
-            if vi < len(bm.verts):
-                bm.verts[vi].select = True
+        for v, selected in zip(bm.verts, mask.tolist()):
+            v.select = selected
+        bm.to_mesh(mesh)
+        bm.free()
+        mesh.update()
 
     def _write_violation_group(self, obj, vert_ids):
         # Use a single reliable group — vertex indices only
@@ -330,65 +200,49 @@ class MESH_OT_CheckUVBoundary(bpy.types.Operator):
     # ------------------------ FIX with padding --------------------
     def _fix_with_padding(
         self,
-        bm,
         panel_obj,
         uv_mesh_obj,
         scale_factor,
-        boundary_edges,
-        violation_set,
+        segments,
+        uv,
+        violating,
         user_min_pad_uv,
         eps_inside,
     ):
-        M_panel = panel_obj.matrix_world
-        Minv_panel = panel_obj.matrix_world.inverted()
-        M_uv = uv_mesh_obj.matrix_world
-
-        # UV cache
-        uv_cache = {}
-        for v in bm.verts:
-            pw = M_panel @ v.co
-            puv = uv_mesh_obj.matrix_world.inverted() @ pw
-            uv_cache[v.index] = Vector((puv.x / scale_factor, puv.y / scale_factor))
-
-        def local_spacing_uv(v):
-            uv = uv_cache[v.index]
-            dmin = None
-            for e in v.link_edges:
-                w = e.other_vert(v)
-                d = (uv_cache[w.index] - uv).length
-                if d > 0:
-                    dmin = d if dmin is None else min(dmin, d)
-            return dmin if dmin is not None else 0.002
-
-        fixed = 0
-        for v in bm.verts:
-            if v.index not in violation_set:
-                continue
-            uv = uv_cache[v.index]
-            q = self.find_closest_on_boundary(uv, boundary_edges)
-            if not q:
-                continue
-            inward = self.inward_from_boundary_point(q, boundary_edges)
-
-            min_pad = max(user_min_pad_uv, 1e-4)  # user slider wins as the minimum
-            smart = SMART_FACTOR * local_spacing_uv(v)
-            pad_uv = max(min_pad, smart) + eps_inside
-
-            new_uv = q + inward * pad_uv
-            tries = 0
-            # if concave/corner still outside, back off
-            while self.is_point_outside_boundary(new_uv, boundary_edges) and tries < 5:
-                pad_uv *= 0.5
-                new_uv = q + inward * pad_uv
-                tries += 1
-
-            p_local = Vector((new_uv.x * scale_factor, new_uv.y * scale_factor, 0.0))
-            p_world = M_uv @ p_local
-            v.co = Minv_panel @ p_world
-            fixed += 1
-
-        bm.normal_update()
-        return fixed
+        targets = np.flatnonzero(violating)
+        if not len(targets):
+            return 0
+
+        # Shortest non-zero UV edge at each vertex, 0.002 for lone vertices
+        edges = mesh_arrays.edges(panel_obj.data)
+        length = np.linalg.norm(uv[edges[:, 0]] - uv[edges[:, 1]], axis=1)
+        spacing = np.full(len(uv), np.inf)
+        linked = edges[length > 0.0]
+        np.minimum.at(spacing, linked[:, 0], length[length > 0.0])
+        np.minimum.at(spacing, linked[:, 1], length[length > 0.0])
+        spacing[np.isinf(spacing)] = 0.002
+
+        anchor, _distance, segment = boundary.closest_points(uv[targets], segments)
+        inward = boundary.inward_directions(anchor, segments, segment)
+
+        min_pad = max(user_min_pad_uv, 1e-4)  # user slider wins as the minimum
+        smart = SMART_FACTOR * spacing[targets]
+        pad_uv = np.maximum(min_pad, smart) + eps_inside
+
+        new_uv = anchor + inward * pad_uv[:, None]
+        # if concave/corner still outside, back off
+        for _ in range(5):
+            retry = boundary.outside(new_uv, segments)
+            if not retry.any():
+                break
+            pad_uv[retry] *= 0.5
+            new_uv[retry] = anchor[retry] + inward[retry] * pad_uv[retry, None]
+
+        world = uv_map.from_uv(new_uv, uv_mesh_obj.matrix_world, scale_factor)
+        co = mesh_arrays.coords(panel_obj.data)
+        co[targets] = mesh_arrays.to_local(world, panel_obj.matrix_world)
+        mesh_arrays.set_coords(panel_obj.data, co)
+        return len(targets)
 
 
 class MESH_OT_ReselectUVViolations(bpy.types.Operator):
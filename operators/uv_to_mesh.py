@@ -6,6 +6,7 @@ from bpy.props import BoolProperty
 from bpy.types import Operator
 from mathutils import Vector
 
+from ..utils import profiling, uv_reference
 from ..utils.collections import add_object_to_panel_collection
 
 
@@ -84,6 +85,7 @@ class OBJECT_OT_UVToMesh(Operator):
             return context.scene.spp_shell_object.type == "MESH"
         return False
 
+    @profiling.instrument
     def execute(self, context):
         source_object_from_scene = context.scene.spp_shell_object
         if not source_object_from_scene:
@@ -198,7 +200,7 @@ class OBJECT_OT_UVToMesh(Operator):
             elif area_3d > 1e-9:
                 self.report({"WARNING"}, "UV mesh area zero, cannot auto-scale.")
 
-        ob_uv["spp_original_3d_mesh_name"] = original_source_name
+        uv_reference.link(source_object_from_scene, ob_uv)
         ob_uv["spp_applied_scale_factor"] = calculated_scale_factor
         if source_object_from_scene.data.uv_layers.active:
             ob_uv["spp_source_uv_map_name"] = (
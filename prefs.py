@@ -1,34 +1,58 @@
 import bpy
-from bpy.props import BoolProperty
+from bpy.props import BoolProperty, IntProperty
 from bpy.types import AddonPreferences
 from bpy.props import StringProperty
-from .utils import license_manager
+from .utils import license_manager, profiling, ui_state, undo
 
 
 # -------------------------------------------------------------------------
 ADDON_ID = __package__.split(".")[0] if __package__ else __name__.split(".")[0]
 
 
+@undo.interface
 class SPPVerifyLicenseOperator(bpy.types.Operator):
     bl_idname = "spp.verify_license"
     bl_label = "Verify License"
-    bl_options = {"REGISTER", "UNDO"}
+    bl_options = {"REGISTER"}
 
     def execute(self, context):
         prefs = get_prefs()
-        success, message = license_manager.validate_license(
-            prefs.license_key, prefs.buyer_email
+        if not prefs.license_key.strip():
+            self.report({"ERROR"}, "Enter a license key first")
+            return {"CANCELLED"}
+
+        # The request runs in the background; the result arrives via a timer.
+        # An offline key is accepted at once and sets the status itself.
+        prefs.license_status = "Verifying…"
+        started = license_manager.start_verification(
+            prefs.license_key.strip(), prefs.buyer_email, _on_license_result
         )
-        prefs.license_status = message
+        if started:
+            self.report({"INFO"}, "Verifying license in the background…")
+        else:
+            self.report({"INFO"}, "A license verification is already running")
+        return {"FINISHED"}
 
-        # If license verification successful, enable UI panels
-        if success and "verified" in message.lower():
-            license_manager.enable_ui_after_license()
-            self.report({"INFO"}, "License verified! UI panels enabled.")
-        elif not success:
-            self.report({"ERROR"}, f"License verification failed: {message}")
 
-        return {"FINISHED"}
+def _on_license_result(success, message):
+    """Apply a finished background verification (main thread)."""
+    try:
+        prefs = get_prefs()
+    except Exception:
+        return  # Add-on disabled meanwhile
+    prefs.license_status = message
+
+    # If license verification successful, enable UI panels
+    if success:
+        license_manager.enable_ui_after_license()
+        print(f"✅ Sneaker Panel Pro: {message} – UI panels enabled.")
+    else:
+        print(f"⚠ Sneaker Panel Pro: License verification failed: {message}")
+
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == "PREFERENCES":
+                area.tag_redraw()
 
 
 class SPPrefs(AddonPreferences):
@@ -54,6 +78,41 @@ class SPPrefs(AddonPreferences):
         default=False,
     )
 
+    lace_refresh_rate: IntProperty(
+        name="Lace Refresh Rate",
+        description="Maximum lace modifier re-evaluations per second while adjusting lace settings",
+        default=30,
+        min=1,
+        max=120,
+    )
+
+    debug_logging: BoolProperty(
+        name="Debug Logging",
+        description="Print detailed diagnostic messages (asset loading, timings) to the console",
+        default=False,
+    )
+
+    show_draw_timings: BoolProperty(
+        name="Show Panel Draw Times",
+        description="Overlay the draw time of each Sneaker Panel Pro panel in the 3D View sidebar",
+        default=False,
+        update=ui_state.update_overlay,
+    )
+
+    instrument_operators: BoolProperty(
+        name="Record Operator Timings",
+        description="Time instrumented operators and their phases; results show in the Performance sidebar panel",
+        default=False,
+        update=profiling.update_settings,
+    )
+
+    trace_operator_memory: BoolProperty(
+        name="Trace Memory Peaks",
+        description="Also record Python memory peaks per phase with tracemalloc (slows operators down)",
+        default=False,
+        update=profiling.update_settings,
+    )
+
     def draw(self, context):
         layout = self.layout
 
@@ -88,7 +147,20 @@ class SPPrefs(AddonPreferences):
         col.prop(self, "enable_experimental_qd")
         col.label(text="Experimental features may be unstable.", icon="INFO")
 
+        # Performance section
+        box = layout.box()
+        col = box.column(align=True)
+        col.label(text="Performance", icon="SORTTIME")
+        col.prop(self, "lace_refresh_rate")
+        col.prop(self, "debug_logging")
+        col.prop(self, "show_draw_timings")
+        col.prop(self, "instrument_operators")
+        sub = col.row()
+        sub.enabled = self.instrument_operators
+        sub.prop(self, "trace_operator_memory")
 
+
+@undo.interface
 class SPP_OT_ResetLicense(bpy.types.Operator):
     bl_idname = "spp.reset_license"
     bl_label = "Reset License"
@@ -116,6 +188,20 @@ def get_prefs(context=None):
     return context.preferences.addons[ADDON_ID].preferences
 
 
+def debug_enabled():
+    """Return the Debug Logging preference; False before it is registered."""
+    try:
+        return get_prefs().debug_logging
+    except Exception:
+        return False
+
+
+def debug(message):
+    """Print only when debug logging is enabled in the add-on preferences."""
+    if debug_enabled():
+        print(f"[SPP] {message}")
+
+
 def register():
     bpy.utils.register_class(SPPrefs)
     bpy.utils.register_class(SPPVerifyLicenseOperator)
@@ -123,6 +209,7 @@ def register():
 
 
 def unregister():
+    license_manager.cancel_verification()
     bpy.utils.unregister_class(SPPrefs)
     bpy.utils.unregister_class(SPPVerifyLicenseOperator)
     bpy.utils.unregister_class(SPP_OT_ResetLicense)
@@ -1,4 +1,6 @@
 import bpy
+from .operators.surface_resolution import update_active_surface_resolution
+from .utils import lace_refresh, lace_sockets
 from .utils.panel_utils import update_stabilizer, update_stabilizer_ui
 
 
@@ -13,19 +15,17 @@ from .utils.panel_utils import update_stabilizer, update_stabilizer_ui
 # inputs from being overwritten and restores proper live editing behaviour.
 
 
-# Helper to find the first SPP lace modifier on the active curve
+# Helper to find the SPP lace modifier on the active curve
 def _get_lace_modifier(context):
-    obj = context.active_object
-    if not obj or obj.type != "CURVE":
-        return None
-    for mod in obj.modifiers:
-        if mod.type == "NODES" and mod.node_group:
-            if (
-                "LaceFromCurves" in mod.node_group.name
-                or "spp_lace" in mod.node_group.name
-            ):
-                return mod
-    return None
+    return lace_sockets.get_lace_modifier(context.active_object, remember=True)
+
+
+def _queue_lace_input(context, mod, logical, value):
+    """Queue one lace socket write; the refresh scheduler applies it."""
+    key = lace_sockets.input_key(mod, logical)
+    if key is None:
+        return
+    lace_refresh.queue_socket_write(context.active_object, mod, key, value)
 
 
 # Profile update: set the profile type and (for custom) the profile object
@@ -36,33 +36,16 @@ def _update_lace_profile(self, context):
     scene = context.scene
     # Map enum to integer expected by the node group
     profile_map = {"ROUND": 0, "OVAL": 0, "FLAT": 1, "CUSTOM": 2}
-    profile_value = profile_map.get(scene.spp_lace_profile, 0)
-    try:
-        mod["Socket_1"] = profile_value
-    except Exception:
-        if "Lace Profile" in mod:
-            mod["Lace Profile"] = profile_value
+    writes = {}
+    profile_key = lace_sockets.input_key(mod, "profile")
+    if profile_key:
+        writes[profile_key] = profile_map.get(scene.spp_lace_profile, 0)
     # If custom, set the custom profile object
     if scene.spp_lace_profile == "CUSTOM" and scene.spp_lace_custom_profile:
-        for socket_name in [
-            "Socket_12",
-            "Custom Profile",
-            "Object",
-            "Profile Object",
-            "Profile",
-        ]:
-            try:
-                if socket_name in mod:
-                    mod[socket_name] = scene.spp_lace_custom_profile
-                    break
-            except Exception:
-                continue
-    # Refresh viewport
-    if hasattr(context, "view_layer"):
-        context.view_layer.update()
-    for area in context.screen.areas:
-        if area.type == "VIEW_3D":
-            area.tag_redraw()
+        custom_key = lace_sockets.input_key(mod, "custom_profile")
+        if custom_key:
+            writes[custom_key] = scene.spp_lace_custom_profile
+    lace_refresh.queue_socket_writes(context.active_object, mod, writes)
 
 
 # Scale update
@@ -70,18 +53,7 @@ def _update_lace_scale(self, context):
     mod = _get_lace_modifier(context)
     if not mod:
         return
-    scene = context.scene
-    try:
-        mod["Socket_2"] = scene.spp_lace_scale
-    except Exception:
-        if "Scale" in mod:
-            mod["Scale"] = scene.spp_lace_scale
-    # Refresh viewport
-    if hasattr(context, "view_layer"):
-        context.view_layer.update()
-    for area in context.screen.areas:
-        if area.type == "VIEW_3D":
-            area.tag_redraw()
+    _queue_lace_input(context, mod, "scale", context.scene.spp_lace_scale)
 
 
 # Resample update
@@ -89,18 +61,7 @@ def _update_lace_resample(self, context):
     mod = _get_lace_modifier(context)
     if not mod:
         return
-    scene = context.scene
-    try:
-        mod["Socket_8"] = scene.spp_lace_resample
-    except Exception:
-        if "Resample" in mod:
-            mod["Resample"] = scene.spp_lace_resample
-    # Refresh viewport
-    if hasattr(context, "view_layer"):
-        context.view_layer.update()
-    for area in context.screen.areas:
-        if area.type == "VIEW_3D":
-            area.tag_redraw()
+    _queue_lace_input(context, mod, "resample", context.scene.spp_lace_resample)
 
 
 # Tilt update
@@ -108,76 +69,28 @@ def _update_lace_tilt(self, context):
     mod = _get_lace_modifier(context)
     if not mod:
         return
-    scene = context.scene
-    try:
-        mod["Socket_3"] = scene.spp_lace_tilt
-    except Exception:
-        if "Tilt" in mod:
-            mod["Tilt"] = scene.spp_lace_tilt
-    # Refresh viewport
-    if hasattr(context, "view_layer"):
-        context.view_layer.update()
-    for area in context.screen.areas:
-        if area.type == "VIEW_3D":
-            area.tag_redraw()
-
-
-# --- REPLACE in properties.py ----------------------------------------------
-
-
-def _set_modifier_input_vec(mod, names, vec):
-    """Try multiple key names (and per-axis fallbacks) to set a vector."""
-    # 1) direct vector sockets
-    for key in names:
-        if key in mod:
-            mod[key] = vec
-            return True
-
-    # 2) per-axis fallback (e.g. "Free Normal X", "Free Normal Y", "Free Normal Z")
-    axis_keys_sets = [
-        ("Free Normal X", "Free Normal Y", "Free Normal Z"),
-        ("Free X", "Free Y", "Free Z"),
-        ("Socket_10.0", "Socket_10.1", "Socket_10.2"),
-    ]
-    for xk, yk, zk in axis_keys_sets:
-        if xk in mod and yk in mod and zk in mod:
-            mod[xk], mod[yk], mod[zk] = vec[0], vec[1], vec[2]
-            return True
-
-    return False
-
-
-def _force_modifier_recalc(context, obj, mod):
-    """Rock-solid refresh: toggle viewport, bump frame, tag updates."""
-    try:
-        if obj:
-            obj.update_tag()
-        dg = context.evaluated_depsgraph_get()
-        dg.update()
+    _queue_lace_input(context, mod, "tilt", context.scene.spp_lace_tilt)
 
-        if mod:
-            orig = mod.show_viewport
-            mod.show_viewport = False
-            context.view_layer.update()
-            mod.show_viewport = orig
 
-            if mod.node_group:
-                mod.node_group.update_tag()
+def _modifier_vec_writes(mod, vec):
+    """Resolve the key(s) for the free normal input, with a per-axis fallback.
 
-        # bump the frame to trigger GN
-        scn = context.scene
-        scn.frame_set(scn.frame_current)
-
-        # redraw 3D views
-        for area in context.screen.areas:
-            if area.type == "VIEW_3D":
-                area.tag_redraw()
+    Returns:
+        dict: Socket key -> value writes, empty if no matching input exists
+    """
+    key = lace_sockets.input_key(mod, "free_normal")
+    if key is not None:
+        return {key: tuple(vec)}
 
-        if hasattr(context, "view_layer"):
-            context.view_layer.update()
+    # per-axis fallback (e.g. "Free Normal X", "Free Normal Y", "Free Normal Z")
+    if mod.node_group:
+        mapping = lace_sockets.socket_map(mod.node_group)
+        for prefix in ("Free Normal", "Free"):
+            axis_keys = [mapping.get(f"{prefix} {axis}") for axis in "XYZ"]
+            if all(axis_keys):
+                return dict(zip(axis_keys, vec))
 
-    except Exception as e:
-        print(f"[SPP] Recalc refresh failed: {e}")
+    return {}
 
 
 def _update_lace_normal_mode(self, context):
@@ -192,22 +105,16 @@ def _update_lace_normal_mode(self, context):
         else scene.spp_lace_normal_mode
     )
 
-    # Write to either Socket_4 or the named input
-    wrote = False
-    for key in ("Socket_4", "Normal Mode"):
-        if key in mod:
-            mod[key] = normal_value
-            wrote = True
-            break
-
-    if not wrote:
-        print("[SPP] Normal Mode input not found on modifier (Socket_4/Normal Mode).")
-
-    # If switching to Free, immediately push the current free vector as well
+    # If switching to Free, push the current free vector in the same tick
     if normal_value == 2:
         _update_lace_free_normal(self, context)
-    else:
-        _force_modifier_recalc(context, context.active_object, mod)
+        return
+
+    key = lace_sockets.input_key(mod, "normal_mode")
+    if key is None:
+        print("[SPP] Normal Mode input not found on the lace modifier.")
+        return
+    lace_refresh.queue_socket_write(context.active_object, mod, key, normal_value)
 
 
 def _update_lace_free_normal(self, context):
@@ -215,25 +122,9 @@ def _update_lace_free_normal(self, context):
     if not mod:
         return
 
-    scene = context.scene
-    obj = context.active_object
-
-    # Always force modifier’s Normal Mode = Free (2) to ensure GN uses this branch.
-    for key in ("Socket_4", "Normal Mode"):
-        if key in mod:
-            try:
-                mod[key] = 2
-                break
-            except Exception:
-                pass
-
-    vec = scene.spp_lace_free_normal
-
-    # Robust name matching across asset variants
-    candidates = ("Socket_10", "Free Normal Controls", "Free Normal")
-    ok = _set_modifier_input_vec(mod, candidates, vec)
+    writes = _modifier_vec_writes(mod, context.scene.spp_lace_free_normal)
 
-    if not ok:
+    if not writes:
         # Log available keys once for debugging
         print(
             "[SPP] Could not find a Free Normal input. Available keys:",
@@ -241,10 +132,12 @@ def _update_lace_free_normal(self, context):
         )
         return
 
-    _force_modifier_recalc(context, obj, mod)
-
+    # Always force modifier’s Normal Mode = Free (2) to ensure GN uses this branch.
+    normal_key = lace_sockets.input_key(mod, "normal_mode")
+    if normal_key:
+        writes[normal_key] = 2
 
-# --- END REPLACE ------------------------------------------------------------
+    lace_refresh.queue_socket_writes(context.active_object, mod, writes)
 
 
 # Flip normal update
@@ -252,18 +145,7 @@ def _update_lace_flip_normal(self, context):
     mod = _get_lace_modifier(context)
     if not mod:
         return
-    scene = context.scene
-    try:
-        mod["Socket_6"] = scene.spp_lace_flip_normal
-    except Exception:
-        if "Flip Normal" in mod:
-            mod["Flip Normal"] = scene.spp_lace_flip_normal
-    # Refresh viewport
-    if hasattr(context, "view_layer"):
-        context.view_layer.update()
-    for area in context.screen.areas:
-        if area.type == "VIEW_3D":
-            area.tag_redraw()
+    _queue_lace_input(context, mod, "flip_normal", context.scene.spp_lace_flip_normal)
 
 
 # Shade smooth update
@@ -271,18 +153,7 @@ def _update_lace_shade_smooth(self, context):
     mod = _get_lace_modifier(context)
     if not mod:
         return
-    scene = context.scene
-    try:
-        mod["Socket_9"] = scene.spp_lace_shade_smooth
-    except Exception:
-        if "Shade Smooth" in mod:
-            mod["Shade Smooth"] = scene.spp_lace_shade_smooth
-    # Refresh viewport
-    if hasattr(context, "view_layer"):
-        context.view_layer.update()
-    for area in context.screen.areas:
-        if area.type == "VIEW_3D":
-            area.tag_redraw()
+    _queue_lace_input(context, mod, "shade_smooth", context.scene.spp_lace_shade_smooth)
 
 
 # Color update
@@ -290,18 +161,7 @@ def _update_lace_color(self, context):
     mod = _get_lace_modifier(context)
     if not mod:
         return
-    scene = context.scene
-    try:
-        mod["Socket_11"] = scene.spp_lace_color
-    except Exception:
-        if "Color" in mod:
-            mod["Color"] = scene.spp_lace_color
-    # Refresh viewport
-    if hasattr(context, "view_layer"):
-        context.view_layer.update()
-    for area in context.screen.areas:
-        if area.type == "VIEW_3D":
-            area.tag_redraw()
+    _queue_lace_input(context, mod, "color", tuple(context.scene.spp_lace_color))
 
 
 # Custom profile update (used when the user changes the custom profile field
@@ -313,26 +173,7 @@ def _update_lace_custom_profile(self, context):
     scene = context.scene
     if scene.spp_lace_profile != "CUSTOM" or not scene.spp_lace_custom_profile:
         return
-    for socket_name in [
-        "Socket_12",
-        "Custom Profile",
-        "Object",
-        "Profile Object",
-        "Profile",
-    ]:
-        try:
-            if socket_name in mod:
-                mod[socket_name] = scene.spp_lace_custom_profile
-                break
-        except Exception as e:
-            print(f"Failed to set custom profile via {socket_name}: {e}")
-            continue
-    # Refresh viewport
-    if hasattr(context, "view_layer"):
-        context.view_layer.update()
-    for area in context.screen.areas:
-        if area.type == "VIEW_3D":
-            area.tag_redraw()
+    _queue_lace_input(context, mod, "custom_profile", scene.spp_lace_custom_profile)
 
 
 def _update_reference_image_opacity(self, context):
@@ -482,6 +323,12 @@ def register_properties():
 
     # Use custom material property removed - using default lace material only
 
+    bpy.types.Object.spp_lace_modifier = bpy.props.StringProperty(
+        name="Lace Modifier",
+        description="Name of the lace Geometry Nodes modifier on this curve",
+        default="",
+    )
+
     # -------------------------------------------------------------------------
     # Panel identification and naming properties
     # -------------------------------------------------------------------------
@@ -627,6 +474,35 @@ def register_properties():
         update=_update_curve_cyclic,
     )
 
+    # -------------------------------------------------------------------------
+    # Surface resolution properties
+    # -------------------------------------------------------------------------
+    bpy.types.Scene.spp_resolution_u = bpy.props.IntProperty(
+        name="Resolution U",
+        description="Surface resolution in the U direction for the active curve or surface",
+        default=12,
+        min=1,
+        soft_max=64,
+        update=update_active_surface_resolution,
+    )
+
+    bpy.types.Scene.spp_resolution_v = bpy.props.IntProperty(
+        name="Resolution V",
+        description="Surface resolution in the V direction for the active curve or surface",
+        default=12,
+        min=1,
+        soft_max=64,
+        update=update_active_surface_resolution,
+    )
+
+    bpy.types.Scene.spp_resolution_preview_cap = bpy.props.IntProperty(
+        name="Preview Resolution",
+        description="Maximum resolution shown while dragging; the full value is applied on release",
+        default=6,
+        min=1,
+        max=64,
+    )
+
     # -------------------------------------------------------------------------
     # Solidify modifier properties
     # -------------------------------------------------------------------------
@@ -702,6 +578,12 @@ def register_properties():
         default=True,
     )
 
+    bpy.types.Scene.spp_panel_apply_added_modifiers = bpy.props.BoolProperty(
+        name="Apply Added Modifiers",
+        description="Apply the subdivision (and re-conform) to the panel instead of leaving the modifiers live",
+        default=True,
+    )
+
     bpy.types.Scene.spp_panel_shade_smooth = bpy.props.BoolProperty(
         name="Shade Smooth Panel",
         description="Apply smooth shading to the final panel",
@@ -967,6 +849,10 @@ def unregister_properties():
         "spp_decimate_ratio",
         # Curve processing
         "spp_curve_cyclic",
+        # Surface resolution
+        "spp_resolution_u",
+        "spp_resolution_v",
+        "spp_resolution_preview_cap",
         # Solidify
         "spp_solidify_thickness",
         "spp_solidify_offset",
@@ -977,6 +863,7 @@ def unregister_properties():
         "spp_panel_add_subdivision",
         "spp_panel_subdivision_levels",
         "spp_panel_conform_after_subdivision",
+        "spp_panel_apply_added_modifiers",
         "spp_panel_shade_smooth",
         # Curve sampling
         "spp_sampler_fidelity",
@@ -1009,6 +896,10 @@ def unregister_properties():
         if hasattr(bpy.types.Scene, prop):
             delattr(bpy.types.Scene, prop)
 
+    if hasattr(bpy.types.Object, "spp_lace_modifier"):
+        del bpy.types.Object.spp_lace_modifier
+    lace_sockets.clear_cache()
+
 
 def register():
     """Register all properties."""
@@ -1017,6 +908,7 @@ def register():
 
 def unregister():
     """Unregister all properties."""
+    lace_refresh.cancel()
     unregister_properties()
 
 
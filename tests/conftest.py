@@ -0,0 +1,29 @@
+"""
+Test setup.
+
+The ``core`` kernels need only NumPy and are imported as the top-level
+``core`` package. Tests of add-on modules import them from this checkout
+with ``import_addon_module`` and are skipped without the ``bpy`` module
+(``pip install bpy``) or Blender's own Python. Without ``bpy``, run pytest
+from this directory: from the checkout root it also imports the add-on's
+own ``__init__``.
+"""
+
+import importlib
+import os
+import sys
+
+import pytest
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_NAME = os.path.basename(ADDON_DIR)
+
+for path in (ADDON_DIR, os.path.dirname(ADDON_DIR)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def import_addon_module(name):
+    """Import ``name`` (e.g. "utils.license_manager") from the add-on."""
+    pytest.importorskip("bpy")
+    return importlib.import_module(f"{ADDON_NAME}.{name}")
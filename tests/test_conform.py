@@ -0,0 +1,93 @@
+"""
+Conform engine: object and edit mode give the same result.
+"""
+
+import numpy as np
+import pytest
+
+from conftest import import_addon_module
+
+bpy = pytest.importorskip("bpy")
+bmesh = pytest.importorskip("bmesh")
+conform = import_addon_module("utils.conform")
+
+RADIUS = 2.0
+
+
+@pytest.fixture
+def scene():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    conform.invalidate()
+    bpy.ops.mesh.primitive_uv_sphere_add(radius=RADIUS, segments=64, ring_count=32)
+    shell = bpy.context.active_object
+    bpy.ops.mesh.primitive_grid_add(
+        x_subdivisions=8, y_subdivisions=8, size=1.0, location=(0, 0, 2.5)
+    )
+    panel = bpy.context.active_object
+    yield shell, panel
+    conform.invalidate()
+
+
+def _world_coords(obj):
+    mesh = obj.data
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    mw = np.array(obj.matrix_world, dtype=np.float64)
+    return co.reshape(-1, 3) @ mw[:3, :3].T + mw[:3, 3]
+
+
+def _assert_on_sphere(obj, offset=0.0):
+    radii = np.linalg.norm(_world_coords(obj), axis=1)
+    # The UV sphere's faces sit slightly inside its radius
+    assert np.allclose(radii, RADIUS + offset, atol=0.01)
+
+
+def test_object_mode(scene):
+    shell, panel = scene
+    moved = conform.conform_object(panel, shell)
+    assert moved == len(panel.data.vertices)
+    _assert_on_sphere(panel)
+
+
+def test_edit_mode_after_topology_change(scene):
+    shell, panel = scene
+    bpy.ops.object.mode_set(mode="EDIT")
+    # Outdates the edit mesh's vertex lookup table
+    bm = bmesh.from_edit_mesh(panel.data)
+    bmesh.ops.subdivide_edges(bm, edges=bm.edges[:4], cuts=1)
+    bmesh.update_edit_mesh(panel.data)
+    count = len(bm.verts)
+
+    moved = conform.conform_object(panel, shell, offset=0.01)
+    bpy.ops.object.mode_set(mode="OBJECT")
+    assert moved == count
+    _assert_on_sphere(panel, offset=0.01)
+
+
+def test_edit_mode_matches_object_mode(scene):
+    shell, panel = scene
+    copy = panel.copy()
+    copy.data = panel.data.copy()
+    bpy.context.scene.collection.objects.link(copy)
+
+    conform.conform_object(copy, shell)
+    bpy.ops.object.mode_set(mode="EDIT")
+    conform.conform_object(panel, shell)
+    bpy.ops.object.mode_set(mode="OBJECT")
+    assert np.allclose(_world_coords(panel), _world_coords(copy), atol=1e-5)
+
+
+def test_edit_mode_selection(scene):
+    shell, panel = scene
+    bpy.ops.object.mode_set(mode="EDIT")
+    bm = bmesh.from_edit_mesh(panel.data)
+    for vert in bm.verts:
+        vert.select = vert.co.x > 0.0
+    selected = sum(v.select for v in bm.verts)
+
+    moved = conform.conform_object(panel, shell, selected_only=True)
+    bpy.ops.object.mode_set(mode="OBJECT")
+    assert moved == selected
+    co = _world_coords(panel)
+    on_shell = np.isclose(np.linalg.norm(co, axis=1), RADIUS, atol=0.01)
+    assert on_shell.sum() == selected
@@ -0,0 +1,111 @@
+"""
+UV boundary kernels: inside/outside, closest point and inward direction.
+"""
+
+import numpy as np
+import pytest
+
+from core import boundary
+
+# Diamond: the rows y = 0.5 pass exactly through its left and right corners
+DIAMOND = [(0.5, 0.2), (0.8, 0.5), (0.5, 0.8), (0.2, 0.5)]
+
+
+def _polygon_segments(corners):
+    corners = np.asarray(corners, dtype=np.float64)
+    return np.stack((corners, np.roll(corners, -1, axis=0)), axis=1)
+
+
+def _grid_mesh(n, lo=0.2, hi=0.8):
+    """Quad grid over [lo, hi]^2 as face loops with per-corner UVs."""
+    u = np.linspace(lo, hi, n + 1)
+    uv = np.stack(np.meshgrid(u, u), axis=-1).reshape(-1, 2)
+    r = n + 1
+    quads = [
+        (j * r + i, j * r + i + 1, (j + 1) * r + i + 1, (j + 1) * r + i)
+        for j in range(n)
+        for i in range(n)
+    ]
+    loop_verts = np.array(quads, dtype=np.int64).ravel()
+    loop_start = np.arange(0, len(loop_verts), 4)
+    loop_total = np.full(len(quads), 4)
+    return loop_verts, loop_start, loop_total, uv[loop_verts]
+
+
+def test_uv_segments_of_grid():
+    segments = boundary.uv_segments(*_grid_mesh(2))
+    assert segments.shape == (8, 2, 2)
+    # Every boundary segment lies on the square's outline
+    on_edge = np.isclose(segments, 0.2) | np.isclose(segments, 0.8)
+    assert np.all(on_edge.any(axis=-1))
+
+
+def test_row_through_shared_vertices():
+    segments = _polygon_segments(DIAMOND)
+    points = [(0.5, 0.5), (0.3, 0.5), (0.7, 0.5), (0.1, 0.5), (0.9, 0.5)]
+    result = boundary.outside(points, segments, tolerance=0.0)
+    assert result.tolist() == [False, False, False, True, True]
+
+
+def test_row_grazing_a_corner():
+    # The ray from these points touches the diamond's top corner only
+    segments = _polygon_segments(DIAMOND)
+    result = boundary.outside([(0.3, 0.8), (0.1, 0.2)], segments, tolerance=0.0)
+    assert result.tolist() == [True, True]
+
+
+def test_points_on_grid_rows_and_columns():
+    segments = boundary.uv_segments(*_grid_mesh(4))
+    # Rows and columns through the grid's boundary vertices
+    u = np.linspace(0.2, 0.8, 5)
+    inner = np.stack(np.meshgrid(u[1:-1], u[1:-1]), axis=-1).reshape(-1, 2)
+    assert not boundary.outside(inner, segments, tolerance=0.0).any()
+    rows = np.stack((np.full(5, 0.1), u), axis=-1)
+    assert boundary.outside(rows, segments).all()
+
+
+def test_tolerance_and_unit_square():
+    segments = _polygon_segments(DIAMOND)
+    # Just outside the lower right edge, within the default tolerance
+    near_edge = np.array((0.65, 0.35)) + np.array((1.0, -1.0)) * 1.0e-7
+    assert boundary.outside([near_edge], segments, tolerance=0.0)[0]
+    assert not boundary.outside([near_edge], segments)[0]
+    assert boundary.outside([(-0.1, 0.5), (0.5, 1.5)], segments).all()
+
+
+def test_no_segments_is_all_outside():
+    empty = np.zeros((0, 2, 2))
+    assert boundary.outside([(0.5, 0.5)], empty).all()
+
+
+@pytest.mark.parametrize("batch_pairs", [1, 3, 7])
+def test_outside_batches(monkeypatch, batch_pairs):
+    segments = boundary.uv_segments(*_grid_mesh(3))
+    points = np.random.default_rng(1).uniform(0.0, 1.0, (200, 2))
+    expected = boundary.outside(points, segments)
+    monkeypatch.setattr(boundary, "_BATCH_PAIRS", batch_pairs)
+    assert np.array_equal(boundary.outside(points, segments), expected)
+
+
+def test_closest_points():
+    segments = _polygon_segments([(0.2, 0.2), (0.8, 0.2), (0.8, 0.8), (0.2, 0.8)])
+    closest, distance, segment = boundary.closest_points(
+        [(0.5, 0.1), (0.9, 0.9), (0.5, 0.5)], segments
+    )
+    assert np.allclose(closest[:2], [(0.5, 0.2), (0.8, 0.8)])
+    assert np.allclose(distance, [0.1, np.hypot(0.1, 0.1), 0.3])
+    assert segment[0] == 0
+
+
+def test_inward_directions():
+    segments = _polygon_segments([(0.2, 0.2), (0.8, 0.2), (0.8, 0.8), (0.2, 0.8)])
+    anchors = [(0.5, 0.2), (0.8, 0.5), (0.5, 0.8), (0.2, 0.5)]
+    directions = boundary.inward_directions(anchors, segments, np.arange(4))
+    assert np.allclose(directions, [(0, 1), (-1, 0), (0, -1), (1, 0)])
+
+
+def test_inward_direction_of_degenerate_segment():
+    segments = _polygon_segments([(0.2, 0.2), (0.8, 0.2), (0.8, 0.8), (0.2, 0.8)])
+    segments = np.concatenate((segments, [[(0.2, 0.2), (0.2, 0.2)]]))
+    direction = boundary.inward_directions([(0.2, 0.2)], segments, [4])[0]
+    assert np.allclose(direction, np.array((1.0, 1.0)) / np.sqrt(2.0))
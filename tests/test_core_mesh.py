@@ -0,0 +1,170 @@
+"""
+Mesh kernels: topology, quadric collapse, relaxation, resampling, edge flow.
+"""
+
+import numpy as np
+
+from core import collapse, edge_flow, relax, resample, topology
+
+
+def _grid(n):
+    """Flat n x n quad grid in the XY plane over [0, 1]^2."""
+    u = np.linspace(0.0, 1.0, n + 1)
+    uu, vv = np.meshgrid(u, u)
+    co = np.stack((uu.ravel(), vv.ravel(), np.zeros(uu.size)), axis=-1)
+    r = n + 1
+    quads = [
+        (j * r + i, j * r + i + 1, (j + 1) * r + i + 1, (j + 1) * r + i)
+        for j in range(n)
+        for i in range(n)
+    ]
+    loop_verts = np.array(quads, dtype=np.int64).ravel()
+    loop_start = np.arange(0, len(loop_verts), 4)
+    loop_total = np.full(len(quads), 4)
+    return co, loop_verts, loop_start, loop_total
+
+
+# -------------------------------------------------------------------------
+# Topology
+# -------------------------------------------------------------------------
+def test_loop_next_mixed_faces():
+    # A triangle then a quad
+    nxt = topology.loop_next([0, 3], [3, 4])
+    assert nxt.tolist() == [1, 2, 0, 4, 5, 6, 3]
+
+
+def test_boundary_vertices_of_grid():
+    co, *loops = _grid(2)
+    mask = topology.boundary_vertex_mask(len(co), *loops)
+    assert mask.tolist() == [True] * 4 + [False] + [True] * 4
+
+
+def test_wire_edges_count_as_boundary():
+    co, *loops = _grid(1)
+    edges = [(0, 1), (1, 3), (3, 2), (2, 0), (3, 4)]
+    mask = topology.boundary_vertex_mask(5, *loops, edges=edges)
+    assert mask.all()
+    assert topology.wire_edges(edges, topology.face_edges(*loops)).tolist() == [[3, 4]]
+
+
+# -------------------------------------------------------------------------
+# Quadric collapse
+# -------------------------------------------------------------------------
+def test_flat_interior_collapse_is_free():
+    co, *loops = _grid(4)
+    quadrics = collapse.vertex_quadrics(co, *loops)
+    # Two interior vertices in the middle of the grid
+    a, b = 6, 7
+    cost, position = collapse.collapse_position(quadrics[a] + quadrics[b], co[a], co[b])
+    assert cost < 1e-12
+    assert np.isclose(position[2], 0.0)
+
+
+def test_boundary_vertex_resists_moving_inward():
+    co, *loops = _grid(4)
+    quadrics = collapse.vertex_quadrics(co, *loops)
+    # Vertex 2 is on the bottom edge: sliding along it is free, leaving it is not
+    assert collapse.quadric_error(quadrics[2], co[3]) < 1e-12
+    assert collapse.quadric_error(quadrics[2], co[7]) > 0.5
+
+
+def test_off_plane_position_costs():
+    co, *loops = _grid(2)
+    quadrics = collapse.vertex_quadrics(co, *loops)
+    lifted = co[4] + (0.0, 0.0, 0.1)
+    assert collapse.quadric_error(quadrics[4], lifted) > 0.0
+
+
+def test_degenerate_faces_add_nothing():
+    co = np.zeros((3, 3))
+    quadrics = collapse.vertex_quadrics(co, [0, 1, 2], [0], [3])
+    assert np.allclose(quadrics, 0.0)
+
+
+def test_wire_edges_get_line_quadrics():
+    co = np.array([(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (2.0, 0.0, 0.0)])
+    quadrics = collapse.vertex_quadrics(co, [], [], [], edges=[(0, 1), (1, 2)])
+    assert collapse.quadric_error(quadrics[1], (1.5, 0.0, 0.0)) < 1e-12
+    assert collapse.quadric_error(quadrics[1], (1.0, 1.0, 0.0)) > 0.0
+
+
+# -------------------------------------------------------------------------
+# Relaxation
+# -------------------------------------------------------------------------
+def test_laplacian_moves_toward_neighbours():
+    co = np.array([(0.0, 0.0, 0.0), (1.0, 1.0, 0.0), (2.0, 0.0, 0.0), (5.0, 5.0, 5.0)])
+    edges = [(0, 1), (1, 2)]
+    movable = np.array([False, True, False, True])
+
+    result = relax.laplacian(co, edges, factor=0.5, movable=movable)
+    assert np.allclose(result[1], (1.0, 0.5, 0.0))
+    # Pinned and isolated vertices stay
+    assert np.allclose(result[[0, 2, 3]], co[[0, 2, 3]])
+
+
+def test_laplacian_is_order_independent():
+    co = np.random.default_rng(4).normal(size=(6, 3))
+    edges = [(i, (i + 1) % 6) for i in range(6)]
+    order = [3, 0, 5, 1, 4, 2]
+    inverse = np.argsort(order)
+    relabelled = [(inverse[a], inverse[b]) for a, b in edges]
+
+    result = relax.laplacian(co, edges, iterations=3)
+    shuffled = relax.laplacian(co[order], relabelled, iterations=3)
+    assert np.allclose(shuffled[inverse], result)
+
+
+# -------------------------------------------------------------------------
+# Resampling
+# -------------------------------------------------------------------------
+def test_order_polylines():
+    # Open chains start at their lowest end, closed ones at their lowest vertex
+    chains = resample.order_polylines(6, [(2, 1), (1, 0), (3, 4), (4, 5), (5, 3)])
+    assert [c.tolist() for c in chains] == [[0, 1, 2], [3, 4, 5]]
+
+
+def test_order_polylines_isolated_vertex():
+    chains = resample.order_polylines(3, [(0, 1)])
+    assert [c.tolist() for c in chains] == [[0, 1], [2]]
+
+
+def test_resample_spacing():
+    points = np.array([(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 3.0, 0.0)])
+    samples = resample.resample_polyline(points, 4)
+    assert np.allclose(samples, [(0, 0, 0), (1, 0, 0), (1, 1, 0), (1, 2, 0)])
+
+
+def test_resample_degenerate_inputs():
+    assert resample.resample_polyline(np.zeros((0, 3)), 4).shape == (0, 3)
+    assert resample.resample_polyline(np.ones((3, 3)), 1).shape == (0, 3)
+    same = resample.resample_polyline(np.ones((3, 3)), 4)
+    assert np.allclose(same, 1.0)
+
+
+# -------------------------------------------------------------------------
+# Edge flow
+# -------------------------------------------------------------------------
+def test_flow_straightens_between_rings():
+    positions = np.array([(0.0, 0.0, 0.0), (1.0, 0.0, 0.5), (2.0, 0.0, 0.0)])
+    result = edge_flow.flow(positions, [1], [0], [2], tension=0.0, iterations=1)
+    assert np.allclose(result[1], (1.0, 0.0, 0.0))
+    assert np.allclose(result[[0, 2]], positions[[0, 2]])
+
+
+def test_ordered_chains():
+    edges = [("a", "b"), ("b", "c"), (1, 2), (2, 3), (3, 1)]
+    chains = edge_flow.ordered_chains(edges)
+    assert chains[0] == (["a", "b", "c"], False)
+    assert sorted(chains[1][0]) == [1, 2, 3]
+    assert chains[1][1] is True
+
+
+def test_blend_open_ends():
+    original = np.zeros((5, 3))
+    moved = np.ones((5, 3))
+    chains = [(np.arange(5), False)]
+    result = edge_flow.blend_open_ends(moved, original, chains, zone=2)
+    assert np.allclose(result[:, 0], [0.0, 0.5, 1.0, 0.5, 0.0])
+    # Closed chains are left alone
+    closed = edge_flow.blend_open_ends(moved, original, [(np.arange(5), True)], 2)
+    assert np.allclose(closed, 1.0)
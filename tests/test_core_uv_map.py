@@ -0,0 +1,149 @@
+"""
+UV to surface mapping: triangle lookup and barycentric interpolation.
+"""
+
+import numpy as np
+import pytest
+
+from core import uv_map
+
+
+def _surface(uv):
+    """Affine map used as the 3D surface: barycentric mapping is exact on it."""
+    uv = np.asarray(uv, dtype=np.float64)
+    u, v = uv[..., 0], uv[..., 1]
+    return np.stack((2.0 * u + 1.0, 3.0 * v, u - v), axis=-1)
+
+
+def _grid_triangles(n):
+    """Unit square split into n x n quads, two triangles each."""
+    u = np.linspace(0.0, 1.0, n + 1)
+    tris = []
+    for j in range(n):
+        for i in range(n):
+            a, b = (u[i], u[j]), (u[i + 1], u[j])
+            c, d = (u[i + 1], u[j + 1]), (u[i], u[j + 1])
+            tris += [(a, b, c), (a, c, d)]
+    tri_uv = np.array(tris, dtype=np.float64)
+    return tri_uv, _surface(tri_uv)
+
+
+def test_barycentric_weights():
+    a, b, c = np.array([(0.0, 0.0)]), np.array([(1.0, 0.0)]), np.array([(0.0, 1.0)])
+    points = np.array([(0.25, 0.25), (1.0, 0.0), (0.0, 0.0)])
+    w = uv_map.barycentric(points, *(np.repeat(x, 3, axis=0) for x in (a, b, c)))
+    assert np.allclose(w, [(0.5, 0.25, 0.25), (0.0, 1.0, 0.0), (1.0, 0.0, 0.0)])
+
+
+def test_barycentric_degenerate_triangle():
+    a = np.array([(0.0, 0.0)])
+    b = np.array([(1.0, 1.0)])
+    w = uv_map.barycentric(np.array([(0.5, 0.5)]), a, b, b * 2.0)
+    assert np.isnan(w).all()
+
+
+def test_uv_to_surface_on_grid():
+    tri_uv, tri_co = _grid_triangles(4)
+    grid = uv_map.TriangleGrid(tri_uv)
+    uv = np.random.default_rng(2).uniform(0.0, 1.0, (500, 2))
+
+    positions, found = uv_map.uv_to_surface(uv, tri_co, grid)
+    assert found.all()
+    assert np.allclose(positions, _surface(uv))
+
+
+def test_points_on_shared_vertices_and_edges():
+    tri_uv, tri_co = _grid_triangles(4)
+    grid = uv_map.TriangleGrid(tri_uv)
+    u = np.linspace(0.0, 1.0, 9)
+    # Grid vertices, edge midpoints and the diagonals shared by two triangles
+    uv = np.stack(np.meshgrid(u, u), axis=-1).reshape(-1, 2)
+
+    positions, found = uv_map.uv_to_surface(uv, tri_co, grid)
+    assert found.all()
+    assert np.allclose(positions, _surface(uv))
+
+
+def test_points_outside():
+    tri_uv, tri_co = _grid_triangles(2)
+    grid = uv_map.TriangleGrid(tri_uv)
+    uv = np.array([(-0.1, 0.5), (0.5, 1.2), (2.0, 2.0)])
+
+    positions, found = uv_map.uv_to_surface(uv, tri_co, grid)
+    assert not found.any()
+    assert np.allclose(positions[:, :2], uv)
+    assert np.allclose(positions[:, 2], 0.0)
+
+
+def test_degenerate_triangles_are_skipped():
+    tri_uv, tri_co = _grid_triangles(2)
+    # A zero-area triangle over the same area, listed first
+    sliver = np.array([[(0.0, 0.0), (1.0, 1.0), (0.5, 0.5)]])
+    tri_uv = np.concatenate((sliver, tri_uv))
+    tri_co = np.concatenate((np.zeros((1, 3, 3)), tri_co))
+    grid = uv_map.TriangleGrid(tri_uv)
+    uv = np.array([(0.5, 0.5), (0.25, 0.25), (0.3, 0.7)])
+
+    triangle, _weights = uv_map.locate(uv, grid)
+    assert (triangle > 0).all()
+    positions, found = uv_map.uv_to_surface(uv, tri_co, grid)
+    assert found.all()
+    assert np.allclose(positions, _surface(uv))
+
+
+def test_only_degenerate_triangles():
+    grid = uv_map.TriangleGrid([[(0.0, 0.0), (1.0, 1.0), (0.5, 0.5)]])
+    triangle, _weights = uv_map.locate([(0.5, 0.5)], grid)
+    assert triangle.tolist() == [-1]
+
+
+def test_empty_grid():
+    grid = uv_map.TriangleGrid(np.zeros((0, 3, 2)))
+    triangle, _weights = uv_map.locate([(0.5, 0.5)], grid)
+    assert triangle.tolist() == [-1]
+
+
+@pytest.mark.parametrize("batch_pairs", [1, 2, 3, 5])
+def test_locate_batches_keep_first_hit(monkeypatch, batch_pairs):
+    tri_uv, tri_co = _grid_triangles(3)
+    grid = uv_map.TriangleGrid(tri_uv, resolution=2)
+    u = np.linspace(0.0, 1.0, 7)
+    uv = np.concatenate(
+        (
+            np.stack(np.meshgrid(u, u), axis=-1).reshape(-1, 2),
+            np.random.default_rng(3).uniform(0.0, 1.0, (50, 2)),
+        )
+    )
+    expected_tri, expected_w = uv_map.locate(uv, grid)
+
+    # Small batches split one point's candidates across batches
+    monkeypatch.setattr(uv_map, "_BATCH_PAIRS", batch_pairs)
+    triangle, weights = uv_map.locate(uv, grid)
+    assert np.array_equal(triangle, expected_tri)
+    assert np.allclose(weights, expected_w)
+    positions, found = uv_map.uv_to_surface(uv, tri_co, grid)
+    assert found.all()
+    assert np.allclose(positions, _surface(uv))
+
+
+def test_locate_picks_lowest_candidate():
+    tri_uv, _tri_co = _grid_triangles(1)
+    grid = uv_map.TriangleGrid(tri_uv)
+    # On the diagonal shared by both triangles
+    triangle, weights = uv_map.locate([(0.5, 0.5)], grid)
+    assert triangle.tolist() == [0]
+    assert np.allclose(weights.sum(axis=1), 1.0)
+
+
+def test_to_uv_round_trip():
+    matrix = np.array(
+        [
+            [0.0, -2.0, 0.0, 1.0],
+            [2.0, 0.0, 0.0, 2.0],
+            [0.0, 0.0, 2.0, 3.0],
+            [0.0, 0.0, 0.0, 1.0],
+        ]
+    )
+    uv = np.array([(0.1, 0.2), (0.9, 0.4)])
+    world = uv_map.from_uv(uv, matrix, scale=0.5)
+    assert np.allclose(uv_map.to_uv(world, np.linalg.inv(matrix), 0.5), uv)
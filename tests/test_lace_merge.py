@@ -0,0 +1,77 @@
+"""
+Merging lace curves into one multi-spline curve.
+"""
+
+import numpy as np
+import pytest
+
+from conftest import import_addon_module
+
+bpy = pytest.importorskip("bpy")
+lace_apply = import_addon_module("operators.spp_lace_apply")
+
+
+@pytest.fixture
+def scene():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+
+
+def _curve(name, location):
+    data = bpy.data.curves.new(name, type="CURVE")
+    data.dimensions = "3D"
+    obj = bpy.data.objects.new(name, data)
+    bpy.context.scene.collection.objects.link(obj)
+    obj.location = location
+    return obj
+
+
+def _nurbs(obj, count, order):
+    spline = obj.data.splines.new("NURBS")
+    spline.points.add(count - 1)
+    for i, point in enumerate(spline.points):
+        point.co = (i, i % 2, 0.0, 1.0)
+    spline.order_u = order
+    spline.use_endpoint_u = True
+    return spline
+
+
+def test_nurbs_order_survives_merge(scene):
+    a = _curve("LaceA", (0.0, 0.0, 0.0))
+    b = _curve("LaceB", (0.0, 5.0, 0.0))
+    _nurbs(a, 6, 4)
+    _nurbs(b, 5, 3).use_cyclic_u = True
+    bpy.context.view_layer.update()
+
+    merged = lace_apply.merge_curves_to_one([a, b], "Merged")
+    splines = merged.data.splines
+    assert [s.order_u for s in splines] == [4, 3]
+    assert [s.use_endpoint_u for s in splines] == [True, True]
+    assert [s.use_cyclic_u for s in splines] == [False, True]
+    assert [len(s.points) for s in splines] == [6, 5]
+
+
+def test_points_moved_to_world_space(scene):
+    a = _curve("LaceA", (1.0, 2.0, 3.0))
+    _nurbs(a, 4, 4)
+    bpy.context.view_layer.update()
+
+    merged = lace_apply.merge_curves_to_one([a], "Merged")
+    co = np.array([p.co[:3] for p in merged.data.splines[0].points])
+    expected = np.array([(i + 1.0, i % 2 + 2.0, 3.0) for i in range(4)])
+    assert np.allclose(co, expected)
+    assert a.hide_viewport
+
+
+def test_bezier_spline_copied(scene):
+    a = _curve("LaceA", (0.0, 0.0, 1.0))
+    spline = a.data.splines.new("BEZIER")
+    spline.bezier_points.add(2)
+    for i, point in enumerate(spline.bezier_points):
+        point.co = (i, 0.0, 0.0)
+        point.handle_left_type = point.handle_right_type = "AUTO"
+    bpy.context.view_layer.update()
+
+    merged = lace_apply.merge_curves_to_one([a], "Merged")
+    points = merged.data.splines[0].bezier_points
+    assert len(points) == 3
+    assert np.allclose([p.co.z for p in points], 1.0)
@@ -0,0 +1,341 @@
+"""
+License verification against a local stand-in for the Gumroad API.
+"""
+
+import json
+import socket
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from conftest import import_addon_module
+
+lm = import_addon_module("utils.license_manager")
+
+# License key -> stand-in API response
+RESPONSES = {
+    "GOOD-KEY": {"success": True, "purchase": {"email": "buyer@example.com"}},
+    "REFUNDED-KEY": {"success": True, "purchase": {"refunded": True}},
+}
+REJECTION = {
+    "success": False,
+    "message": "That license does not exist for the provided product.",
+}
+
+
+class _GumroadHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        form = urllib.parse.parse_qs(self.rfile.read(length).decode("utf-8"))
+        key = form.get("license_key", [""])[0]
+        self.server.requests.append(form)
+
+        body = json.dumps(RESPONSES.get(key, REJECTION)).encode("utf-8")
+        self.send_response(200 if key in RESPONSES else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _GumroadHandler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/verify"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def closed_url():
+    """URL of a local port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/verify"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep the license and trial caches out of the user's config."""
+    path = str(tmp_path / "spp_license.json")
+    monkeypatch.setattr(lm, "local_license_path", lambda: path)
+    monkeypatch.setattr(lm, "TRIAL_FILE", str(tmp_path / "spp_trial.json"))
+    yield tmp_path
+    _finish_verification()
+    lm.cancel_verification()
+
+
+def _finish_verification():
+    """Wait for the worker and run the timer callback it would get."""
+    if lm._worker is not None:
+        lm._worker.join(timeout=lm.VERIFY_TIMEOUT + 5)
+    while not lm._results.empty():
+        lm._poll_verification()
+
+
+def _write_cache(data):
+    with open(lm.local_license_path(), "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+# -------------------------------------------------------------------------
+# Gumroad request
+# -------------------------------------------------------------------------
+def test_verify_success(server):
+    success, message = lm.verify_gumroad_license("GOOD-KEY", server.url)
+    assert success
+    assert "buyer@example.com" in message
+    assert server.requests[0]["product_permalink"] == [lm.PRODUCT_PERMALINK]
+
+
+def test_verify_rejected(server):
+    success, message = lm.verify_gumroad_license("BAD-KEY", server.url)
+    assert not success
+    assert message == REJECTION["message"]
+
+
+def test_verify_refunded(server):
+    success, message = lm.verify_gumroad_license("REFUNDED-KEY", server.url)
+    assert not success
+    assert "refunded" in message
+
+
+def test_verify_network_error(closed_url):
+    success, message = lm.verify_gumroad_license("GOOD-KEY", closed_url)
+    assert not success
+    assert message.startswith("Network error")
+
+
+# -------------------------------------------------------------------------
+# Background verification
+# -------------------------------------------------------------------------
+def test_background_success_is_cached(server):
+    results = []
+    assert lm.start_verification("GOOD-KEY", callback=_append(results), url=server.url)
+    _finish_verification()
+
+    assert results == [(True, "License verified for buyer@example.com")]
+    cached = lm.load_local_license()
+    assert cached["license"] == "GOOD-KEY"
+    assert cached["status"] == "verified"
+    assert lm.is_license_valid()
+
+
+def test_background_rejection_is_not_cached(server):
+    results = []
+    lm.start_verification("BAD-KEY", callback=_append(results), url=server.url)
+    _finish_verification()
+
+    assert results == [(False, REJECTION["message"])]
+    assert lm.load_local_license() == {}
+    assert not lm.is_license_valid()
+
+
+def test_background_network_error(closed_url):
+    results = []
+    lm.start_verification("GOOD-KEY", callback=_append(results), url=closed_url)
+    _finish_verification()
+
+    assert len(results) == 1
+    assert not results[0][0]
+    assert results[0][1].startswith("Network error")
+    assert not lm.is_license_valid()
+
+
+def test_offline_key_skips_network(server):
+    email = "buyer@example.com"
+    results = []
+    key = lm.generate_offline_key(email)
+    assert lm.start_verification(key, email, _append(results), url=server.url)
+
+    assert results == [(True, "Offline license accepted.")]
+    assert not lm.is_verifying()
+    assert server.requests == []
+    assert lm.is_license_valid()
+
+
+def _append(results):
+    return lambda success, message: results.append((success, message))
+
+
+# -------------------------------------------------------------------------
+# TTL refresh
+# -------------------------------------------------------------------------
+def _cache_verified(key, age_days):
+    verified_at = int(time.time() - age_days * 86400)
+    lm.save_local_license(
+        {"license": key, "status": "verified", "verified_at": verified_at}
+    )
+
+
+def test_fresh_cache_skips_network(server, monkeypatch):
+    monkeypatch.setattr(lm, "GUMROAD_VERIFY_URL", server.url)
+    _cache_verified("GOOD-KEY", lm.VERIFY_TTL_DAYS - 1)
+
+    lm.refresh_license_in_background()
+    assert not lm.is_verifying()
+    assert server.requests == []
+    assert lm.is_license_valid()
+
+
+def test_stale_cache_is_refreshed(server, monkeypatch):
+    monkeypatch.setattr(lm, "GUMROAD_VERIFY_URL", server.url)
+    _cache_verified("GOOD-KEY", lm.VERIFY_TTL_DAYS + 1)
+
+    lm.refresh_license_in_background()
+    _finish_verification()
+    assert len(server.requests) == 1
+    assert lm.cache_age_days(lm.load_local_license()) < 1
+    assert lm.is_license_valid()
+
+
+def test_stale_cache_rejected(server, monkeypatch):
+    monkeypatch.setattr(lm, "GUMROAD_VERIFY_URL", server.url)
+    _cache_verified("BAD-KEY", lm.VERIFY_TTL_DAYS + 1)
+
+    lm.refresh_license_in_background()
+    _finish_verification()
+    assert lm.load_local_license()["status"] == REJECTION["message"]
+    assert not lm.is_license_valid()
+
+
+def test_stale_cache_kept_offline(closed_url, monkeypatch):
+    monkeypatch.setattr(lm, "GUMROAD_VERIFY_URL", closed_url)
+    _cache_verified("GOOD-KEY", lm.VERIFY_TTL_DAYS + 1)
+
+    lm.refresh_license_in_background()
+    _finish_verification()
+    assert lm.cache_age_days(lm.load_local_license()) > lm.VERIFY_TTL_DAYS
+    assert lm.is_license_valid()
+
+
+# -------------------------------------------------------------------------
+# Cache signature
+# -------------------------------------------------------------------------
+def test_signed_cache_round_trip():
+    lm.save_local_license({"license": "GOOD-KEY", "status": "verified"})
+    cached = lm.load_local_license()
+    assert cached["license"] == "GOOD-KEY"
+    assert cached["signature"]
+    assert lm.is_license_valid()
+
+
+def test_tampered_cache_is_rejected():
+    lm.save_local_license({"license": "GOOD-KEY", "status": "trial expired"})
+    with open(lm.local_license_path(), encoding="utf-8") as f:
+        data = json.load(f)
+    data["status"] = "verified"
+    _write_cache(data)
+
+    assert lm.load_local_license() == {}
+    assert not lm.is_license_valid()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"status": "offline-verified"},
+        {"status": "verified"},
+        {"license": "GOOD-KEY", "status": "trial expired"},
+        {"license": "GOOD-KEY", "status": "not verified"},
+    ],
+)
+def test_unsigned_cache_without_license_is_rejected(data):
+    _write_cache(data)
+    assert lm.load_local_license() == {}
+    assert not lm.is_license_valid()
+
+
+# -------------------------------------------------------------------------
+# Caches from before signing
+# -------------------------------------------------------------------------
+def test_legacy_cache_stays_valid_and_is_due():
+    _write_cache({"license": "GOOD-KEY", "status": "verified", "verified_at": 2**40})
+    cached = lm.load_local_license()
+    assert cached["verified_at"] == 0
+    assert lm.cache_age_days(cached) > lm.VERIFY_TTL_DAYS
+    assert lm.is_license_valid()
+
+
+def test_legacy_cache_refreshed_and_signed(server, monkeypatch):
+    monkeypatch.setattr(lm, "GUMROAD_VERIFY_URL", server.url)
+    _write_cache({"license": "GOOD-KEY", "status": "verified"})
+
+    lm.refresh_license_in_background()
+    _finish_verification()
+    assert len(server.requests) == 1
+    cached = lm.load_local_license()
+    assert cached["signature"]
+    assert lm.cache_age_days(cached) < 1
+    assert lm.is_license_valid()
+
+
+def test_legacy_cache_kept_offline(closed_url, monkeypatch):
+    monkeypatch.setattr(lm, "GUMROAD_VERIFY_URL", closed_url)
+    _write_cache({"license": "GOOD-KEY", "status": "verified"})
+
+    lm.refresh_license_in_background()
+    _finish_verification()
+    assert "signature" not in lm.load_local_license()
+    assert lm.is_license_valid()
+
+
+def test_legacy_cache_rejected(server, monkeypatch):
+    monkeypatch.setattr(lm, "GUMROAD_VERIFY_URL", server.url)
+    _write_cache({"license": "BAD-KEY", "status": "verified"})
+
+    lm.refresh_license_in_background()
+    _finish_verification()
+    assert not lm.is_license_valid()
+
+
+def test_legacy_offline_cache_signed_without_network(server, monkeypatch):
+    monkeypatch.setattr(lm, "GUMROAD_VERIFY_URL", server.url)
+    _write_cache({"license": "SPP-0123456789AB", "status": "offline-verified"})
+
+    lm.refresh_license_in_background()
+    assert not lm.is_verifying()
+    assert server.requests == []
+    cached = lm.load_local_license()
+    assert cached["signature"]
+    assert cached["license"] == "SPP-0123456789AB"
+    assert lm.is_license_valid()
+
+
+@pytest.mark.parametrize(
+    "status", ["not verified", "Trial active (3 days remaining)", "unverified"]
+)
+def test_status_must_match_exactly(status):
+    lm.save_local_license({"license": "GOOD-KEY", "status": status})
+    assert not lm.is_license_valid()
+
+
+def test_cache_without_license_is_invalid():
+    lm.save_local_license({"status": "verified"})
+    assert not lm.is_license_valid()
+
+
+# -------------------------------------------------------------------------
+# Offline keys
+# -------------------------------------------------------------------------
+def test_offline_key_ignores_email_case():
+    key = lm.generate_offline_key(" Buyer@Example.com")
+    assert key == lm.generate_offline_key("buyer@example.com")
+    assert lm.verify_offline_key(key.lower(), "BUYER@example.com ")
+    assert not lm.verify_offline_key(key, "other@example.com")
+
+
+def test_offline_key_issued_before_normalization():
+    legacy = lm._offline_digest("Buyer@Example.com")
+    assert lm.verify_offline_key(legacy, "Buyer@Example.com")
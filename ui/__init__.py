@@ -1,8 +1,10 @@
+from ..utils import ui_state
 from . import (
     auto_uv,
     lace_panel,  # Re-enabled with new asset-based lace system
     main_panel,
     panel_nurbs_qd,
+    performance_panel,
     profile_projection_panel,
     surface_workflow_panel,
     uv_workflow_panel,
@@ -18,17 +20,32 @@ modules = [
     auto_uv,
     panel_nurbs_qd,
     profile_projection_panel,
+    performance_panel,
 ]
 
 
+# The UI registers after the license check, so it may not be registered yet
+_registered = False
+
+
 def register():
+    global _registered
+
+    ui_state.register()
     for module in modules:
         module.register()
+    _registered = True
 
 
 def unregister():
+    global _registered
+
+    if not _registered:
+        return
+    _registered = False
     for module in reversed(modules):
         module.unregister()
+    ui_state.unregister()
 
 
 if __name__ == "__main__":
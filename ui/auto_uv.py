@@ -1,5 +1,5 @@
 import bpy
-from ..utils import icons
+from ..utils import icons, ui_state
 
 
 class OBJECT_PT_autu_uv(bpy.types.Panel):
@@ -20,6 +20,7 @@ class OBJECT_PT_autu_uv(bpy.types.Panel):
         icon_id = icons.get_icon("auto_uv")
         layout.label(text="", icon_value=icon_id)
 
+    @ui_state.timed_draw
     def draw(self, context):
         layout = self.layout
         icon_id = icons.get_icon("auto_uv")
@@ -1,5 +1,14 @@
 import bpy
-from ..utils import icons
+from ..utils import icons, lace_sockets, ui_state
+
+
+def _socket_prop(layout, mod, logical, scene, scene_prop, text):
+    """Draw the modifier socket for ``logical``, or the scene fallback."""
+    key = lace_sockets.input_key(mod, logical) if mod else None
+    if key is not None and key in mod:
+        layout.prop(mod, f'["{key}"]', text=text)
+    else:
+        layout.prop(scene, scene_prop, text=text)
 
 
 class OBJECT_PT_SneakerPanelLace(bpy.types.Panel):
@@ -20,6 +29,7 @@ class OBJECT_PT_SneakerPanelLace(bpy.types.Panel):
         icon_id = icons.get_icon("laces")
         layout.label(text="", icon_value=icon_id)
 
+    @ui_state.timed_draw
     def draw(self, context):
         layout = self.layout
         scene = context.scene
@@ -52,12 +62,6 @@ class OBJECT_PT_SneakerPanelLace(bpy.types.Panel):
                 "wm.url_open", text="View Lace Generator Tutorial", icon="URL"
             ).url = "https://youtu.be/aQWf-eODUV8"
 
-        # Check if object has a lace modifier
-        if obj:
-            for mod in obj.modifiers:
-                if mod.type == "NODES" and mod.name.startswith("Lace"):
-                    break
-
         # Check if active object is a curve
         if not obj or obj.type != "CURVE":
             error_col = lace_box.column(align=True)
@@ -65,19 +69,8 @@ class OBJECT_PT_SneakerPanelLace(bpy.types.Panel):
             error_col.label(text="Select a curve object to apply lace", icon="ERROR")
             return
 
-        # Find lace modifier for direct socket control
-        lace_modifier = None
-        if obj:
-            for mod in obj.modifiers:
-                if mod.type == "NODES" and mod.node_group:
-                    # Check for both old naming and new asset-based node group
-                    if (
-                        "LaceFromCurves" in mod.node_group.name
-                        or "spp_lace" in mod.node_group.name
-                        or "Lace" in mod.name
-                    ):
-                        lace_modifier = mod
-                        break
+        # Stored modifier reference; no per-draw modifier scan
+        lace_modifier = lace_sockets.get_lace_modifier(obj)
 
         # Main controls column
         col = lace_box.column(align=True)
@@ -89,61 +82,27 @@ class OBJECT_PT_SneakerPanelLace(bpy.types.Panel):
         # Custom Profile Object (only show for Custom type)
         # Accept multiple representations of the custom profile enum (e.g. 'CUSTOM', '2', etc.)
         if scene.spp_lace_profile in {"CUSTOM", "Custom", "custom", "2", 2}:
-            # If a lace modifier has already been applied, expose socket 12 directly.
-            # According to the asset file, the custom profile lives on Socket_12.
-            if lace_modifier:
-                try:
-                    if "Socket_12" in lace_modifier:
-                        col.prop(lace_modifier, '["Socket_12"]', text="Custom Profile")
-                    else:
-                        # Fallback to scene property when socket 12 is not yet available
-                        col.prop(
-                            scene, "spp_lace_custom_profile", text="Custom Profile"
-                        )
-                except Exception:
-                    # Fallback to scene property if direct access fails
-                    col.prop(scene, "spp_lace_custom_profile", text="Custom Profile")
-            else:
-                # No modifier yet, show scene property so the user can choose a profile before applying
-                col.prop(scene, "spp_lace_custom_profile", text="Custom Profile")
+            # If a lace modifier has already been applied, expose its socket directly;
+            # otherwise show the scene property so a profile can be chosen first.
+            _socket_prop(
+                col,
+                lace_modifier,
+                "custom_profile",
+                scene,
+                "spp_lace_custom_profile",
+                "Custom Profile",
+            )
 
         # Geometry Controls - direct socket control
         col.separator()
         col.label(text="Geometry Settings:")
 
-        if lace_modifier:
-            # Direct modifier socket control with fallback
-            try:
-                if "Socket_8" in lace_modifier:  # Resample
-                    col.prop(lace_modifier, '["Socket_8"]', text="Resample")
-                elif "Resample" in lace_modifier:
-                    col.prop(lace_modifier, '["Resample"]', text="Resample")
-                else:
-                    col.prop(scene, "spp_lace_resample", text="Resample")
-
-                if "Socket_2" in lace_modifier:  # Scale
-                    col.prop(lace_modifier, '["Socket_2"]', text="Scale")
-                elif "Scale" in lace_modifier:
-                    col.prop(lace_modifier, '["Scale"]', text="Scale")
-                else:
-                    col.prop(scene, "spp_lace_scale", text="Scale")
-
-                if "Socket_3" in lace_modifier:  # Tilt
-                    col.prop(lace_modifier, '["Socket_3"]', text="Tilt")
-                elif "Tilt" in lace_modifier:
-                    col.prop(lace_modifier, '["Tilt"]', text="Tilt")
-                else:
-                    col.prop(scene, "spp_lace_tilt", text="Tilt")
-            except Exception:
-                # Fallback to scene properties if socket access fails
-                col.prop(scene, "spp_lace_resample", text="Resample")
-                col.prop(scene, "spp_lace_scale", text="Scale")
-                col.prop(scene, "spp_lace_tilt", text="Tilt")
-        else:
-            # Fallback to scene properties when no modifier exists
-            col.prop(scene, "spp_lace_resample", text="Resample")
-            col.prop(scene, "spp_lace_scale", text="Scale")
-            col.prop(scene, "spp_lace_tilt", text="Tilt")
+        # Direct modifier socket control with scene-property fallback
+        _socket_prop(
+            col, lace_modifier, "resample", scene, "spp_lace_resample", "Resample"
+        )
+        _socket_prop(col, lace_modifier, "scale", scene, "spp_lace_scale", "Scale")
+        _socket_prop(col, lace_modifier, "tilt", scene, "spp_lace_tilt", "Tilt")
 
         # Normal Mode
         col.separator()
@@ -163,33 +122,24 @@ class OBJECT_PT_SneakerPanelLace(bpy.types.Panel):
         col.separator()
         col.label(text="Appearance:")
 
-        if lace_modifier:
-            # Color - Socket_11
-            if "Socket_11" in lace_modifier:
-                col.prop(lace_modifier, '["Socket_11"]', text="Color")
-            else:
-                col.prop(scene, "spp_lace_color", text="Color")
-
-            # Flip Normal - Socket_6
-            if "Socket_6" in lace_modifier:
-                col.prop(lace_modifier, '["Socket_6"]', text="Flip Normal")
-            else:
-                col.prop(scene, "spp_lace_flip_normal", text="Flip Normal")
-
-            # Shade Smooth - Socket_9
-            if "Socket_9" in lace_modifier:
-                col.prop(lace_modifier, '["Socket_9"]', text="Shade Smooth")
-            else:
-                col.prop(scene, "spp_lace_shade_smooth", text="Shade Smooth")
-
-            # Material section removed - using default lace material only
-        else:
-            # Fallback to scene properties when no modifier exists
-            col.prop(scene, "spp_lace_color", text="Color")
-            col.prop(scene, "spp_lace_flip_normal", text="Flip Normal")
-            col.prop(scene, "spp_lace_shade_smooth", text="Shade Smooth")
-
-            # Material section removed - using default lace material only
+        _socket_prop(col, lace_modifier, "color", scene, "spp_lace_color", "Color")
+        _socket_prop(
+            col,
+            lace_modifier,
+            "flip_normal",
+            scene,
+            "spp_lace_flip_normal",
+            "Flip Normal",
+        )
+        _socket_prop(
+            col,
+            lace_modifier,
+            "shade_smooth",
+            scene,
+            "spp_lace_shade_smooth",
+            "Shade Smooth",
+        )
+        # Material section removed - using default lace material only
 
         # Apply Button
         col.separator()
@@ -199,6 +149,15 @@ class OBJECT_PT_SneakerPanelLace(bpy.types.Panel):
         # Apply lace operator - uses scene properties internally
         apply_col.operator("spp.apply_lace", text="Apply Lace", icon="CURVE_DATA")
 
+        # Batch apply across all selected curves (one update, one undo step)
+        batch_row = apply_col.row(align=True)
+        batch_row.operator(
+            "spp.apply_lace_batch", text="Apply to Selected", icon="OUTLINER_OB_CURVE"
+        ).merge_into_one = False
+        batch_row.operator(
+            "spp.apply_lace_batch", text="Merge as One", icon="AUTOMERGE_ON"
+        ).merge_into_one = True
+
         # Custom profile is now handled directly above
 
 
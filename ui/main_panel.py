@@ -2,9 +2,10 @@ import bpy
 from bpy.props import EnumProperty
 from bpy.types import Operator
 
-from ..utils import icons
+from ..utils import icons, ui_state, undo
 
 
+@undo.interface
 class WM_OT_SPP_ToggleWorkflow(Operator):
     bl_idname = "wm.spp_toggle_workflow"
     bl_label = "Toggle Workflow"
@@ -37,6 +38,7 @@ class OBJECT_PT_SneakerPanelProMain(bpy.types.Panel):
         icon_id = icons.get_icon("logo")
         layout.label(text="", icon_value=icon_id)
 
+    @ui_state.timed_draw
     def draw(self, context):
         layout = self.layout
         wm = context.window_manager
@@ -189,11 +191,8 @@ class OBJECT_PT_SneakerPanelProMain(bpy.types.Panel):
             obj = context.active_object
             shading_row = panel_box.row()
 
-            # Check current shading mode
-            is_smooth = False
-            if obj and obj.type == "MESH" and obj.data.polygons:
-                # Check if any face is smooth (if any face is smooth, consider object as smooth)
-                is_smooth = any(poly.use_smooth for poly in obj.data.polygons)
+            # Current shading mode, cached per object (no per-face scan in draw)
+            is_smooth = ui_state.mesh_state(obj).is_smooth
 
             shading_row.operator(
                 "object.shade_smooth",
@@ -224,6 +223,13 @@ class OBJECT_PT_SneakerPanelProMain(bpy.types.Panel):
             fitment_row.operator(
                 "mesh.smooth_mesh", text="Smooth Mesh", icon="MOD_SMOOTH"
             )
+            obj = context.active_object
+            if obj and obj.type == "MESH" and obj.spp_mirror_source:
+                panel_box.operator(
+                    "mesh.sync_mirror_pair",
+                    text=f"Sync Twin of {obj.spp_mirror_source.name}",
+                    icon="MOD_MIRROR",
+                )
 
             # Thicken Panel (Solidify) section
             panel_box.label(text="Thicken Panel:", icon="MOD_SOLIDIFY")
@@ -2,6 +2,7 @@ import bpy
 from bpy.types import Panel
 
 from ..prefs import get_prefs
+from ..utils import ui_state
 
 CATEGORY = "Sneaker Panel"
 
@@ -35,6 +36,7 @@ class SPP_PT_NurbsToSurface(Panel):
         except Exception:
             return False
 
+    @ui_state.timed_draw
     def draw(self, context):
         sc = context.scene
         layout = self.layout
@@ -133,6 +135,10 @@ class SPP_PT_NurbsToSurface(Panel):
         surf_box.label(
             text="Step 3: Generate NURBS Surface (Q&D)", icon="SURFACE_NSURFACE"
         )
+        res_row = surf_box.row(align=True)
+        res_row.prop(sc, "spp_resolution_u", text="U")
+        res_row.prop(sc, "spp_resolution_v", text="V")
+        surf_box.prop(sc, "spp_resolution_preview_cap", text="Drag Preview")
         op_bs = surf_box.operator(
             "spp.convert_bezier_to_surface",
             text="Convert Bezier to Surface",
@@ -232,19 +238,14 @@ class SPP_PT_NurbsToSurface(Panel):
             status_row.enabled = False
             status_row.label(text="Status: NONE - Not Checked", icon="QUESTION")
 
-        if context.active_object and context.active_object.type == "MESH":
-            has_violations = any(
-                vg.name.startswith("UV_Violation_")
-                for vg in context.active_object.vertex_groups
+        if ui_state.mesh_state(context.active_object).has_uv_violation_groups:
+            reselect_row = box_boundary.row(align=True)
+            reselect_row.scale_y = 1.0
+            reselect_row.operator(
+                "mesh.reselect_uv_violations",
+                text="Step 2a: UV Boundary Check - Re-select Violations",
+                icon="RESTRICT_SELECT_OFF",
             )
-            if has_violations:
-                reselect_row = box_boundary.row(align=True)
-                reselect_row.scale_y = 1.0
-                reselect_row.operator(
-                    "mesh.reselect_uv_violations",
-                    text="Step 2a: UV Boundary Check - Re-select Violations",
-                    icon="RESTRICT_SELECT_OFF",
-                )
 
         # Shell UV → Panel
         box = layout.box()
@@ -0,0 +1,145 @@
+import bpy
+from bpy.props import StringProperty
+from bpy.types import Operator, Panel
+
+from ..prefs import get_prefs
+from ..utils import profiling, ui_state, undo
+
+# Phases listed per operator, slowest first
+MAX_PHASES = 8
+
+
+@undo.interface
+class SPP_OT_ExportPerformance(Operator):
+    bl_idname = "spp.export_performance"
+    bl_label = "Export Timings"
+    bl_description = "Save the recorded operator timings as JSON"
+    bl_options = {"REGISTER"}
+
+    filepath: StringProperty(subtype="FILE_PATH")
+    filename_ext = ".json"
+    filter_glob: StringProperty(default="*.json", options={"HIDDEN"})
+
+    @classmethod
+    def poll(cls, context):
+        return bool(profiling.history)
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = "spp_timings.json"
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        path = bpy.path.ensure_ext(bpy.path.abspath(self.filepath), ".json")
+        try:
+            profiling.export_json(path)
+        except OSError as e:
+            self.report({"ERROR"}, f"Could not write {path}: {e}")
+            return {"CANCELLED"}
+        self.report({"INFO"}, f"Timings saved to {path}")
+        return {"FINISHED"}
+
+
+@undo.interface
+class SPP_OT_ClearPerformance(Operator):
+    bl_idname = "spp.clear_performance"
+    bl_label = "Clear Timings"
+    bl_description = "Forget all recorded operator timings"
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    def execute(self, context):
+        profiling.clear()
+        return {"FINISHED"}
+
+
+class SPP_PT_Performance(Panel):
+    bl_label = "Performance"
+    bl_idname = "SPP_PT_performance"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Sneaker Panel"
+    bl_options = {"DEFAULT_CLOSED"}
+    bl_order = 100
+
+    def draw_header(self, context):
+        self.layout.label(text="", icon="SORTTIME")
+
+    @ui_state.timed_draw
+    def draw(self, context):
+        layout = self.layout
+        try:
+            prefs = get_prefs(context)
+        except Exception:
+            prefs = None
+        if prefs is not None:
+            col = layout.column(align=True)
+            col.prop(prefs, "instrument_operators")
+            sub = col.row()
+            sub.enabled = prefs.instrument_operators
+            sub.prop(prefs, "trace_operator_memory")
+
+        stats = profiling.summary()
+        if not stats:
+            layout.label(
+                text=(
+                    "No runs recorded yet"
+                    if profiling.is_enabled()
+                    else "Enable recording to time operators"
+                ),
+                icon="INFO",
+            )
+            return
+
+        show_phases = context.window_manager.spp_perf_show_phases
+        layout.prop(context.window_manager, "spp_perf_show_phases")
+        for idname, entry in sorted(stats.items()):
+            last = entry["last"]
+            box = layout.box()
+            row = box.row()
+            icon = "PLAY" if "FINISHED" in last["status"] else "ERROR"
+            row.label(text=idname, icon=icon)
+            row.label(text=f"{last['total_ms']:.1f} ms")
+            row = box.row()
+            row.scale_y = 0.8
+            row.label(text=f"avg {entry['avg_ms']:.1f} ms · {entry['calls']} calls")
+            if "peak_kb" in last:
+                row.label(text=f"peak {last['peak_kb'] / 1024.0:.1f} MB")
+
+            if not show_phases or not last["phases"]:
+                continue
+            col = box.column(align=True)
+            col.scale_y = 0.8
+            phases = sorted(
+                last["phases"].items(), key=lambda item: item[1]["ms"], reverse=True
+            )
+            for name, phase in phases[:MAX_PHASES]:
+                row = col.row()
+                row.label(text=name)
+                calls = f" ×{phase['calls']}" if phase["calls"] > 1 else ""
+                row.label(text=f"{phase['ms']:.1f} ms{calls}")
+
+        row = layout.row(align=True)
+        row.operator("spp.export_performance", icon="EXPORT")
+        row.operator("spp.clear_performance", icon="TRASH")
+
+
+classes = (SPP_OT_ExportPerformance, SPP_OT_ClearPerformance, SPP_PT_Performance)
+
+
+def register():
+    bpy.types.WindowManager.spp_perf_show_phases = bpy.props.BoolProperty(
+        name="Show Phases",
+        description="List the phases of each operator's last run",
+        default=True,
+    )
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    # Deleted first, so a failing class unregistration cannot leak it
+    if hasattr(bpy.types.WindowManager, "spp_perf_show_phases"):
+        del bpy.types.WindowManager.spp_perf_show_phases
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
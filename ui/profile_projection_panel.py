@@ -1,7 +1,7 @@
 import bpy
 from bpy.types import Panel
 
-from ..utils import icons
+from ..utils import icons, ui_state
 
 
 class PP_PT_Main(Panel):
@@ -26,6 +26,7 @@ class PP_PT_Main(Panel):
         wm = context.window_manager
         return getattr(wm, "spp_show_profile_projection", False)
 
+    @ui_state.timed_draw
     def draw(self, context):
         layout = self.layout
         props = context.scene.profile_proj
@@ -67,15 +68,14 @@ class PP_PT_Main(Panel):
             tip_col.label(text="• Run 'Create Image Texture and Material'")
             tip_col.label(text="• Run 'Transfer Image UV'")
             tip_col.label(
-                text="• Switch to Texture Paint mode to paint mesh with reference image"
+                text="• The whole mesh is filled in one pass - no 3D view or repeat from the other side needed"
             )
             tip_col.label(
-                text="• Make sure 'Clone tool' is active and set to 'Single Image' with 'Projected Design' as 'Clone image' - Active UV is 'UV Mesh'"
+                text="• Texels whose Projection UV falls outside the reference image stay transparent"
             )
             tip_col.label(
-                text="• In brush settings make sure 'Clone From Paint Slot' is ticked and 'Clone Image' is set to your reference drawing, and 'Source UV' is set to 'Projection'"
+                text="• With render settings set to 'Material Preview', check the result on the mesh"
             )
-            tip_col.label(text="• With render settings set to 'Material Preview', paint mesh with the reference image")
             tip_col.label(text="• Remember to save images")
             tip_col.label(text="• Adjust Reference Image opacity in material properties to control the amount of projected image")        
             tip_col.operator(
@@ -107,6 +107,41 @@ class PP_PT_Main(Panel):
         actions_col.separator()
         actions_col.operator("pp.auto_clone_transfer", icon="BRUSH_DATA")
 
+        # Multi-view section: one projection per registered side, merged at once
+        views_box = main_box.box()
+        views_box.label(text="Multi-View Merge:", icon="CAMERA_DATA")
+        add_row = views_box.row(align=True)
+        for side, label in (
+            ("LATERAL", "Lateral"),
+            ("MEDIAL", "Medial"),
+            ("TOP", "Top"),
+            ("TOE", "Toe"),
+        ):
+            add_row.operator("pp.add_projection_view", text=label, icon="ADD").side = (
+                side
+            )
+
+        for index, view in enumerate(props.views):
+            view_box = views_box.box()
+            header = view_box.row(align=True)
+            header.prop(view, "enabled", text="")
+            header.label(text=view.side.title())
+            header.operator("pp.remove_projection_view", text="", icon="X").index = (
+                index
+            )
+            col = view_box.column(align=True)
+            col.enabled = view.enabled
+            col.prop(view, "image_path")
+            col.prop(view, "projection_uv")
+            col.operator(
+                "pp.create_projection_uv", text="Project From View", icon="IMAGE_PLANE"
+            ).view_index = index
+
+        if props.views:
+            merge_row = views_box.row()
+            merge_row.scale_y = 1.2
+            merge_row.operator("pp.multi_view_transfer", icon="NODE_COMPOSITING")
+
 
 # Registration
 classes = [PP_PT_Main]
@@ -1,5 +1,5 @@
 import bpy
-from ..utils import icons
+from ..utils import icons, ui_state
 
 
 class OBJECT_PT_SurfaceWorkflow(bpy.types.Panel):
@@ -23,6 +23,7 @@ class OBJECT_PT_SurfaceWorkflow(bpy.types.Panel):
             getattr(context.window_manager, "spp_active_workflow", "") == "SURFACE_3D"
         )
 
+    @ui_state.timed_draw
     def draw(self, context):
         layout = self.layout
         S = context.scene
@@ -2,7 +2,7 @@
 
 import bpy
 from bpy.types import Panel
-from ..utils import icons
+from ..utils import icons, ui_state
 
 
 # Keep (or create) the Scene properties this panel uses
@@ -85,6 +85,7 @@ class OBJECT_PT_UVWorkflow(Panel):
             getattr(context.window_manager, "spp_active_workflow", "UV_2D") == "UV_2D"
         )
 
+    @ui_state.timed_draw
     def draw(self, context):
         layout = self.layout
         S = context.scene
@@ -333,18 +334,13 @@ class OBJECT_PT_UVWorkflow(Panel):
                 status_row.label(text="Status: NONE - Not Checked", icon="QUESTION")
 
             # Optional convenience button only when it makes sense
-            if context.active_object and context.active_object.type == "MESH":
-                has_vg = any(
-                    vg.name == "UV_Violations"
-                    for vg in context.active_object.vertex_groups
+            if ui_state.mesh_state(context.active_object).has_uv_violations:
+                reselect_row = step4.row(align=True)
+                reselect_row.operator(
+                    "mesh.reselect_uv_violations",
+                    text="Re-select Violations",
+                    icon="RESTRICT_SELECT_OFF",
                 )
-                if has_vg:
-                    reselect_row = step4.row(align=True)
-                    reselect_row.operator(
-                        "mesh.reselect_uv_violations",
-                        text="Re-select Violations",
-                        icon="RESTRICT_SELECT_OFF",
-                    )
 
         # -----------------------------
         # Step 5 (collapsible, always-on)
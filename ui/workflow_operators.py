@@ -1,7 +1,10 @@
 import bpy
 
+from ..utils import undo
+
 
 # Custom operator to toggle one workflow and close the other
+@undo.interface
 class WM_OT_context_toggle_workflow(bpy.types.Operator):
     """Toggle a workflow property and close another workflow if needed"""
 
@@ -32,6 +35,7 @@ class WM_OT_context_toggle_workflow(bpy.types.Operator):
         return {"FINISHED"}
 
 
+@undo.interface
 class WM_OT_toggle_surface_step(bpy.types.Operator):
     """Toggle a Surface workflow step and collapse the others"""
 
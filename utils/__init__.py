@@ -1,5 +1,50 @@
 """Utility modules for Sneaker Panel Pro addon."""
 
-from . import collections, icons, object_namer, panel_utils
+from . import (
+    collections,
+    conform,
+    icons,
+    image_registry,
+    lace_refresh,
+    lace_sockets,
+    mesh_arrays,
+    mirror_pair,
+    object_namer,
+    panel_utils,
+    profiling,
+    startup,
+    ui_state,
+    undo,
+    uv_reference,
+)
 
-__all__ = ["collections", "icons", "object_namer", "panel_utils"]
+# Utilities owning app handlers or ID properties, registered with the add-on
+_registered = (conform, image_registry, mirror_pair, uv_reference)
+
+__all__ = [
+    "collections",
+    "conform",
+    "icons",
+    "image_registry",
+    "lace_refresh",
+    "lace_sockets",
+    "mesh_arrays",
+    "mirror_pair",
+    "object_namer",
+    "panel_utils",
+    "profiling",
+    "startup",
+    "ui_state",
+    "undo",
+    "uv_reference",
+]
+
+
+def register():
+    for module in _registered:
+        module.register()
+
+
+def unregister():
+    for module in reversed(_registered):
+        module.unregister()
@@ -0,0 +1,264 @@
+"""
+Conform vertices to the shell surface.
+
+The world-space BVH of the evaluated shell is built once and cached by shell
+name; a depsgraph handler drops it when the shell's geometry or transform
+changes. ``conform_points`` snaps a world-space point array onto that BVH,
+either to the nearest surface point or by projecting along per-point
+directions, with an optional offset along the surface normal and a mask.
+``conform_object`` does the same for a mesh object's vertices and works in
+object mode, edit mode and headless runs alike: no modifiers are applied and
+no snapping transform is run.
+"""
+
+import bmesh
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+
+from . import profiling
+
+MODES = ("NEAREST", "PROJECT")
+
+# Search distance used when no limit is given
+_UNLIMITED = 1.0e10
+
+# shell name -> (key, BVHTree)
+_cache = {}
+
+
+# -------------------------------------------------------------------------
+# Shell BVH cache
+# -------------------------------------------------------------------------
+def _cache_key(shell):
+    return (
+        shell.data.name,
+        len(shell.data.vertices),
+        tuple(v for row in shell.matrix_world for v in row),
+    )
+
+
+def _build(shell, depsgraph):
+    eval_obj = shell.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh()
+    try:
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        mw = np.array(eval_obj.matrix_world, dtype=np.float64)
+        co = co.reshape(-1, 3) @ mw[:3, :3].T + mw[:3, 3]
+
+        mesh.calc_loop_triangles()
+        tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", tris)
+        return BVHTree.FromPolygons(
+            co.tolist(), tris.reshape(-1, 3).tolist(), all_triangles=True
+        )
+    finally:
+        eval_obj.to_mesh_clear()
+
+
+def shell_bvh(shell, depsgraph=None):
+    """Return the cached world-space BVH of the evaluated ``shell``."""
+    if shell is None or shell.type != "MESH":
+        raise ValueError("Shell must be a mesh object")
+    key = _cache_key(shell)
+    entry = _cache.get(shell.name)
+    if entry is not None and entry[0] == key:
+        return entry[1]
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    with profiling.phase("shell bvh"):
+        bvh = _build(shell, depsgraph)
+    _cache[shell.name] = (key, bvh)
+    return bvh
+
+
+def invalidate(shell=None):
+    """Drop the cached BVH of ``shell``, or of every shell."""
+    if shell is None:
+        _cache.clear()
+    else:
+        _cache.pop(shell.name, None)
+
+
+# -------------------------------------------------------------------------
+# Conform
+# -------------------------------------------------------------------------
+def conform_points(
+    points,
+    shell,
+    offset=0.0,
+    mode="NEAREST",
+    directions=None,
+    mask=None,
+    max_distance=0.0,
+    depsgraph=None,
+):
+    """Snap world-space ``points`` onto ``shell``.
+
+    Args:
+        points: (N, 3) world-space positions
+        shell: Shell mesh object to conform to
+        offset: Distance to keep along the surface normal
+        mode: "NEAREST" surface point, or "PROJECT" along ``directions``
+            (both ways, the closer hit wins)
+        directions: (N, 3) world-space projection directions for "PROJECT"
+        mask: (N,) bool array; points outside the mask are left alone
+        max_distance: Search limit, 0 for unlimited
+
+    Returns:
+        (positions, hit): the conformed (N, 3) positions and a bool array of
+        the points that found the surface
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown conform mode '{mode}'")
+    if mode == "PROJECT" and directions is None:
+        raise ValueError("PROJECT mode needs directions")
+
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    out = points.copy()
+    hit = np.zeros(len(points), dtype=bool)
+    indices = np.arange(len(points)) if mask is None else np.flatnonzero(mask)
+    if not len(indices):
+        return out, hit
+
+    bvh = shell_bvh(shell, depsgraph)
+    distance = max_distance if max_distance > 0.0 else _UNLIMITED
+    with profiling.phase("bvh lookup"):
+        for i in indices:
+            co = Vector(points[i])
+            if mode == "NEAREST":
+                loc, normal, _index, _dist = bvh.find_nearest(co, distance)
+            else:
+                direction = Vector(directions[i])
+                if direction.length_squared == 0.0:
+                    continue
+                direction.normalize()
+                loc, normal, _index, dist = bvh.ray_cast(co, direction, distance)
+                back = bvh.ray_cast(co, -direction, distance)
+                if back[0] is not None and (loc is None or back[3] < dist):
+                    loc, normal = back[0], back[1]
+            if loc is None:
+                continue
+            if offset:
+                loc = loc + normal.normalized() * offset
+            out[i] = loc
+            hit[i] = True
+    return out, hit
+
+
+def _world_normals(normals, matrix_world):
+    normal_matrix = np.linalg.inv(np.array(matrix_world.to_3x3())).T
+    return normals @ normal_matrix.T
+
+
+def conform_object(
+    obj,
+    shell,
+    offset=0.0,
+    mode="NEAREST",
+    selected_only=False,
+    max_distance=0.0,
+    depsgraph=None,
+):
+    """Conform the vertices of mesh ``obj`` onto ``shell`` in place.
+
+    Edit-mode objects are changed through their edit mesh, so the caller
+    does not need to switch modes. "PROJECT" mode casts along the vertex
+    normals.
+
+    Returns:
+        int: Number of vertices moved onto the surface
+    """
+    if obj is None or obj.type != "MESH":
+        raise ValueError("Only mesh objects can be conformed")
+    if obj == shell:
+        raise ValueError("An object cannot be conformed to itself")
+
+    mw = obj.matrix_world
+    mw_np = np.array(mw, dtype=np.float64)
+    mesh = obj.data
+    bm = None
+    if obj.mode == "EDIT":
+        bm = bmesh.from_edit_mesh(mesh)
+        verts = bm.verts
+        co = np.array([v.co for v in verts], dtype=np.float64).reshape(-1, 3)
+        select = np.array([v.select for v in verts], dtype=bool)
+        normals = (
+            np.array([v.normal for v in verts], dtype=np.float64).reshape(-1, 3)
+            if mode == "PROJECT"
+            else None
+        )
+    else:
+        count = len(mesh.vertices)
+        co = np.empty(count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        co = co.reshape(-1, 3).astype(np.float64)
+        select = np.empty(count, dtype=bool)
+        mesh.vertices.foreach_get("select", select)
+        normals = None
+        if mode == "PROJECT":
+            normals = np.empty(count * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("normal", normals)
+            normals = normals.reshape(-1, 3).astype(np.float64)
+
+    world = co @ mw_np[:3, :3].T + mw_np[:3, 3]
+    directions = _world_normals(normals, mw) if normals is not None else None
+    result, hit = conform_points(
+        world,
+        shell,
+        offset=offset,
+        mode=mode,
+        directions=directions,
+        mask=select if selected_only else None,
+        max_distance=max_distance,
+        depsgraph=depsgraph,
+    )
+
+    local = (result - mw_np[:3, 3]) @ np.linalg.inv(mw_np[:3, :3]).T
+    if bm is not None:
+        # Index access needs a lookup table, outdated after any topology edit
+        verts.ensure_lookup_table()
+        for i in np.flatnonzero(hit):
+            verts[i].co = local[i]
+        bmesh.update_edit_mesh(mesh)
+    else:
+        mesh.vertices.foreach_set("co", local.astype(np.float32).ravel())
+        mesh.update()
+    return int(hit.sum())
+
+
+# -------------------------------------------------------------------------
+# Registration
+# -------------------------------------------------------------------------
+@persistent
+def _on_depsgraph_update(_scene, depsgraph):
+    if not _cache:
+        return
+    for update in depsgraph.updates:
+        id_data = update.id
+        if isinstance(id_data, bpy.types.Object) and id_data.name in _cache:
+            if update.is_updated_geometry or update.is_updated_transform:
+                del _cache[id_data.name]
+
+
+@persistent
+def _on_load_post(*_args):
+    _cache.clear()
+
+
+def register():
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
+
+def unregister():
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    _cache.clear()
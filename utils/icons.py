@@ -3,6 +3,8 @@ import os
 import bpy
 import bpy.utils.previews
 
+from .. import prefs
+
 # Global variable to store icon previews
 preview_collections = {}
 
@@ -11,7 +13,10 @@ preview_collections = {}
 # Icons
 # ------------------------------------------------------------------------
 def load_icons():
-    """Load custom icons for the addon."""
+    """Load custom icons for the addon. Does nothing if already loaded."""
+    if "main" in preview_collections:
+        return
+
     # Create a new preview collection
     pcoll = bpy.utils.previews.new()
 
@@ -25,7 +30,7 @@ def load_icons():
             png_files = [f for f in os.listdir(icons_dir) if f.lower().endswith(".png")]
 
             if png_files:
-                print(f"Loading {len(png_files)} icon(s) from {icons_dir}")
+                prefs.debug(f"Loading {len(png_files)} icon(s) from {icons_dir}")
 
                 for icon_file in png_files:
                     icon_path = os.path.join(icons_dir, icon_file)
@@ -33,7 +38,7 @@ def load_icons():
 
                     try:
                         pcoll.load(icon_name, icon_path, "IMAGE")
-                        print(f"  ✓ Loaded icon: {icon_name}")
+                        prefs.debug(f"  ✓ Loaded icon: {icon_name}")
                     except Exception as e:
                         print(f"  ✗ Failed to load {icon_file}: {e}")
             else:
@@ -50,6 +55,10 @@ def load_icons():
 
 def get_icon(icon_name):
     pcoll = preview_collections.get("main")
+    if pcoll is None:
+        # First use before the deferred load ran
+        load_icons()
+        pcoll = preview_collections.get("main")
     if pcoll and icon_name in pcoll:
         return pcoll[icon_name].icon_id
     return 0
@@ -0,0 +1,146 @@
+"""
+Path index for image datablocks used as reference images.
+
+Images are indexed by normalized absolute file path, so looking up the image
+for a path does not resolve every filepath in ``bpy.data.images``. Images
+returned by ``get_image`` carry the file mtime they were loaded at; a lookup
+reloads the image only when the file on disk changed. Other images are never
+touched. The index is rebuilt after a file load and when images are added or
+removed; renamed images are found again on lookup.
+"""
+
+import os
+
+import bpy
+from bpy.app.handlers import persistent
+
+# Stored on the image: file mtime the pixels were loaded from
+MTIME_KEY = "spp_image_mtime"
+
+# normalized path -> image name
+_index = {}
+_dirty = True
+# len(bpy.data.images) when the index was built
+_count = -1
+
+
+def normalize_path(path, library=None):
+    return os.path.normcase(os.path.normpath(bpy.path.abspath(path, library=library)))
+
+
+def _image_path(img):
+    if img.source not in {"FILE", "SEQUENCE", "TILED"} or not img.filepath:
+        return None
+    try:
+        return normalize_path(img.filepath, img.library)
+    except Exception:
+        return None
+
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def rebuild():
+    """Re-index every file-backed image in the blend data."""
+    global _dirty, _count
+
+    _index.clear()
+    for img in bpy.data.images:
+        path = _image_path(img)
+        if path is not None:
+            _index.setdefault(path, img.name)
+    _count = len(bpy.data.images)
+    _dirty = False
+
+
+def _lookup(path):
+    name = _index.get(path)
+    img = bpy.data.images.get(name) if name else None
+    if img is not None and _image_path(img) == path:
+        return img
+    return None
+
+
+def get_image(path, load=True):
+    """Return the image for ``path``, loading or reloading it when needed.
+
+    Args:
+        path: Image file path, may be blend-relative
+        load: Load the file when no image uses it yet
+
+    Returns:
+        The image datablock, or None when it is not loaded and cannot be
+    """
+    if not path:
+        return None
+    key = normalize_path(path)
+    if _dirty or len(bpy.data.images) != _count:
+        rebuild()
+
+    img = _lookup(key)
+    if img is None and key in _index:
+        # Renamed or removed since indexing
+        rebuild()
+        img = _lookup(key)
+
+    mtime = _mtime(key)
+    if img is None:
+        if not load or mtime is None:
+            return None
+        img = bpy.data.images.load(key, check_existing=True)
+        img[MTIME_KEY] = mtime
+        _index[_image_path(img) or key] = img.name
+        _sync_count()
+        return img
+
+    if mtime is not None and img.library is None and img.get(MTIME_KEY) != mtime:
+        # An image first used without a stamp is assumed to match the file
+        if MTIME_KEY in img:
+            img.reload()
+        img[MTIME_KEY] = mtime
+    return img
+
+
+def _sync_count():
+    # Our own load keeps the index current: no rebuild for it
+    global _count
+    if not _dirty:
+        _count = len(bpy.data.images)
+
+
+def mark_dirty():
+    global _dirty
+    _dirty = True
+
+
+@persistent
+def _on_load_post(*_args):
+    mark_dirty()
+
+
+@persistent
+def _on_depsgraph_update(_scene, depsgraph):
+    # Pixel edits and reloads also update images; only additions and
+    # removals change the index
+    if depsgraph.id_type_updated("IMAGE") and len(bpy.data.images) != _count:
+        mark_dirty()
+
+
+def register():
+    mark_dirty()
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+
+
+def unregister():
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    _index.clear()
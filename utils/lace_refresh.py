@@ -0,0 +1,98 @@
+"""
+Coalesced refresh scheduler for lace modifier inputs.
+
+Property callbacks queue socket writes here instead of writing and
+re-evaluating immediately. A ``bpy.app.timers`` callback applies every queued
+write at once and triggers a single depsgraph re-evaluation, no more often
+than the refresh rate set in the add-on preferences.
+"""
+
+import time
+
+import bpy
+
+DEFAULT_REFRESH_HZ = 30
+
+# (object name, modifier name) -> {socket key: value}
+_pending = {}
+_last_flush = 0.0
+
+
+def _refresh_interval():
+    try:
+        from ..prefs import get_prefs
+
+        hz = get_prefs().lace_refresh_rate
+    except Exception:
+        hz = DEFAULT_REFRESH_HZ
+    return 1.0 / max(1, hz)
+
+
+def queue_socket_writes(obj, mod, writes):
+    """Queue ``{socket key: value}`` writes for ``mod`` on ``obj``.
+
+    Later writes to the same key within one tick replace earlier ones, so
+    dragging a slider only ever applies the latest value.
+    """
+    if not obj or not mod or not writes:
+        return
+    _pending.setdefault((obj.name, mod.name), {}).update(writes)
+
+    if not bpy.app.timers.is_registered(flush):
+        wait = max(0.0, _last_flush + _refresh_interval() - time.monotonic())
+        bpy.app.timers.register(flush, first_interval=wait)
+
+
+def queue_socket_write(obj, mod, key, value):
+    queue_socket_writes(obj, mod, {key: value})
+
+
+def _redraw_3d_views():
+    wm = bpy.context.window_manager
+    if not wm:
+        return
+    for window in wm.windows:
+        for area in window.screen.areas:
+            if area.type == "VIEW_3D":
+                area.tag_redraw()
+
+
+def flush():
+    """Apply all queued writes and re-evaluate once. Timer callback."""
+    global _last_flush
+
+    if not _pending:
+        return None
+    batch = dict(_pending)
+    _pending.clear()
+
+    touched = False
+    for (obj_name, mod_name), writes in batch.items():
+        obj = bpy.data.objects.get(obj_name)
+        mod = obj.modifiers.get(mod_name) if obj else None
+        if not mod:
+            continue
+        for key, value in writes.items():
+            try:
+                mod[key] = value
+            except Exception as e:
+                print(f"[SPP] Could not set lace input {key}: {e}")
+        obj.update_tag()
+        touched = True
+
+    if touched:
+        try:
+            bpy.context.view_layer.update()
+        except Exception:
+            pass
+        _redraw_3d_views()
+
+    _last_flush = time.monotonic()
+    return None
+
+
+def cancel():
+    """Drop queued writes and stop the timer."""
+    _pending.clear()
+    if bpy.app.timers.is_registered(flush):
+        bpy.app.timers.unregister(flush)
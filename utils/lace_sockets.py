@@ -0,0 +1,122 @@
+"""
+Socket-identifier and modifier lookup for lace node groups.
+
+Input identifiers are resolved once per node group from its interface items
+and cached, so property callbacks and panel draws do not probe modifier keys
+by trial. The lace modifier's name is stored on the curve object so it can be
+fetched directly instead of scanning every modifier.
+"""
+
+# Logical input -> interface socket names used across lace asset versions
+INPUT_NAMES = {
+    "profile": ("Lace Profile", "Profile Type"),
+    "scale": ("Scale",),
+    "tilt": ("Tilt",),
+    "normal_mode": ("Normal Mode",),
+    "material": ("Material",),
+    "flip_normal": ("Flip Normal",),
+    "flip_v": ("Flip V",),
+    "resample": ("Resample",),
+    "shade_smooth": ("Shade Smooth",),
+    "free_normal": ("Free Normal Controls", "Free Normal"),
+    "color": ("Color",),
+    "custom_profile": ("Custom Profile", "Object", "Profile Object", "Profile"),
+}
+
+# Identifiers of the shipped asset, used when a name lookup finds nothing
+LEGACY_IDENTIFIERS = {
+    "profile": "Socket_1",
+    "scale": "Socket_2",
+    "tilt": "Socket_3",
+    "normal_mode": "Socket_4",
+    "flip_normal": "Socket_6",
+    "resample": "Socket_8",
+    "shade_smooth": "Socket_9",
+    "free_normal": "Socket_10",
+    "color": "Socket_11",
+    "custom_profile": "Socket_12",
+}
+
+LACE_GROUP_MARKERS = ("spp_lace", "LaceFromCurves")
+
+# (node group name, version) -> {socket name: identifier}
+_socket_maps = {}
+
+
+def _group_version(node_group):
+    # session_uid changes when the datablock is reloaded; the item count
+    # changes when the interface is edited.
+    return (
+        getattr(node_group, "session_uid", 0),
+        len(node_group.interface.items_tree),
+    )
+
+
+def socket_map(node_group):
+    """Return the cached ``{input name: identifier}`` map for ``node_group``."""
+    key = (node_group.name, _group_version(node_group))
+    mapping = _socket_maps.get(key)
+    if mapping is None:
+        mapping = {}
+        for item in node_group.interface.items_tree:
+            if item.item_type == "SOCKET" and item.in_out == "INPUT":
+                mapping.setdefault(item.name, item.identifier)
+        # Drop maps for older versions of the same group
+        for old in [k for k in _socket_maps if k[0] == node_group.name]:
+            del _socket_maps[old]
+        _socket_maps[key] = mapping
+    return mapping
+
+
+def input_key(mod, logical):
+    """Return the modifier key for a logical lace input, or None if absent."""
+    if mod.node_group:
+        mapping = socket_map(mod.node_group)
+        for name in INPUT_NAMES.get(logical, ()):
+            identifier = mapping.get(name)
+            if identifier is not None:
+                return identifier
+    legacy = LEGACY_IDENTIFIERS.get(logical)
+    if legacy and legacy in mod:
+        return legacy
+    return None
+
+
+def is_lace_modifier(mod):
+    return (
+        mod.type == "NODES"
+        and mod.node_group is not None
+        and any(marker in mod.node_group.name for marker in LACE_GROUP_MARKERS)
+    )
+
+
+def remember_lace_modifier(obj, mod):
+    """Store ``mod`` as the lace modifier of ``obj``."""
+    obj.spp_lace_modifier = mod.name if mod else ""
+
+
+def get_lace_modifier(obj, remember=False):
+    """Return the lace modifier of ``obj`` through its stored reference.
+
+    Falls back to scanning the modifier stack when the reference is missing
+    or stale (renamed/removed modifier, files from older versions). Pass
+    ``remember=True`` to store the result; not allowed from ``draw()``.
+    """
+    if not obj or obj.type != "CURVE":
+        return None
+    name = getattr(obj, "spp_lace_modifier", "")
+    if name:
+        mod = obj.modifiers.get(name)
+        if mod and is_lace_modifier(mod):
+            return mod
+
+    for mod in obj.modifiers:
+        if is_lace_modifier(mod):
+            if remember:
+                remember_lace_modifier(obj, mod)
+            return mod
+    return None
+
+
+def clear_cache():
+    _socket_maps.clear()
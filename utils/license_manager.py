@@ -1,8 +1,10 @@
 import bpy
-import json
 import hashlib
-import requests
+import hmac
+import json
 import os
+import queue
+import threading
 import time
 
 # -------------------------------------------------------------------------
@@ -13,6 +15,10 @@ PRODUCT_PERMALINK = "sneaker-panel-pro"  # Gumroad product permalink
 OFFLINE_SALT = "enoevol2025"  # Used for generating offline keys
 
 TRIAL_DAYS = 3
+VERIFY_TTL_DAYS = 30  # Sessions within this window never touch the network
+GUMROAD_VERIFY_URL = "https://api.gumroad.com/v2/licenses/verify"
+VERIFY_TIMEOUT = 10
+VERIFIED_STATUSES = {"verified", "offline-verified"}
 TRIAL_FILE = os.path.join(bpy.utils.user_resource("CONFIG"), "spp_trial.json")
 
 
@@ -24,26 +30,41 @@ def get_prefs():
     return bpy.context.preferences.addons[__package__].preferences
 
 
-def generate_offline_key(email: str) -> str:
-    """Create a simple offline checksum key based on the buyer's email."""
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+
+def _offline_digest(email: str) -> str:
     data = f"{email}-{OFFLINE_SALT}".encode("utf-8")
-    digest = hashlib.sha256(data).hexdigest()[:12].upper()
-    return f"SPP-{digest}"
+    return f"SPP-{hashlib.sha256(data).hexdigest()[:12].upper()}"
+
+
+def generate_offline_key(email: str) -> str:
+    """Create a simple offline checksum key based on the buyer's normalized email."""
+    return _offline_digest(normalize_email(email))
 
 
 def verify_offline_key(key: str, email: str) -> bool:
     """Validate a locally generated key."""
-    expected = generate_offline_key(email)
-    return key.strip().upper() == expected
+    key = key.strip().upper()
+    # Keys issued before emails were normalized hash the email as typed
+    return key in {generate_offline_key(email), _offline_digest(email.strip())}
+
 
+def verify_gumroad_license(license_key: str, url: str = None) -> (bool, str):
+    """Validate a Gumroad license key via the Gumroad API.
 
-def verify_gumroad_license(license_key: str) -> (bool, str):
-    """Validate a Gumroad license key via the Gumroad API."""
-    url = "https://api.gumroad.com/v2/licenses/verify"
+    Blocks for up to ``VERIFY_TIMEOUT`` seconds; call it through
+    ``start_verification`` from the UI.
+    """
+    url = url or GUMROAD_VERIFY_URL
     payload = {"product_permalink": PRODUCT_PERMALINK, "license_key": license_key}
 
     try:
-        response = requests.post(url, data=payload, timeout=10)
+        # Imported on first use: ``requests`` alone costs ~0.1 s at startup
+        import requests
+
+        response = requests.post(url, data=payload, timeout=VERIFY_TIMEOUT)
         data = response.json()
         purchase = data.get("purchase", {})
 
@@ -61,20 +82,54 @@ def local_license_path() -> str:
     return os.path.join(bpy.utils.user_resource("CONFIG"), "spp_license.json")
 
 
+def _sign(data: dict) -> str:
+    # Keyed with the shipped salt: catches edits and corruption, not forgery
+    message = "|".join(
+        str(data.get(k, "")) for k in ("license", "status", "verified_at")
+    ).encode("utf-8")
+    return hmac.new(OFFLINE_SALT.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+
 def save_local_license(data: dict):
-    """Cache license info to disk."""
+    """Cache license info to disk, stamped and signed."""
+    data = dict(data)
+    data.setdefault("verified_at", int(time.time()))
+    data["signature"] = _sign(data)
     path = local_license_path()
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f)
 
 
 def load_local_license() -> dict:
-    """Load cached license info."""
+    """Load cached license info.
+
+    Tampered or unreadable caches read as empty. An unsigned cache from
+    before signing stays valid when it holds a verified license, but reads
+    as verified at time 0 so it is refreshed on first use.
+    """
     path = local_license_path()
-    if os.path.exists(path):
+    if not os.path.exists(path):
+        return {}
+    try:
         with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    if "signature" not in data:
+        status = str(data.get("status", "")).lower()
+        if not data.get("license") or status not in VERIFIED_STATUSES:
+            return {}
+        data["verified_at"] = 0
+        return data
+    if not hmac.compare_digest(str(data["signature"]), _sign(data)):
+        return {}
+    return data
+
+
+def cache_age_days(data: dict) -> float:
+    return (time.time() - data.get("verified_at", 0)) / 86400
 
 
 def clear_local_license():
@@ -89,7 +144,7 @@ def clear_local_license():
 
 
 def validate_license(license_key: str, email: str = None):
-    """Try online Gumroad validation, fallback to offline check."""
+    """Try online Gumroad validation, fallback to offline check. Blocking."""
     # 1️⃣ Try Gumroad validation
     success, message = verify_gumroad_license(license_key)
     if success:
@@ -104,6 +159,89 @@ def validate_license(license_key: str, email: str = None):
         return False, message
 
 
+# -------------------------------------------------------------------------
+# BACKGROUND VERIFICATION
+# -------------------------------------------------------------------------
+_results = queue.Queue()
+_worker = None
+_callbacks = []
+
+POLL_INTERVAL = 0.2
+
+
+def is_verifying() -> bool:
+    return _worker is not None and _worker.is_alive()
+
+
+def _verify_worker(license_key: str, url: str):
+    success, message = verify_gumroad_license(license_key, url)
+    _results.put((license_key, success, message))
+
+
+def _poll_verification():
+    """Timer callback: publish a finished verification on the main thread."""
+    # Checked first: a worker that is done has already queued its result
+    running = is_verifying()
+    try:
+        license_key, success, message = _results.get_nowait()
+    except queue.Empty:
+        return POLL_INTERVAL if running else None
+
+    if success:
+        save_local_license({"license": license_key, "status": "verified"})
+
+    callbacks = list(_callbacks)
+    _callbacks.clear()
+    for callback in callbacks:
+        try:
+            callback(success, message)
+        except Exception as e:
+            print(f"⚠ License callback failed: {e}")
+    return None
+
+
+def start_verification(license_key: str, email: str = None, callback=None, url=None):
+    """Verify ``license_key`` without blocking the UI.
+
+    A valid offline key for ``email`` is accepted at once. Otherwise the
+    online request runs on a background thread; ``callback(success, message)``
+    is called from a timer on the main thread once it finishes, after the
+    result has been cached. Returns False if a verification is already
+    running (the callback is still queued for its result).
+    """
+    global _worker
+
+    # Offline keys need no network at all
+    if email and verify_offline_key(license_key, email):
+        save_local_license({"license": license_key, "status": "offline-verified"})
+        if callback:
+            callback(True, "Offline license accepted.")
+        return True
+
+    if callback:
+        _callbacks.append(callback)
+    if is_verifying():
+        return False
+
+    _worker = threading.Thread(
+        target=_verify_worker,
+        args=(license_key, url),
+        name="spp-license-verify",
+        daemon=True,
+    )
+    _worker.start()
+    if not bpy.app.timers.is_registered(_poll_verification):
+        bpy.app.timers.register(_poll_verification, first_interval=POLL_INTERVAL)
+    return True
+
+
+def cancel_verification():
+    """Stop publishing results; a running request finishes on its own."""
+    _callbacks.clear()
+    if bpy.app.timers.is_registered(_poll_verification):
+        bpy.app.timers.unregister(_poll_verification)
+
+
 # -------------------------------------------------------------------------
 # TRIAL MODE
 # -------------------------------------------------------------------------
@@ -139,18 +277,44 @@ def check_trial() -> (bool, str):
 # LICENSE ENFORCEMENT
 # -------------------------------------------------------------------------
 def is_license_valid() -> bool:
-    """Check cached license status at startup."""
+    """Check cached license status at startup. Never touches the network."""
     data = load_local_license()
     if not data:
         return False
-    status = data.get("status", "").lower()
-    return "verified" in status
+    if not data.get("license"):
+        return False
+    return str(data.get("status", "")).lower() in VERIFIED_STATUSES
+
+
+def refresh_license_in_background():
+    """Re-verify an online license whose cache is older than the TTL.
+
+    The cached result keeps the add-on usable meanwhile; a failed request
+    (no network) leaves it untouched, only an explicit rejection clears it.
+    """
+    data = load_local_license()
+    if data.get("status") == "offline-verified" and "signature" not in data:
+        # Offline keys need no network: just re-sign the legacy cache
+        save_local_license({"license": data["license"], "status": "offline-verified"})
+        return
+    if data.get("status") != "verified" or not data.get("license"):
+        return
+    if cache_age_days(data) < VERIFY_TTL_DAYS:
+        return
+
+    def on_result(success, message):
+        if not success and not message.startswith("Network error"):
+            save_local_license({"status": message})
+            print(f"⚠ Sneaker Panel Pro: License no longer valid: {message}")
+
+    start_verification(data["license"], callback=on_result)
 
 
 def enforce_license():
     """Verify at startup and disable UI if license invalid or trial expired."""
     if is_license_valid():
         print("✅ Sneaker Panel Pro: License verified and active.")
+        refresh_license_in_background()
         return True
 
     trial_ok, trial_msg = check_trial()
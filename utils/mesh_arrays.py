@@ -0,0 +1,95 @@
+"""
+Blender mesh data as NumPy arrays for the ``core`` kernels.
+
+Everything is read and written with ``foreach_get`` / ``foreach_set``; the
+array layouts match what ``core`` expects (see ``core.topology``).
+"""
+
+import numpy as np
+
+
+def matrix(m):
+    """Return a mathutils matrix as a float64 array."""
+    return np.array(m, dtype=np.float64)
+
+
+def coords(mesh):
+    """Return the (V, 3) local vertex positions of ``mesh``."""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3).astype(np.float64)
+
+
+def set_coords(mesh, co):
+    """Write (V, 3) local positions back to ``mesh``."""
+    mesh.vertices.foreach_set("co", np.asarray(co, dtype=np.float32).ravel())
+    mesh.update()
+
+
+def to_world(co, matrix_world):
+    m = matrix(matrix_world)
+    return np.asarray(co, dtype=np.float64) @ m[:3, :3].T + m[:3, 3]
+
+
+def to_local(co, matrix_world):
+    m = np.linalg.inv(matrix(matrix_world))
+    return np.asarray(co, dtype=np.float64) @ m[:3, :3].T + m[:3, 3]
+
+
+def edges(mesh):
+    """Return the (E, 2) vertex pairs of ``mesh``'s edges."""
+    pairs = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", pairs)
+    return pairs.reshape(-1, 2).astype(np.int64)
+
+
+def face_loops(mesh):
+    """Return (loop_verts, loop_start, loop_total) of ``mesh``'s faces."""
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+    return (
+        loop_verts.astype(np.int64),
+        loop_start.astype(np.int64),
+        loop_total.astype(np.int64),
+    )
+
+
+def uv_layer(mesh, name):
+    """Return UV layer ``name`` of ``mesh``, else the active one, else None."""
+    return mesh.uv_layers.get(name) or mesh.uv_layers.active
+
+
+def loop_uvs(layer):
+    """Return the (L, 2) per-corner UVs of a mesh UV layer."""
+    uv = np.empty(len(layer.data) * 2, dtype=np.float32)
+    layer.data.foreach_get("uv", uv)
+    return uv.reshape(-1, 2).astype(np.float64)
+
+
+def uv_triangles(obj, uv_name, depsgraph):
+    """Return the world-space triangles of evaluated ``obj`` with their UVs.
+
+    Returns:
+        (tri_uv, tri_co): (T, 3, 2) UVs and (T, 3, 3) world positions, or
+        None when the mesh has no UV layer
+    """
+    eval_obj = obj.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh()
+    try:
+        layer = uv_layer(mesh, uv_name)
+        if layer is None:
+            return None
+        mesh.calc_loop_triangles()
+        tri_loops = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("loops", tri_loops)
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+        co = to_world(coords(mesh), eval_obj.matrix_world)
+        tri_loops = tri_loops.reshape(-1, 3)
+        return loop_uvs(layer)[tri_loops], co[loop_verts[tri_loops]]
+    finally:
+        eval_obj.to_mesh_clear()
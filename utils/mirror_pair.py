@@ -0,0 +1,307 @@
+"""
+Symmetric panel pairs.
+
+A mirrored twin is a separate object built from a source panel (medial to
+lateral, for instance) with the source's topology, so twin vertex ``i``
+follows source vertex ``i``. When the source is edited, a depsgraph handler
+mirrors only the source vertices that moved since the last sync and conforms
+those through the cached shell BVH, so the twin is never regenerated for a
+plain edit.
+
+The twin stores the element counts and a hash of the edges and face loops
+of the source it was built from. A change in either, or in the twin's own
+counts, breaks the correspondence and rebuilds the twin. In edit mode only
+the counts are compared; the hash is checked once edit mode is left.
+"""
+
+import hashlib
+
+import bmesh
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+
+from . import conform
+
+AXES = {"X": 0, "Y": 1, "Z": 2}
+
+# Stored on the twin
+AXIS_KEY = "spp_mirror_axis"
+OFFSET_KEY = "spp_mirror_offset"
+COUNTS_KEY = "spp_mirror_counts"
+TOPOLOGY_KEY = "spp_mirror_topology"
+
+# Positions closer than this count as unchanged
+_EPSILON = 1.0e-6
+
+# source session_uid -> set of twin names (source renames keep the key)
+_pairs = {}
+_pairs_dirty = True
+
+# twin session_uid -> mirrored world positions it was last synced to
+_synced = {}
+
+_syncing = False
+
+
+# -------------------------------------------------------------------------
+# Geometry
+# -------------------------------------------------------------------------
+def _local_coords(obj):
+    if obj.mode == "EDIT":
+        bm = bmesh.from_edit_mesh(obj.data)
+        return np.array([v.co for v in bm.verts], dtype=np.float64).reshape(-1, 3)
+    co = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+    obj.data.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3).astype(np.float64)
+
+
+def _mirrored_world(source, axis):
+    mw = np.array(source.matrix_world, dtype=np.float64)
+    world = _local_coords(source) @ mw[:3, :3].T + mw[:3, 3]
+    world[:, AXES[axis]] *= -1.0
+    return world
+
+
+def _to_local(obj, world):
+    mw = np.array(obj.matrix_world, dtype=np.float64)
+    inv = np.linalg.inv(mw)
+    return world @ inv[:3, :3].T + inv[:3, 3]
+
+
+def _counts(obj):
+    """(vertices, edges, faces) of ``obj``, from the edit mesh in edit mode."""
+    if obj.mode == "EDIT":
+        bm = bmesh.from_edit_mesh(obj.data)
+        return [len(bm.verts), len(bm.edges), len(bm.faces)]
+    mesh = obj.data
+    return [len(mesh.vertices), len(mesh.edges), len(mesh.polygons)]
+
+
+def _topology_hash(mesh):
+    """Hash of the edges and face loops of ``mesh`` (not of an edit mesh)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for collection, attr, size in (
+        (mesh.edges, "vertices", 2),
+        (mesh.polygons, "loop_total", 1),
+        (mesh.loops, "vertex_index", 1),
+    ):
+        values = np.empty(len(collection) * size, dtype=np.int32)
+        collection.foreach_get(attr, values)
+        digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+def _topology_changed(twin, source):
+    counts = _counts(source)
+    if list(twin.get(COUNTS_KEY, ())) != counts or _counts(twin) != counts:
+        return True
+    if source.mode == "EDIT":
+        # Hashing the edit mesh would walk it in Python on every update
+        return False
+    return twin.get(TOPOLOGY_KEY) != _topology_hash(source.data)
+
+
+def _shell(scene):
+    shell = getattr(scene, "spp_shell_object", None) if scene else None
+    return shell if shell is not None and shell.type == "MESH" else None
+
+
+# -------------------------------------------------------------------------
+# Pairs
+# -------------------------------------------------------------------------
+def _rebuild_pairs():
+    global _pairs_dirty
+
+    _pairs.clear()
+    for obj in bpy.data.objects:
+        source = getattr(obj, "spp_mirror_source", None)
+        if source is not None:
+            _pairs.setdefault(source.session_uid, set()).add(obj.name)
+    _pairs_dirty = False
+
+
+def twins_of(source):
+    """Return the mirrored twins currently linked to ``source``."""
+    if _pairs_dirty:
+        _rebuild_pairs()
+    names = _pairs.get(source.session_uid, ())
+    twins = [bpy.data.objects.get(name) for name in names]
+    if None in twins:
+        # A twin was renamed or deleted
+        _rebuild_pairs()
+        twins = [bpy.data.objects.get(n) for n in _pairs.get(source.session_uid, ())]
+    return [t for t in twins if t is not None and t.spp_mirror_source == source]
+
+
+def _rebuild_mesh(twin, source, axis):
+    """Replace the twin's mesh with a fresh mirrored copy of the source."""
+    mesh = source.data.copy()
+    mesh.name = f"{source.data.name}_Mirrored"
+    if source.mode == "EDIT":
+        bm = bmesh.from_edit_mesh(source.data).copy()
+        bm.to_mesh(mesh)
+        bm.free()
+    world = _mirrored_world(source, axis)
+    mesh.vertices.foreach_set("co", _to_local(twin, world).astype(np.float32).ravel())
+    # Hashed before flipping, which reverses the face loops
+    topology = _topology_hash(mesh)
+    # Mirroring turns the faces inside out
+    mesh.flip_normals()
+    mesh.update()
+
+    old = twin.data
+    twin.data = mesh
+    if old.users == 0:
+        bpy.data.meshes.remove(old)
+    twin[COUNTS_KEY] = [len(mesh.vertices), len(mesh.edges), len(mesh.polygons)]
+    twin[TOPOLOGY_KEY] = topology
+    _synced.pop(twin.session_uid, None)
+
+
+def create_twin(source, axis="X", offset=0.001, scene=None, depsgraph=None):
+    """Create the mirrored twin of mesh ``source`` and conform it.
+
+    The twin is linked to the same collections as the source.
+    """
+    if source is None or source.type != "MESH":
+        raise ValueError("Only mesh panels can be mirrored")
+    if axis not in AXES:
+        raise ValueError(f"Unknown mirror axis '{axis}'")
+
+    mesh = bpy.data.meshes.new(f"{source.data.name}_Mirrored")
+    twin = bpy.data.objects.new(f"{source.name}_Mirrored", mesh)
+    for collection in source.users_collection:
+        collection.objects.link(twin)
+    twin.spp_mirror_source = source
+    twin[AXIS_KEY] = axis
+    twin[OFFSET_KEY] = offset
+    _rebuild_mesh(twin, source, axis)
+    _pairs.setdefault(source.session_uid, set()).add(twin.name)
+    sync(twin, scene=scene, depsgraph=depsgraph)
+    return twin
+
+
+def sync(twin, full=False, scene=None, depsgraph=None):
+    """Bring ``twin`` in line with its source.
+
+    Only twin vertices whose mirrored source position changed since the last
+    sync are moved and conformed; ``full`` re-conforms every vertex.
+
+    Returns:
+        int: Number of twin vertices updated
+    """
+    source = twin.spp_mirror_source
+    if source is None or source.type != "MESH" or twin.mode == "EDIT":
+        return 0
+    axis = twin.get(AXIS_KEY, "X")
+    offset = float(twin.get(OFFSET_KEY, 0.0))
+    if scene is None:
+        scene = bpy.context.scene
+
+    if _topology_changed(twin, source):
+        # The vertex correspondence no longer holds
+        _rebuild_mesh(twin, source, axis)
+        full = True
+    target = _mirrored_world(source, axis)
+    if not len(target):
+        return 0
+
+    previous = _synced.get(twin.session_uid)
+    if full or previous is None or previous.shape != target.shape:
+        changed = np.ones(len(target), dtype=bool)
+    else:
+        changed = np.abs(target - previous).max(axis=1) > _EPSILON
+    if not changed.any():
+        return 0
+
+    positions = target
+    shell = _shell(scene)
+    if shell is not None and shell != twin and shell != source:
+        positions, _hit = conform.conform_points(
+            target, shell, offset=offset, mask=changed, depsgraph=depsgraph
+        )
+
+    co = np.empty(len(target) * 3, dtype=np.float32)
+    twin.data.vertices.foreach_get("co", co)
+    co = co.reshape(-1, 3)
+    co[changed] = _to_local(twin, positions[changed])
+    twin.data.vertices.foreach_set("co", co.ravel())
+    twin.data.update()
+    _synced[twin.session_uid] = target
+    return int(changed.sum())
+
+
+# -------------------------------------------------------------------------
+# Handlers
+# -------------------------------------------------------------------------
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    global _syncing
+
+    if _syncing:
+        return
+    if _pairs_dirty:
+        _rebuild_pairs()
+    if not _pairs:
+        return
+    sources = []
+    for update in depsgraph.updates:
+        id_data = update.id
+        if not isinstance(id_data, bpy.types.Object):
+            continue
+        source = id_data.original
+        if source.session_uid not in _pairs:
+            continue
+        if update.is_updated_geometry or update.is_updated_transform:
+            sources.append(source)
+    if not sources:
+        return
+
+    _syncing = True
+    try:
+        for source in sources:
+            for twin in twins_of(source):
+                sync(twin, scene=scene)
+    except Exception as e:
+        print(f"Sneaker Panel Pro: mirror pair sync failed: {e}")
+    finally:
+        _syncing = False
+
+
+@persistent
+def _on_load_post(*_args):
+    global _pairs_dirty
+
+    _pairs.clear()
+    _synced.clear()
+    _pairs_dirty = True
+
+
+def _is_mesh(_self, obj):
+    return obj.type == "MESH"
+
+
+def register():
+    bpy.types.Object.spp_mirror_source = bpy.props.PointerProperty(
+        name="Mirror Source",
+        description="Panel this mirrored twin follows",
+        type=bpy.types.Object,
+        poll=_is_mesh,
+    )
+    _on_load_post()
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
+
+def unregister():
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    _pairs.clear()
+    _synced.clear()
+    if hasattr(bpy.types.Object, "spp_mirror_source"):
+        del bpy.types.Object.spp_mirror_source
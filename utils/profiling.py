@@ -0,0 +1,217 @@
+"""
+Operator timing and memory instrumentation.
+
+``instrument`` wraps an operator ``execute``; ``phase()`` marks a named step
+inside it (shell evaluation, projection, fill, conform, cleanup...). Each
+instrumented call records its wall time, status and the time, call count
+and optional ``tracemalloc`` peak of every phase. The last ``HISTORY_SIZE``
+runs are kept per operator, shown in the Performance sidebar panel and can
+be exported to JSON.
+
+With instrumentation off (the default) the wrapper is a single flag check
+and ``phase()`` returns a shared no-op context manager.
+"""
+
+import functools
+import json
+import time
+import tracemalloc
+from collections import deque
+
+HISTORY_SIZE = 20
+
+# operator idname -> deque of run dicts (newest last)
+history = {}
+# operator idname -> [calls, total ms] since instrumentation was enabled
+totals = {}
+
+_enabled = False
+_trace_memory = False
+# Runs in progress, innermost last (operators can call other operators)
+_stack = []
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    __slots__ = ("run", "name", "start", "mem_start")
+
+    def __init__(self, run, name):
+        self.run = run
+        self.name = name
+
+    def __enter__(self):
+        parents = self.run["_open"]
+        if parents:
+            self.name = f"{parents[-1]}/{self.name}"
+        parents.append(self.name)
+        self.mem_start = None
+        if self.run["_memory"]:
+            self.mem_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_exc):
+        ms = (time.perf_counter() - self.start) * 1000.0
+        run = self.run
+        run["_open"].pop()
+        entry = run["phases"].setdefault(self.name, {"ms": 0.0, "calls": 0})
+        entry["ms"] += ms
+        entry["calls"] += 1
+        if self.mem_start is not None:
+            peak_kb = (tracemalloc.get_traced_memory()[1] - self.mem_start) / 1024.0
+            entry["peak_kb"] = max(entry.get("peak_kb", 0.0), peak_kb)
+            run["peak_kb"] = max(run.get("peak_kb", 0.0), peak_kb)
+        return False
+
+
+def phase(name):
+    """Context manager timing step ``name`` of the running instrumented operator."""
+    if not _enabled or not _stack:
+        return _NULL_PHASE
+    return _Phase(_stack[-1], name)
+
+
+def instrument(execute):
+    """Decorator for ``Operator.execute`` recording a run while enabled."""
+
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        if not _enabled:
+            return execute(self, context)
+
+        idname = getattr(type(self), "bl_idname", "") or type(self).__name__
+        memory = _trace_memory
+        started_tracing = memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if memory:
+            mem_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        run = {
+            "time": time.time(),
+            "phases": {},
+            "_open": [],
+            "_memory": memory,
+        }
+        _stack.append(run)
+        status = "ERROR"
+        start = time.perf_counter()
+        try:
+            result = execute(self, context)
+            status = (
+                "/".join(sorted(result)) if isinstance(result, set) else str(result)
+            )
+            return result
+        finally:
+            run["total_ms"] = (time.perf_counter() - start) * 1000.0
+            run["status"] = status
+            if memory:
+                peak_kb = (tracemalloc.get_traced_memory()[1] - mem_start) / 1024.0
+                run["peak_kb"] = max(run.get("peak_kb", 0.0), peak_kb)
+                if started_tracing:
+                    tracemalloc.stop()
+            _stack.pop()
+            del run["_open"], run["_memory"]
+            _record(idname, run)
+
+    return wrapper
+
+
+def _record(idname, run):
+    runs = history.get(idname)
+    if runs is None:
+        runs = history[idname] = deque(maxlen=HISTORY_SIZE)
+    runs.append(run)
+    total = totals.setdefault(idname, [0, 0.0])
+    total[0] += 1
+    total[1] += run["total_ms"]
+
+
+# -------------------------------------------------------------------------
+# Settings and export
+# -------------------------------------------------------------------------
+def is_enabled():
+    return _enabled
+
+
+def set_enabled(enabled, trace_memory=None):
+    global _enabled, _trace_memory
+
+    _enabled = bool(enabled)
+    if trace_memory is not None:
+        _trace_memory = bool(trace_memory)
+
+
+def update_settings(prefs, _context):
+    set_enabled(prefs.instrument_operators, prefs.trace_operator_memory)
+
+
+def clear():
+    history.clear()
+    totals.clear()
+
+
+def summary():
+    """Return {idname: {"calls", "avg_ms", "last"}} for the recorded operators."""
+    result = {}
+    for idname, runs in history.items():
+        calls, total_ms = totals.get(idname, (0, 0.0))
+        result[idname] = {
+            "calls": calls,
+            "avg_ms": total_ms / calls if calls else 0.0,
+            "last": runs[-1] if runs else None,
+        }
+    return result
+
+
+def export_json(path):
+    """Write the recorded history to ``path`` as JSON."""
+    import bpy
+
+    data = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "blender": bpy.app.version_string,
+            "history_size": HISTORY_SIZE,
+            "trace_memory": _trace_memory,
+        },
+        "operators": {
+            idname: {
+                "calls": totals.get(idname, (0, 0.0))[0],
+                "total_ms": totals.get(idname, (0, 0.0))[1],
+                "runs": list(runs),
+            }
+            for idname, runs in history.items()
+        },
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def register():
+    try:
+        from ..prefs import get_prefs
+
+        prefs = get_prefs()
+        set_enabled(prefs.instrument_operators, prefs.trace_operator_memory)
+    except Exception:
+        pass
+
+
+def unregister():
+    set_enabled(False)
+    _stack.clear()
@@ -0,0 +1,82 @@
+"""
+Registration timing and deferred startup work.
+
+``phase()`` times a block of the add-on registration; ``defer()`` moves
+non-essential work (icons, license checks) to a ``bpy.app.timers`` callback
+that runs once Blender has finished starting, and times it as well. The
+recorded phases are printed as one summary line, or one line per phase with
+debug logging enabled.
+"""
+
+import time
+from contextlib import contextmanager
+
+import bpy
+
+from .. import prefs
+
+# (phase name, milliseconds, deferred)
+timings = []
+
+# Deferred callbacks that have not run yet
+_deferred = []
+
+
+@contextmanager
+def phase(name, deferred=False):
+    """Time the enclosed block as registration phase ``name``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.append((name, (time.perf_counter() - start) * 1000.0, deferred))
+
+
+def defer(name, func, first_interval=0.0):
+    """Run ``func`` from a timer after startup, timed as phase ``name``."""
+
+    def run():
+        if run in _deferred:
+            _deferred.remove(run)
+        with phase(name, deferred=True):
+            try:
+                func()
+            except Exception as e:
+                print(f"❌ Sneaker Panel Pro: deferred {name} failed: {e}")
+        if not _deferred:
+            report(deferred_only=True)
+        return None
+
+    _deferred.append(run)
+    bpy.app.timers.register(run, first_interval=first_interval)
+
+
+def cancel_deferred():
+    """Drop deferred work that has not run yet (add-on disabled early)."""
+    for run in _deferred:
+        if bpy.app.timers.is_registered(run):
+            bpy.app.timers.unregister(run)
+    _deferred.clear()
+
+
+def total_ms(deferred=False):
+    return sum(ms for _name, ms, is_deferred in timings if is_deferred == deferred)
+
+
+def report(deferred_only=False):
+    """Print the recorded startup phases."""
+    if deferred_only:
+        label = f"deferred startup work took {total_ms(deferred=True):.1f} ms"
+    else:
+        label = f"registered in {total_ms():.1f} ms"
+    print(f"✅ Sneaker Panel Pro: {label}")
+
+    if prefs.debug_enabled():
+        for name, ms, is_deferred in timings:
+            if is_deferred == deferred_only:
+                print(f"  {name:<12} {ms:8.2f} ms")
+
+
+def reset():
+    timings.clear()
+    cancel_deferred()
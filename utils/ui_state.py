@@ -0,0 +1,179 @@
+"""
+Per-object UI state cache and panel draw timing.
+
+Panels read mesh-derived flags (smooth shading, UV violation groups) from
+this cache instead of scanning polygons or vertex groups in ``draw()``. An
+entry is filled with ``foreach_get`` on first use and dropped by a depsgraph
+handler when the object's geometry changes.
+
+``timed_draw`` wraps a panel ``draw()``; with the debug overlay enabled in
+the add-on preferences the measured draw time of every panel is shown at the
+bottom of the 3D View sidebar.
+"""
+
+import functools
+import time
+from collections import namedtuple
+
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+
+MeshUIState = namedtuple(
+    "MeshUIState", ("is_smooth", "has_uv_violations", "has_uv_violation_groups")
+)
+
+_EMPTY = MeshUIState(False, False, False)
+
+# object name -> ((mesh name, vertex group count), MeshUIState)
+_cache = {}
+
+# panel idname -> (last ms, smoothed ms)
+draw_times = {}
+_overlay_handle = None
+
+
+# -------------------------------------------------------------------------
+# State cache
+# -------------------------------------------------------------------------
+def _compute(obj):
+    mesh = obj.data
+    is_smooth = False
+    if mesh.polygons:
+        # Any smooth face makes the object count as smooth
+        smooth = np.empty(len(mesh.polygons), dtype=bool)
+        mesh.polygons.foreach_get("use_smooth", smooth)
+        is_smooth = bool(smooth.any())
+    names = [vg.name for vg in obj.vertex_groups]
+    return MeshUIState(
+        is_smooth,
+        "UV_Violations" in names,
+        any(name.startswith("UV_Violation_") for name in names),
+    )
+
+
+def mesh_state(obj):
+    """Return the cached ``MeshUIState`` of ``obj`` (empty for non-meshes)."""
+    if obj is None or obj.type != "MESH":
+        return _EMPTY
+    # Vertex groups added through the API do not tag the depsgraph
+    key = (obj.data.name, len(obj.vertex_groups))
+    entry = _cache.get(obj.name)
+    if entry is not None and entry[0] == key:
+        return entry[1]
+    state = _compute(obj)
+    _cache[obj.name] = (key, state)
+    return state
+
+
+def invalidate(obj=None):
+    """Drop the cached state of ``obj``, or of every object."""
+    if obj is None:
+        _cache.clear()
+    else:
+        _cache.pop(obj.name, None)
+
+
+@persistent
+def _on_depsgraph_update(_scene, depsgraph):
+    if not _cache:
+        return
+    for update in depsgraph.updates:
+        id_data = update.id
+        if isinstance(id_data, bpy.types.Object):
+            if update.is_updated_geometry:
+                _cache.pop(id_data.name, None)
+        elif isinstance(id_data, bpy.types.Mesh):
+            stale = [n for n, (key, _s) in _cache.items() if key[0] == id_data.name]
+            for name in stale:
+                del _cache[name]
+
+
+@persistent
+def _on_load_post(*_args):
+    _cache.clear()
+    draw_times.clear()
+
+
+# -------------------------------------------------------------------------
+# Draw timing overlay
+# -------------------------------------------------------------------------
+def timed_draw(draw):
+    """Decorator for ``Panel.draw`` recording its time while the overlay is on."""
+
+    @functools.wraps(draw)
+    def wrapper(self, context):
+        if _overlay_handle is None:
+            return draw(self, context)
+        start = time.perf_counter()
+        try:
+            return draw(self, context)
+        finally:
+            ms = (time.perf_counter() - start) * 1000.0
+            name = getattr(self, "bl_idname", "") or type(self).__name__
+            previous = draw_times.get(name, (ms, ms))[1]
+            draw_times[name] = (ms, previous * 0.9 + ms * 0.1)
+
+    return wrapper
+
+
+def _draw_overlay():
+    import blf
+
+    if not draw_times:
+        return
+    font_id = 0
+    size = 11 * bpy.context.preferences.system.ui_scale
+    blf.size(font_id, size)
+    blf.color(font_id, 1.0, 0.85, 0.3, 1.0)
+    x = 10
+    y = 10 + size * 1.4 * len(draw_times)
+    blf.position(font_id, x, y, 0)
+    blf.draw(font_id, "SPP panel draw (last / avg ms)")
+    for name, (last, avg) in sorted(draw_times.items()):
+        y -= size * 1.4
+        blf.position(font_id, x, y, 0)
+        blf.draw(font_id, f"{name}: {last:.2f} / {avg:.2f}")
+
+
+def set_overlay(enabled):
+    """Show or hide the draw-time overlay in the 3D View sidebar."""
+    global _overlay_handle
+
+    if enabled and _overlay_handle is None:
+        _overlay_handle = bpy.types.SpaceView3D.draw_handler_add(
+            _draw_overlay, (), "UI", "POST_PIXEL"
+        )
+    elif not enabled and _overlay_handle is not None:
+        bpy.types.SpaceView3D.draw_handler_remove(_overlay_handle, "UI")
+        _overlay_handle = None
+        draw_times.clear()
+
+
+def update_overlay(prefs, _context):
+    set_overlay(prefs.show_draw_timings)
+
+
+# -------------------------------------------------------------------------
+# Registration
+# -------------------------------------------------------------------------
+def register():
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+    try:
+        from ..prefs import get_prefs
+
+        set_overlay(get_prefs().show_draw_timings)
+    except Exception:
+        pass
+
+
+def unregister():
+    set_overlay(False)
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    _cache.clear()
@@ -0,0 +1,67 @@
+"""
+Undo policy: one undo step per user-facing action.
+
+Blender stores one undo step when an operator with ``UNDO`` in its
+``bl_options`` finishes, and the operators it runs through ``bpy.ops`` store
+none of their own, so a whole pipeline (convert, fill, conform, modifiers)
+already undoes as one step. An explicit ``bpy.ops.ed.undo_push`` always
+stores a step: at the top of ``execute`` it doubles the steps of every click
+and leaves a stray one when the operator then cancels. Outside edit mode
+every step is a global step, written from the whole file.
+
+The add-on's operators follow two rules:
+
+- Operators that change data declare ``UNDO`` and never push steps
+  themselves.
+- Interface operators (workflow toggles, license and profiling tools) are
+  marked with ``interface`` and leave ``UNDO`` out, so they store nothing.
+
+``audit()`` checks the operator classes against these rules at registration.
+"""
+
+import bpy
+
+_UNDO_OPTIONS = {"UNDO", "UNDO_GROUPED"}
+
+
+def interface(cls):
+    """Class decorator for operators that change no undoable data."""
+    cls._spp_interface = True
+    return cls
+
+
+def check(cls):
+    """Return why operator class ``cls`` breaks the undo policy, or None."""
+    undo = bool(set(getattr(cls, "bl_options", ())) & _UNDO_OPTIONS)
+    if getattr(cls, "_spp_interface", False):
+        return "interface operator stores undo steps" if undo else None
+    return None if undo else "changes data without an undo step"
+
+
+def _subclasses(cls):
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from _subclasses(sub)
+
+
+def audit(package):
+    """Check the operators defined in ``package``.
+
+    Returns:
+        list: (bl_idname, problem) for every operator breaking the policy
+    """
+    prefix = package + "."
+    problems = []
+    for cls in _subclasses(bpy.types.Operator):
+        if not cls.__module__.startswith(prefix):
+            continue
+        problem = check(cls)
+        if problem:
+            problems.append((getattr(cls, "bl_idname", cls.__name__), problem))
+    return problems
+
+
+def register():
+    package = __package__.rpartition(".")[0]
+    for idname, problem in audit(package):
+        print(f"⚠ Sneaker Panel Pro: {idname}: {problem}")
@@ -0,0 +1,126 @@
+"""
+Shell to UV reference mesh links.
+
+UV to Mesh creates a flat reference mesh for a shell; the operators that map
+panels between the shell and its UV layout need that mesh back. The pair is
+linked through pointer properties (``spp_uv_reference`` on the shell and
+``spp_uv_source`` on the UV mesh), so the lookup survives renames and does
+not scan the scene. The ``spp_original_3d_mesh_name`` custom property is
+still written for older files and is only used by the repair scan when a
+link is missing or broken.
+"""
+
+import bpy
+from bpy.app.handlers import persistent
+
+# Custom property written by UV to Mesh before links existed
+NAME_KEY = "spp_original_3d_mesh_name"
+
+
+def _is_mesh(_self, obj):
+    return obj.type == "MESH"
+
+
+def _is_valid_pair(shell, uv_mesh):
+    return (
+        uv_mesh is not None
+        and uv_mesh.type == "MESH"
+        and uv_mesh is not shell
+        and uv_mesh.name in bpy.data.objects
+    )
+
+
+def link(shell, uv_mesh):
+    """Record ``uv_mesh`` as the UV reference mesh of ``shell``."""
+    shell.spp_uv_reference = uv_mesh
+    uv_mesh.spp_uv_source = shell
+    uv_mesh[NAME_KEY] = shell.name
+
+
+def _scan(shell, scene):
+    """Repair fallback: find the UV mesh through the legacy name property."""
+    objects = scene.objects if scene is not None else bpy.data.objects
+    for obj in objects:
+        if obj is shell or obj.type != "MESH":
+            continue
+        if obj.spp_uv_source == shell or (
+            obj.spp_uv_source is None and obj.get(NAME_KEY) == shell.name
+        ):
+            return obj
+    return None
+
+
+def find_uv_reference_mesh(shell, scene=None):
+    """Return the UV reference mesh linked to ``shell``, or None.
+
+    Args:
+        shell: Shell object the UV mesh was created from
+        scene: Scene to search when the link has to be repaired; all objects
+            in the file when None
+
+    Returns:
+        The UV reference mesh. A mesh found by the repair scan is linked so
+        the next lookup goes through the pointer.
+    """
+    if shell is None:
+        return None
+    uv_mesh = shell.spp_uv_reference
+    if _is_valid_pair(shell, uv_mesh) and uv_mesh.spp_uv_source in {None, shell}:
+        if scene is None or uv_mesh.name in scene.objects:
+            return uv_mesh
+
+    uv_mesh = _scan(shell, scene)
+    if uv_mesh is not None:
+        link(shell, uv_mesh)
+    return uv_mesh
+
+
+def validate():
+    """Drop links to deleted or mismatched objects and migrate legacy files."""
+    objects = bpy.data.objects
+    for obj in objects:
+        if obj.type != "MESH" or obj.library is not None:
+            continue
+        target = obj.spp_uv_reference
+        if target is not None and (
+            not _is_valid_pair(obj, target) or target.spp_uv_source not in {None, obj}
+        ):
+            obj.spp_uv_reference = None
+        source = obj.spp_uv_source
+        if source is None:
+            shell = objects.get(obj.get(NAME_KEY, ""))
+            if shell is not None and shell is not obj and shell.type == "MESH":
+                if shell.spp_uv_reference is None and shell.library is None:
+                    link(shell, obj)
+        elif source.spp_uv_reference is None and source.library is None:
+            source.spp_uv_reference = obj
+
+
+@persistent
+def _on_load_post(*_args):
+    validate()
+
+
+def register():
+    bpy.types.Object.spp_uv_reference = bpy.props.PointerProperty(
+        name="UV Reference Mesh",
+        description="Flattened UV mesh created from this shell",
+        type=bpy.types.Object,
+        poll=_is_mesh,
+    )
+    bpy.types.Object.spp_uv_source = bpy.props.PointerProperty(
+        name="UV Source Shell",
+        description="Shell this UV reference mesh was created from",
+        type=bpy.types.Object,
+        poll=_is_mesh,
+    )
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
+
+def unregister():
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    for prop in ("spp_uv_reference", "spp_uv_source"):
+        if hasattr(bpy.types.Object, prop):
+            delattr(bpy.types.Object, prop)